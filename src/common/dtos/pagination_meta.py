@@ -1,10 +1,19 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 # Pagination 메타데이터 DTO
 class PaginationMeta(BaseModel):
-    total_count: int = Field(..., description="전체 항목의 개수")
+    total_count: Optional[int] = Field(
+        None, description="전체 항목의 개수 (커서 모드에서는 집계하지 않아 null)"
+    )
     skip: int = Field(..., description="현재 건너뛴 항목 수 (Offset)")
     limit: int = Field(..., description="페이지당 최대 항목 수 (Limit)")
     is_last_page: bool = Field(..., description="마지막 페이지 여부")
-    total_pages: int = Field(..., description="전체 페이지 수")
\ No newline at end of file
+    total_pages: Optional[int] = Field(
+        None, description="전체 페이지 수 (커서 모드에서는 집계하지 않아 null)"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 조회용 불투명 커서 (마지막 페이지면 null)"
+    )
@@ -0,0 +1,84 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from common.dtos.pagination_meta import PaginationMeta
+
+# *_with_count.sql 에서 COUNT(*) OVER()로 함께 내려주는 전체 개수 컬럼명
+FULL_COUNT_COLUMN = "full_count"
+
+
+def encode_cursor(last_id: Any) -> str:
+    """마지막으로 본 행의 ID를 클라이언트에 넘길 불투명 커서 문자열로 인코딩합니다."""
+    payload = json.dumps({"last_id": last_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, id_type: type = int) -> Any:
+    """
+    커서에서 마지막으로 본 행의 ID를 꺼냅니다.
+    ID가 테이블 키 타입(id_type)이 아니면 DB 형 변환 오류(500) 대신 400으로 거절합니다.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        last_id = payload["last_id"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 페이지 커서입니다.")
+    # bool은 int의 하위 타입이므로 따로 거름
+    if not isinstance(last_id, id_type) or isinstance(last_id, bool):
+        raise HTTPException(status_code=400, detail="유효하지 않은 페이지 커서입니다.")
+    return last_id
+
+
+def split_full_count(
+    rows: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    윈도우 집계로 붙어온 전체 개수 컬럼을 각 행에서 떼어내고 전체 개수를 함께 반환합니다.
+    빈 페이지라면 전체 개수를 알 수 없으므로 None을 반환합니다.
+    """
+    total_count = None
+    for row in rows:
+        total_count = row.pop(FULL_COUNT_COLUMN, total_count)
+    return rows, total_count
+
+
+def build_pagination_meta(
+    total_count: int, skip: int, limit: int, last_id: Any = None
+) -> PaginationMeta:
+    # 페이지네이션 메타데이터 계산
+    total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
+    is_last_page = (skip + limit) >= total_count
+
+    return PaginationMeta(
+        total_count=total_count,
+        skip=skip,
+        limit=limit,
+        is_last_page=is_last_page,
+        total_pages=total_pages,
+        # 오프셋 모드에서도 다음 페이지부터 커서 모드로 이어갈 수 있도록 커서를 함께 내려줍니다.
+        next_cursor=(
+            encode_cursor(last_id) if not is_last_page and last_id is not None else None
+        ),
+    )
+
+
+def build_cursor_page(
+    rows: List[Dict[str, Any]], limit: int, id_key: str
+) -> Tuple[List[Dict[str, Any]], PaginationMeta]:
+    """
+    커서 모드 결과(limit + 1행 조회)를 한 페이지로 자르고 다음 커서를 계산합니다.
+    한 행을 더 읽어 다음 페이지 존재 여부를 판단하므로 전체 개수 집계가 필요 없습니다.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return rows, PaginationMeta(
+        skip=0,
+        limit=limit,
+        is_last_page=not has_more,
+        next_cursor=encode_cursor(rows[-1][id_key]) if has_more else None,
+    )
@@ -1,16 +1,24 @@
+import asyncio
 import sys
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
 
-import psycopg2
+import psycopg
 from fastapi import HTTPException
-from psycopg2 import extras, pool
+from fastapi.exceptions import RequestValidationError
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 from sshtunnel import SSHTunnelForwarder
 
 from src.configs.setting import (
     DB_HOST,
     DB_NAME,
     DB_PASSWORD,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_POOL_TIMEOUT,
     DB_PORT,
+    DB_PREPARE_THRESHOLD,
     DB_USER,
     SSH_ENABLED,
     SSH_HOST,
@@ -18,6 +26,7 @@ from src.configs.setting import (
     SSH_USER,
 )
 from src.utils.logger import logger
+from utils.timing import timed
 
 # RDB SSH 터널 정의
 rdb_tunnel = None
@@ -36,59 +45,192 @@ if SSH_ENABLED:
     logger.info(f"🚀 PostgreSQL용 SSH 터널 활성화 (Port: {actual_db_port})")
 
 # 커넥션 풀 설정
-try:
-    connection_pool = pool.ThreadedConnectionPool(
-        minconn=1,
-        maxconn=20,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        host=DB_HOST,
-        port=actual_db_port,
-        database=DB_NAME,
-    )
-    logger.info("✅ 데이터베이스 커넥션 풀이 성공적으로 생성되었습니다.")
-except Exception as e:
-    logger.error(
-        f"❌ 데이터베이스 커넥션 풀 생성 중 치명적인 오류 발생: {e}", exc_info=True
-    )
-    sys.exit(1)  # 커넥션 풀 생성 실패 시 애플리케이션 즉시 종료
+# - 이벤트 루프를 막지 않도록 psycopg3 비동기 풀을 사용합니다.
+# - 풀은 lifespan(open_db_pool)에서 열리며, import 시점에는 연결하지 않습니다.
+# - AsyncClientCursor: psycopg2와 동일한 클라이언트 측 파라미터 바인딩을 사용하므로
+#   기존 queries/*.sql 파일(%(name)s 플레이스홀더)을 그대로 재사용할 수 있습니다.
+# - autocommit: 커넥션을 쿼리 단위로 빌려주고 바로 반납하므로(LazyCursor)
+#   반납 시점에 열린 트랜잭션이 남지 않도록 문장 단위로 커밋합니다.
+# - DB_PREPARE_THRESHOLD 설정 시: 서버 측 바인딩 커서(AsyncCursor)로 전환하고,
+#   레지스트리(utils/load_sql)의 동일 쿼리가 임계 횟수만큼 실행되면 커넥션별 prepared statement로 등록합니다.
+if DB_PREPARE_THRESHOLD is None:
+    connection_kwargs = {"cursor_factory": psycopg.AsyncClientCursor}
+else:
+    connection_kwargs = {
+        "cursor_factory": psycopg.AsyncCursor,
+        "prepare_threshold": DB_PREPARE_THRESHOLD,
+    }
+
+conninfo = make_conninfo(
+    user=DB_USER,
+    password=DB_PASSWORD,
+    host=DB_HOST,
+    port=actual_db_port,
+    dbname=DB_NAME,
+)
+
+connection_pool = AsyncConnectionPool(
+    conninfo=conninfo,
+    min_size=DB_POOL_MIN_SIZE,
+    max_size=DB_POOL_MAX_SIZE,
+    timeout=DB_POOL_TIMEOUT,
+    kwargs={"autocommit": True, "row_factory": dict_row, **connection_kwargs},
+    open=False,
+)
+
+
+async def open_db_pool():
+    try:
+        await connection_pool.open(wait=True, timeout=DB_POOL_TIMEOUT)
+        logger.info("✅ 데이터베이스 커넥션 풀이 성공적으로 생성되었습니다.")
+    except Exception as e:
+        logger.error(
+            f"❌ 데이터베이스 커넥션 풀 생성 중 치명적인 오류 발생: {e}", exc_info=True
+        )
+        sys.exit(1)  # 커넥션 풀 생성 실패 시 애플리케이션 즉시 종료
+
+
+async def close_db_pool():
+    await connection_pool.close()
+    logger.info("🛑 데이터베이스 커넥션 풀이 닫혔습니다.")
+
+
+class LazyCursor:
+    """
+    첫 execute 시점에만 풀에서 커넥션을 빌려오는 지연 커서입니다.
+
+    - 결과 집합을 fetchone/fetchall로 읽었거나, 결과 집합이 없는 문장(description is None)을
+      실행하면 즉시 커넥션을 풀에 반납합니다.
+    - 따라서 LLM 호출이나 외부 프록시 대기 중에는 커넥션을 점유하지 않으며,
+      DB를 전혀 사용하지 않는 요청은 커넥션을 빌리지도 않습니다.
+    - 여러 문장을 하나의 트랜잭션으로 묶어야 할 때는 transaction()을 사용합니다.
+    - 랭그래프 병렬 노드처럼 여러 태스크가 같은 커서를 공유해도 execute~fetch 구간이
+      섞이지 않도록, 커넥션을 빌린 태스크가 반납할 때까지 다른 태스크는 대기합니다.
+    """
+
+    def __init__(self, pool: AsyncConnectionPool = connection_pool):
+        self._pool = pool
+        self._conn = None
+        self._cursor = None
+        self._in_transaction = False
+        self._lock = asyncio.Lock()
+        self._owner = None
+
+    @property
+    def connection(self):
+        return self._conn
+
+    @property
+    def description(self):
+        return self._cursor.description if self._cursor else None
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount if self._cursor else -1
+
+    async def _acquire(self):
+        current_task = asyncio.current_task()
+        if self._conn is not None and self._owner is current_task:
+            return
+        await self._lock.acquire()
+        try:
+            # 터널이 살아있는지 먼저 확인 (디버깅용)
+            if SSH_ENABLED and (not rdb_tunnel or not rdb_tunnel.is_active):
+                raise ConnectionError("RDB SSH 터널이 활성화되어 있지 않습니다.")
+            self._conn = await self._pool.getconn()
+        except BaseException:
+            self._lock.release()
+            raise
+        self._cursor = self._conn.cursor()
+        self._owner = current_task
+
+    async def release(self):
+        """커서를 닫고 커넥션을 풀에 반납합니다. 트랜잭션 블록 안에서는 보류합니다."""
+        if self._conn is None or self._in_transaction:
+            return
+        conn, cursor = self._conn, self._cursor
+        self._conn = self._cursor = self._owner = None
+        try:
+            await cursor.close()
+        finally:
+            try:
+                await self._pool.putconn(conn)
+            finally:
+                self._lock.release()
+
+    async def execute(self, query, params=None):
+        await self._acquire()
+        try:
+            with timed("db"):
+                await self._cursor.execute(query, params)
+        except BaseException:
+            await self.release()
+            raise
+        if self._cursor.description is None:
+            await self.release()
+        return self
+
+    async def fetchone(self):
+        if self._cursor is None:
+            return None
+        try:
+            return await self._cursor.fetchone()
+        finally:
+            await self.release()
+
+    async def fetchall(self):
+        if self._cursor is None:
+            return []
+        try:
+            return await self._cursor.fetchall()
+        finally:
+            await self.release()
+
+    async def commit(self):
+        """autocommit 커넥션이므로 문장 실행 시점에 이미 커밋되어 있습니다. 남은 커넥션만 반납합니다."""
+        await self.release()
+
+    async def rollback(self):
+        await self.release()
+
+    @asynccontextmanager
+    async def transaction(self):
+        """블록 안의 문장을 하나의 트랜잭션으로 실행하고, 블록이 끝나면 커넥션을 반납합니다."""
+        await self._acquire()
+        self._in_transaction = True
+        try:
+            async with self._conn.transaction():
+                yield self
+        finally:
+            self._in_transaction = False
+            await self.release()
+
+    async def close(self):
+        self._in_transaction = False
+        await self.release()
 
 
 # DB 연결 관리 Context Manager
-def get_db_cursor():
+async def get_db_cursor():
     """
-    커넥션 풀에서 커넥션을 빌려오고,
-    결과를 딕셔너리 형태로 반환하는 커서(DictCursor)를 제공합니다.
+    요청 단위의 지연 커서(LazyCursor)를 제공합니다.
+    커넥션은 실제 쿼리 실행 시점에만 풀에서 빌려오며, 결과를 읽는 즉시 반납합니다.
     """
-    conn = None  # conn을 None으로 초기화합니다.
+    cursor = LazyCursor()
     try:
-        # 터널이 살아있는지 먼저 확인 (디버깅용)
-        if SSH_ENABLED and (not rdb_tunnel or not rdb_tunnel.is_active):
-            raise ConnectionError("RDB SSH 터널이 활성화되어 있지 않습니다.")
-
-        conn = connection_pool.getconn()
-        cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
         yield cursor
-        conn.commit()
-    except HTTPException:
-        # FastAPI의 HTTPException은 그대로 다시 던집니다 (404 등을 유지하기 위해)
+    except (HTTPException, RequestValidationError):
+        # FastAPI의 HTTPException·요청 검증 오류는 그대로 다시 던집니다 (404, 422 등을 유지하기 위해)
         raise
-    except psycopg2.OperationalError as e:
-        if conn:
-            conn.rollback()
+    except psycopg.OperationalError as e:
         logger.error(f"❌ 데이터베이스 연결 또는 운영 오류 발생: {e}", exc_info=True)
         raise ConnectionError(
             "데이터베이스 연결 또는 운영 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
         ) from e
-    except psycopg2.Error as e:
-        if conn:
-            conn.rollback()
+    except psycopg.Error as e:
         logger.error(f"❌ 데이터베이스 쿼리 실행 중 오류 발생: {e}", exc_info=True)
         raise RuntimeError("데이터베이스 쿼리 실행 중 오류가 발생했습니다.") from e
     except Exception as e:
-        if conn:
-            conn.rollback()
-
         # 만약 e가 이미 HTTPException이라면 로깅하지 않고 그대로 던짐
         if isinstance(e, HTTPException):
             raise e
@@ -100,21 +242,17 @@ def get_db_cursor():
             "데이터베이스 사용 중 예상치 못한 오류가 발생했습니다."
         ) from e
     finally:
-        if conn:
-            connection_pool.putconn(conn)
+        await cursor.close()
 
 
-db_cursor_context = contextmanager(get_db_cursor)
+db_cursor_context = asynccontextmanager(get_db_cursor)
 
 
 # 연결 테스트
-def check_db_connection():
+async def check_db_connection():
     try:
-        with db_cursor_context() as cursor:
-            cursor.execute("SELECT 1")
+        async with db_cursor_context() as cursor:
+            await cursor.execute("SELECT 1")
             logger.info("✅ 데이터베이스 연결 상태 확인 완료")
     except Exception as e:
         logger.error(f"❌ 데이터베이스 연결 확인 실패: {e}", exc_info=True)
-
-
-check_db_connection()
@@ -37,6 +37,8 @@ def init_exception_handlers(app: FastAPI):
                 "message": "요청 처리 중 오류가 발생했습니다.",
                 "detail": exc.detail,
             },
+            # 503 과부하 응답의 Retry-After 등 예외에 지정된 헤더를 그대로 전달
+            headers=exc.headers,
         )
 
     @app.exception_handler(RequestValidationError)
@@ -1,19 +1,29 @@
 import asyncio
+import hashlib
 import json
-from typing import Any, List, Optional
+import time
+from contextlib import aclosing
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional
 
 import httpx
-from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import (
     AIMessage,
+    AIMessageChunk,
     BaseMessage,
     ChatMessage,
+    HumanMessage,
     SystemMessage,
 )
-from langchain_core.outputs import ChatGeneration, ChatResult
-from langchain_core.runnables import RunnableLambda
-from pydantic import Field
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import Field, PrivateAttr
 
 from configs.llm import (
     ChatCompletionRequest,
@@ -22,7 +32,100 @@ from configs.llm import (
 from configs.llm import (
     ChatMessage as SchemaChatMessage,
 )
-from configs.setting import LLM_GATEWAY_URL
+from configs.llm_resilience import EndpointHealth, endpoint_health
+from configs.llm_scheduler import llm_scheduler
+from configs.setting import LLM_GATEWAY_URL, LLM_HEDGE_ENABLED
+from utils.partial_json import closed_string_field, partial_string_field
+from utils.served_locally import mark_served_locally
+from utils.single_flight import SingleFlight
+from utils.timing import timed
+
+# 프로세스 전역 LLM 요청 합치기(single-flight). 지표는 /metrics에서 조회합니다.
+llm_single_flight = SingleFlight()
+
+
+@lru_cache(maxsize=None)
+def _schema_instruction(schema) -> str:
+    """스키마의 JSON Schema를 system 메시지 지시문으로 한 번만 직렬화합니다."""
+    schema_str = ""
+    if hasattr(schema, "model_json_schema"):
+        schema_str = json.dumps(
+            schema.model_json_schema(), indent=2, ensure_ascii=False
+        )
+    return (
+        "\n\nYour response MUST be a single JSON object "
+        f"matching this schema:\n```json\n{schema_str}\n```\n"
+        "Do not include any explanation or markdown outside the JSON."
+    )
+
+
+def structured_output_key(schema, **options) -> Optional[Hashable]:
+    """with_structured_output 메모 키. 옵션 값 중 해시할 수 없는 것이 있으면 None(메모하지 않음)."""
+    key = (schema, frozenset(options.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _input_messages(input_data: Any) -> List[BaseMessage]:
+    """Runnable 입력(PromptValue, {"messages": ...}, 메시지 리스트, 단일 입력)을 메시지 리스트로 맞춥니다."""
+    if hasattr(input_data, "to_messages"):
+        # ChatPromptValue 등 PromptValue 객체인 경우
+        return input_data.to_messages()
+    if isinstance(input_data, dict) and "messages" in input_data:
+        return list(input_data["messages"])
+    if isinstance(input_data, list):
+        return list(input_data)
+    if isinstance(input_data, str):
+        return [HumanMessage(content=input_data)]
+    return [input_data]
+
+
+def _with_schema_instruction(
+    messages: List[BaseMessage], schema_instruction: str
+) -> List[BaseMessage]:
+    """첫 시스템 메시지 뒤에 스키마 지시문을 붙이고, 시스템 메시지가 없으면 맨 앞에 추가합니다."""
+    modified_messages = list(messages)
+    for i, m in enumerate(modified_messages):
+        if isinstance(m, SystemMessage):
+            modified_messages[i] = SystemMessage(
+                content=str(m.content) + schema_instruction
+            )
+            return modified_messages
+    modified_messages.insert(0, SystemMessage(content=schema_instruction))
+    return modified_messages
+
+
+def _request_key(base_url: str, request_body: ChatCompletionRequest) -> str:
+    body = json.dumps(
+        request_body.model_dump(exclude_none=True), sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(f"{base_url}\0{body}".encode("utf-8")).hexdigest()
+
+
+def _is_gateway_failure(error: Exception) -> bool:
+    """회로 차단기에 실패로 기록할 오류인지 판단합니다. 4xx는 요청 문제이므로 제외합니다."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return True
+
+
+def _stream_chunk(payload: Dict[str, Any]) -> Optional[ChatGenerationChunk]:
+    """스트리밍 응답 한 건(choices[0].delta)을 ChatGenerationChunk로 변환합니다. 내용이 없으면 None."""
+    choices = payload.get("choices") or []
+    if not choices:
+        return None
+    choice = choices[0]
+    content = (choice.get("delta") or {}).get("content") or ""
+    finish_reason = choice.get("finish_reason")
+    if not content and not finish_reason:
+        return None
+    return ChatGenerationChunk(
+        message=AIMessageChunk(content=content),
+        generation_info={"finish_reason": finish_reason} if finish_reason else None,
+    )
 
 
 class NarrativeChatModel(BaseChatModel):
@@ -30,18 +133,26 @@ class NarrativeChatModel(BaseChatModel):
     Custom LangChain ChatModel adapter for the LLM Gateway Narrative endpoint.
     """
 
-    base_url: str = Field(
-        default_factory=lambda: LLM_GATEWAY_URL
-    )
+    base_url: str = Field(default_factory=lambda: LLM_GATEWAY_URL)
     client: httpx.AsyncClient
     temperature: float = 0.7
     llm_retry_attempts: int = 3
     llm_retry_base_delay: float = 0.8
+    _structured_runnables: Dict[Any, Runnable] = PrivateAttr(default_factory=dict)
 
     @property
     def _llm_type(self) -> str:
         return "gm_llm_gateway_narrative"
 
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        # LangChain 응답 캐시 키(llm_string)에 게이트웨이·모델·temperature가 포함되도록 함
+        return {
+            "base_url": self.base_url,
+            "model": "gpt-4o",
+            "temperature": self.temperature,
+        }
+
     def _convert_message_to_schema(self, message: BaseMessage) -> SchemaChatMessage:
         """Converts LangChain message to our Pydantic schema."""
         role = "user"
@@ -54,6 +165,20 @@ class NarrativeChatModel(BaseChatModel):
 
         return SchemaChatMessage(role=role, content=str(message.content))
 
+    def _build_request(
+        self, messages: List[BaseMessage], stream: bool = False, **kwargs: Any
+    ) -> ChatCompletionRequest:
+        return ChatCompletionRequest(
+            model="gpt-4o",
+            messages=[self._convert_message_to_schema(m) for m in messages],
+            temperature=kwargs.get("temperature", self.temperature),
+            max_tokens=kwargs.get("max_tokens"),
+            stream=stream,
+            response_format=kwargs.get("response_format"),
+            tools=kwargs.get("tools"),
+            tool_choice=kwargs.get("tool_choice"),
+        )
+
     def _generate(
         self,
         messages: List[BaseMessage],
@@ -78,37 +203,116 @@ class NarrativeChatModel(BaseChatModel):
         run_manager: Optional[CallbackManagerForLLMRun] = None,
         **kwargs: Any,
     ) -> ChatResult:
-        schema_messages = [self._convert_message_to_schema(m) for m in messages]
+        request_body = self._build_request(messages, **kwargs)
+        # temperature > 0 샘플링은 호출마다 다른 결과가 나와야 하므로 합치지 않음
+        if request_body.temperature != 0:
+            with timed("llm"):
+                return await self._agenerate_scheduled(request_body)
+        # 메시지·response_format 등 요청 본문이 같은 동시 호출은 업스트림 요청 하나를 공유
+        key = _request_key(self.base_url, request_body)
+        led = False
+
+        def _lead():
+            nonlocal led
+            led = True
+            return self._agenerate_scheduled(request_body)
+
+        with timed("llm"):
+            shared = await llm_single_flight.run(key, _lead)
+        if not led:
+            mark_served_locally("coalesced")
+        # 공유된 결과를 LangChain 콜백이 호출별로 수정하므로 복사본을 반환
+        return shared.model_copy(deep=True)
+
+    async def _agenerate_scheduled(
+        self, request_body: ChatCompletionRequest
+    ) -> ChatResult:
+        # 합쳐진 호출은 leader만 슬롯을 사용
+        async with llm_scheduler.slot():
+            return await self._agenerate_once(request_body)
 
-        request_body = ChatCompletionRequest(
-            model="gpt-4o",
-            messages=schema_messages,
-            temperature=kwargs.get("temperature", self.temperature),
-            max_tokens=kwargs.get("max_tokens"),
-            response_format=kwargs.get("response_format"),
-            tools=kwargs.get("tools"),
-            tool_choice=kwargs.get("tool_choice"),
+    async def _post_completion(self, payload: Dict[str, Any]) -> httpx.Response:
+        response = await self.client.post(
+            f"{self.base_url}/api/v1/chat/completions", json=payload
         )
+        if response.status_code >= 500:
+            raise httpx.HTTPStatusError(
+                f"llm gateway {response.status_code}",
+                request=response.request,
+                response=response,
+            )
+        response.raise_for_status()
+        return response
+
+    async def _post_hedge(self, payload: Dict[str, Any]) -> httpx.Response:
+        """try_acquire로 잡은 스케줄러 슬롯을 헤지 요청이 끝나면 돌려놓습니다."""
+        try:
+            return await self._post_completion(payload)
+        finally:
+            llm_scheduler.release()
+
+    async def _post_hedged(
+        self, health: EndpointHealth, payload: Dict[str, Any]
+    ) -> httpx.Response:
+        """
+        헤지가 켜져 있으면 첫 요청이 최근 p95 응답 시간 안에 끝나지 않을 때 같은 요청을 한 번 더 보내고,
+        먼저 성공한 응답을 사용합니다. 남은 요청은 취소합니다.
+        헤지 요청은 스케줄러 슬롯을 따로 하나 잡으며, 빈 슬롯이 없거나 대기 중인 요청이 있으면 보내지 않습니다.
+        """
+        delay = health.hedge_delay() if LLM_HEDGE_ENABLED else None
+        if delay is None:
+            return await self._post_completion(payload)
+
+        tasks = [asyncio.ensure_future(self._post_completion(payload))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and llm_scheduler.try_acquire():
+                health.hedges += 1
+                tasks.append(asyncio.ensure_future(self._post_hedge(payload)))
+
+            pending = set(tasks)
+            failure: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            health.hedge_wins += 1
+                        return task.result()
+                    failure = task.exception()
+            raise failure
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _agenerate_once(self, request_body: ChatCompletionRequest) -> ChatResult:
+        health = endpoint_health(self.base_url)
+        payload = request_body.model_dump(exclude_none=True)
 
         response: httpx.Response | None = None
         last_error: Exception | None = None
         for attempt in range(1, self.llm_retry_attempts + 1):
+            # 회로가 열려 있으면 요청을 보내지 않고 LLMUnavailableError(503)로 바로 실패
+            health.before_call()
+            started = time.perf_counter()
             try:
-                response = await self.client.post(
-                    f"{self.base_url}/api/v1/chat/completions",
-                    json=request_body.model_dump(exclude_none=True),
-                )
-                if response.status_code >= 500:
-                    raise httpx.HTTPStatusError(
-                        f"llm gateway {response.status_code}",
-                        request=response.request,
-                        response=response,
-                    )
-                response.raise_for_status()
+                response = await self._post_hedged(health, payload)
+                health.record_success(time.perf_counter() - started)
                 break
+            except asyncio.CancelledError:
+                health.abandon()
+                raise
             except (httpx.RequestError, httpx.HTTPStatusError) as e:
                 last_error = e
-                if attempt >= self.llm_retry_attempts:
+                if _is_gateway_failure(e):
+                    health.record_failure()
+                else:
+                    health.abandon()
+                # 회로가 열리면 남은 재시도 대기 없이 바로 실패
+                if attempt >= self.llm_retry_attempts or health.is_open:
                     raise
                 await asyncio.sleep(self.llm_retry_base_delay * (2 ** (attempt - 1)))
 
@@ -135,7 +339,7 @@ class NarrativeChatModel(BaseChatModel):
 
         # structured output 처리
         parsed_content = None
-        response_format = kwargs.get("response_format")
+        response_format = request_body.response_format
 
         if response_format and isinstance(raw_content, str):
             fmt_type = response_format.get("type")
@@ -165,60 +369,131 @@ class NarrativeChatModel(BaseChatModel):
 
         return ChatResult(generations=[generation])
 
-    def with_structured_output(self, schema, *, method: str = "json_schema", **kwargs):
-        async def _call(input_data: Any) -> Any:
-            # 1. 입력 데이터 타입별 메시지 추출 (PromptValue 대응 추가)
-            if hasattr(input_data, "to_messages"):
-                # ChatPromptValue 등 PromptValue 객체인 경우
-                messages = input_data.to_messages()
-            elif isinstance(input_data, dict) and "messages" in input_data:
-                messages = input_data["messages"]
-            elif isinstance(input_data, list):
-                messages = input_data
-            else:
-                messages = (
-                    [input_data] if not isinstance(input_data, list) else input_data
-                )
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """
+        게이트웨이의 스트리밍 chat-completions(SSE, "data: {...}" / "data: [DONE]")를 읽어
+        델타마다 AIMessageChunk를 내보냅니다.
+        첫 청크를 내보내기 전의 연결 오류·5xx만 재시도하고, 그 이후 오류는 그대로 전파합니다.
+        """
+        request_body = self._build_request(messages, stream=True, **kwargs)
+        health = endpoint_health(self.base_url)
+        emitted = False
+        # 스트림이 끝날 때까지 게이트웨이 슬롯 하나를 점유
+        async with llm_scheduler.slot():
+            with timed("llm"):
+                for attempt in range(1, self.llm_retry_attempts + 1):
+                    health.before_call()
+                    try:
+                        async with self.client.stream(
+                            "POST",
+                            f"{self.base_url}/api/v1/chat/completions",
+                            json=request_body.model_dump(exclude_none=True),
+                        ) as response:
+                            if response.status_code >= 500:
+                                raise httpx.HTTPStatusError(
+                                    f"llm gateway {response.status_code}",
+                                    request=response.request,
+                                    response=response,
+                                )
+                            response.raise_for_status()
+                            # 응답 헤더까지의 시간은 전체 응답 시간보다 짧아 헤지 p95를 끌어내리므로 기록하지 않음
+                            health.record_success()
+                            async for line in response.aiter_lines():
+                                if not line.startswith("data:"):
+                                    continue
+                                data = line[len("data:") :].strip()
+                                if data == "[DONE]":
+                                    break
+                                chunk = _stream_chunk(json.loads(data))
+                                if chunk is None:
+                                    continue
+                                emitted = True
+                                if run_manager:
+                                    await run_manager.on_llm_new_token(
+                                        chunk.text, chunk=chunk
+                                    )
+                                yield chunk
+                        return
+                    except asyncio.CancelledError:
+                        health.abandon()
+                        raise
+                    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                        if _is_gateway_failure(e):
+                            health.record_failure()
+                        else:
+                            health.abandon()
+                        if (
+                            emitted
+                            or attempt >= self.llm_retry_attempts
+                            or health.is_open
+                        ):
+                            raise
+                        await asyncio.sleep(
+                            self.llm_retry_base_delay * (2 ** (attempt - 1))
+                        )
+
+    def with_structured_output(
+        self,
+        schema,
+        *,
+        method: str = "json_schema",
+        early_field: Optional[str] = None,
+        cancel_rest: bool = False,
+        **kwargs,
+    ):
+        """
+        early_field를 주면 응답 JSON을 스트리밍으로 받아, 그 최상위 문자열 필드 값이 확정되는 즉시
+        EarlyStructuredOutput을 반환합니다. 나머지 필드는 result 태스크에서 이어 받으며,
+        cancel_rest=True면 필드 값이 확정된 시점에 생성을 중단하고 result는 None이 됩니다.
+        """
+        # 스키마별 Runnable을 재사용해 호출마다 JSON Schema를 다시 직렬화하지 않도록 함
+        memo_key = structured_output_key(
+            schema,
+            method=method,
+            early_field=early_field,
+            cancel_rest=cancel_rest,
+            **kwargs,
+        )
+        cached = self._structured_runnables.get(memo_key)
+        if cached is not None:
+            return cached
 
-            # 2. JSON Schema 추출 (Pydantic 모델 대응)
-            schema_str = ""
-            if hasattr(schema, "model_json_schema"):
-                schema_str = json.dumps(
-                    schema.model_json_schema(), indent=2, ensure_ascii=False
-                )
+        schema_instruction = _schema_instruction(schema)
 
-            # 3. 시스템 메시지에 지시사항 주입
-            modified_messages = list(messages)
-            schema_instruction = (
-                "\n\nYour response MUST be a single JSON object "
-                f"matching this schema:\n```json\n{schema_str}\n```\n"
-                "Do not include any explanation or markdown outside the JSON."
-            )
+        if early_field is not None:
 
-            # 기존 시스템 메시지 찾기
-            system_msg_index = -1
-            for i, m in enumerate(modified_messages):
-                if isinstance(m, SystemMessage):
-                    system_msg_index = i
-                    break
-
-            if system_msg_index != -1:
-                # 기존 시스템 메시지가 있으면 내용 추가
-                modified_messages[system_msg_index] = SystemMessage(
-                    content=str(modified_messages[system_msg_index].content)
-                    + schema_instruction
+            async def _call_early(input_data: Any) -> EarlyStructuredOutput:
+                messages = _with_schema_instruction(
+                    _input_messages(input_data), schema_instruction
+                )
+                return await self._astructured_early(
+                    messages, schema, early_field, cancel_rest
                 )
-            else:
-                # 없으면 맨 앞에 추가
-                modified_messages.insert(0, SystemMessage(content=schema_instruction))
 
-            # 4. 모델 호출 (ainvoke 사용)
+            runnable = RunnableLambda(_call_early)
+            if memo_key is not None:
+                self._structured_runnables[memo_key] = runnable
+            return runnable
+
+        async def _call(input_data: Any) -> Any:
+            # 1. 입력 메시지 추출 후 시스템 메시지에 스키마 지시사항 주입
+            modified_messages = _with_schema_instruction(
+                _input_messages(input_data), schema_instruction
+            )
+
+            # 2. 모델 호출 (ainvoke 사용)
             result = await self.ainvoke(
                 modified_messages,
                 response_format={"type": "json_object"},
             )
 
-            # 5. 결과 파싱 및 검증
+            # 3. 결과 파싱 및 검증
             content = result.content
             # _agenerate에서 content를 이미 list나 dict로 파싱했을 수 있음 처리
             data = (
@@ -236,4 +511,120 @@ class NarrativeChatModel(BaseChatModel):
             # Pydantic 모델로 변환하여 반환
             return schema.model_validate(data)
 
-        return RunnableLambda(_call)
+        runnable = RunnableLambda(_call)
+        if memo_key is not None:
+            self._structured_runnables[memo_key] = runnable
+        return runnable
+
+    async def _astructured_early(
+        self,
+        messages: List[BaseMessage],
+        schema,
+        field: str,
+        cancel_rest: bool,
+    ) -> "EarlyStructuredOutput":
+        """
+        스트림 소비는 처음부터 별도 태스크 하나에서 끝까지 진행합니다.
+        (스트림 안의 슬롯·타이밍 컨텍스트가 생성된 태스크에서 정리되어야 하므로 호출 측과 나눠 읽지 않음)
+        """
+        routed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        async def _consume():
+            buffer = ""
+            try:
+                stream = self.astream(messages, response_format={"type": "json_object"})
+                async with aclosing(stream) as chunks:
+                    async for chunk in chunks:
+                        buffer += chunk.text
+                        if routed.done():
+                            continue
+                        value = closed_string_field(buffer, field)
+                        if value is not None:
+                            routed.set_result(value)
+                            if cancel_rest:
+                                return None
+
+                try:
+                    data = json.loads(buffer)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Failed to parse JSON response: {buffer}") from e
+                result = schema.model_validate(data)
+            except Exception as e:
+                if routed.done():
+                    raise
+                # 값이 확정되기 전의 오류는 호출 측(routed)으로만 전달
+                routed.set_exception(e)
+                return None
+            if not routed.done():
+                # 스트리밍 미지원 등으로 한 번에 받은 경우
+                routed.set_result(str(getattr(result, field)))
+            return result
+
+        task = asyncio.create_task(_consume())
+        # 값이 확정되기 전에 태스크가 취소되면 기다리는 호출 측도 함께 취소
+        task.add_done_callback(lambda _: routed.cancel())
+        try:
+            value = await asyncio.shield(routed)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        return EarlyStructuredOutput(value=value, result=task)
+
+
+@dataclass
+class EarlyStructuredOutput:
+    """
+    early_field 모드의 구조화 출력 결과입니다.
+
+    value: 확정된 early_field 값
+    result: 나머지 필드까지 검증한 스키마 객체를 돌려주는 태스크 (생성을 중단했으면 None)
+    """
+
+    value: str
+    result: "asyncio.Task"
+
+
+class StructuredFieldStream:
+    """
+    구조화 출력(JSON)을 토큰 스트리밍으로 받으면서 지정한 최상위 문자열 필드의 증분만 먼저 흘려보냅니다.
+    반복이 끝나면 result에 전체 응답을 검증한 스키마 객체가 담깁니다.
+
+    스트리밍을 지원하지 않는 모델은 LangChain 기본 astream이 ainvoke 결과 하나를 주므로,
+    이 경우에는 필드 값 전체가 마지막에 한 번에 전달됩니다.
+    """
+
+    def __init__(self, llm: BaseChatModel, schema, input_data: Any, field: str):
+        self.llm = llm
+        self.schema = schema
+        self.input_data = input_data
+        self.field = field
+        self.result = None
+
+    async def __aiter__(self):
+        messages = _with_schema_instruction(
+            _input_messages(self.input_data), _schema_instruction(self.schema)
+        )
+        kwargs = (
+            {"response_format": {"type": "json_object"}}
+            if isinstance(self.llm, NarrativeChatModel)
+            else {}
+        )
+
+        buffer = ""
+        sent = 0
+        async for chunk in self.llm.astream(messages, **kwargs):
+            buffer += chunk.text
+            value = partial_string_field(buffer, self.field)
+            if value is not None and len(value) > sent:
+                yield value[sent:]
+                sent = len(value)
+
+        try:
+            data = json.loads(buffer)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON response: {buffer}") from e
+        self.result = self.schema.model_validate(data)
+
+        rest = str(getattr(self.result, self.field))[sent:]
+        if rest:
+            yield rest
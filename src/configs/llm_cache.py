@@ -0,0 +1,94 @@
+import hashlib
+import json
+from typing import Any, List, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from configs.setting import LLM_CACHE_SIZE, LLM_CACHE_TTL, LLM_CACHE_VERSION
+from utils.served_locally import mark_served_locally
+from utils.two_tier_cache import TwoTierCache
+
+
+def _dump_generations(generations: Sequence[Generation]) -> str:
+    return json.dumps(
+        [
+            {
+                "message": message_to_dict(g.message),
+                "generation_info": g.generation_info,
+            }
+            if isinstance(g, ChatGeneration)
+            else {"text": g.text, "generation_info": g.generation_info}
+            for g in generations
+        ],
+        ensure_ascii=False,
+    )
+
+
+def _load_generations(raw: str) -> List[Generation]:
+    generations: List[Generation] = []
+    for item in json.loads(raw):
+        if "message" in item:
+            message = messages_from_dict([item["message"]])[0]
+            generations.append(
+                ChatGeneration(message=message, generation_info=item["generation_info"])
+            )
+        else:
+            generations.append(
+                Generation(text=item["text"], generation_info=item["generation_info"])
+            )
+    return generations
+
+
+class LLMResponseCache(TwoTierCache, BaseCache):
+    """
+    temperature 0 LLM 호출의 응답 캐시(LangChain BaseCache)입니다.
+
+    - LLMManager가 temperature 0 인스턴스에만 연결하므로 샘플링 호출(temperature > 0)은 항상 캐시를 우회합니다.
+    - 키는 LangChain이 넘기는 llm_string(제공자·모델·temperature·response_format 등 호출 파라미터)과
+      직렬화된 메시지, LLM_CACHE_VERSION의 해시입니다.
+    - 1차: 프로세스 내 LRU, 2차: Redis(TTL). L1 적중은 네트워크를 전혀 사용하지 않습니다.
+    - Redis 오류는 캐시 미스로 취급합니다.
+    - 두 계층 모두 직렬화한 문자열을 저장합니다. 호출 측(LangChain)이 결과 메시지를 수정하므로
+      적중할 때마다 저장된 값에서 새로 만듭니다.
+    """
+
+    REDIS_PREFIX = "llm_cache:"
+    NAME = "LLM 응답 캐시"
+
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE, ttl: int = LLM_CACHE_TTL):
+        super().__init__(maxsize, ttl)
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        raw = "\0".join([LLM_CACHE_VERSION, llm_string, prompt])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """동기 경로는 프로세스 내 LRU만 조회합니다."""
+        raw = self.get_local(self.make_key(prompt, llm_string))
+        if raw is None:
+            self.misses += 1
+            return None
+        mark_served_locally("cache")
+        return _load_generations(raw)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        self._remember(self.make_key(prompt, llm_string), _dump_generations(return_val))
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        raw = await self.get(self.make_key(prompt, llm_string))
+        if raw is None:
+            return None
+        mark_served_locally("cache")
+        return _load_generations(raw)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        await self.set(self.make_key(prompt, llm_string), _dump_generations(return_val))
+
+    async def aclear(self, **kwargs: Any):
+        self.clear()
+
+
+llm_response_cache = LLMResponseCache()
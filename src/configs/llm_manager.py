@@ -5,7 +5,15 @@ from langchain_openai import ChatOpenAI
 
 from configs.http_client import http_holder
 from configs.llm_adapter import NarrativeChatModel
-from configs.setting import APP_ENV, GEMINI_API_KEY, OPENAI_API_KEY
+from configs.llm_cache import llm_response_cache
+from configs.llm_router import LLMRouter
+from configs.setting import (
+    APP_ENV,
+    GEMINI_API_KEY,
+    LLM_CACHE_ENABLED,
+    LLM_ROUTER_PROVIDERS,
+    OPENAI_API_KEY,
+)
 
 
 class LLMManager:
@@ -19,6 +27,19 @@ class LLMManager:
         if instance_key in cls._instances:
             return cls._instances[instance_key]
 
+        if provider == "router":
+            # 허용 목록의 제공자들을 지연 시간·오류율 기준으로 골라 호출 (각 제공자는 캐시된 인스턴스 재사용)
+            router = LLMRouter(
+                {
+                    name: cls.get_instance(name, temperature)
+                    for name in LLM_ROUTER_PROVIDERS
+                    if name != "router"
+                },
+                temperature=temperature,
+            )
+            cls._instances[instance_key] = router
+            return router
+
         if provider == "gateway":
             # lifespan에서 생성된 전역 클라이언트를 주입합니다.
             if not http_holder.client:
@@ -55,5 +76,10 @@ class LLMManager:
         else:
             raise ValueError(f"지원하지 않는 모델 제공자입니다: {provider}")
 
+        # 결정적인 temperature 0 호출만 응답 캐시를 사용하고, 샘플링 호출은 명시적으로 캐시를 우회
+        instance.cache = (
+            llm_response_cache if LLM_CACHE_ENABLED and temperature == 0 else False
+        )
+
         cls._instances[instance_key] = instance
         return instance
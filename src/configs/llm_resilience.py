@@ -0,0 +1,145 @@
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from configs.setting import (
+    LLM_BREAKER_FAILURE_THRESHOLD,
+    LLM_BREAKER_RECOVERY_TIMEOUT,
+    LLM_HEDGE_MIN_DELAY,
+    LLM_HEDGE_MIN_SAMPLES,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class LLMUnavailableError(HTTPException):
+    """게이트웨이 회로가 열려 있어 LLM 호출을 보내지 않고 바로 실패할 때 발생합니다(503)."""
+
+    def __init__(self, base_url: str, retry_after: float):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"LLM 게이트웨이가 일시적으로 응답하지 않습니다: {base_url}",
+            headers={"Retry-After": str(max(1, round(retry_after)))},
+        )
+
+
+class EndpointHealth:
+    """
+    LLM 게이트웨이 한 곳의 회로 차단기와 응답 시간 기록입니다.
+
+    - 연결 오류·5xx가 failure_threshold번 연속되면 회로를 열고(open), recovery_timeout초 동안 호출을 즉시 거절합니다.
+    - 그 뒤 한 번의 시험 호출(half_open)만 보내 성공하면 닫고, 실패하면 다시 엽니다.
+    - 성공한 호출의 응답 시간을 최근 window개까지 보관해 헤지(hedge) 요청 지연값(p95)을 계산합니다.
+      헤지는 전체 응답을 기다리는 호출에만 쓰므로, 첫 바이트 시간만 알 수 있는 스트리밍 호출은 기록하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        failure_threshold: int = LLM_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = LLM_BREAKER_RECOVERY_TIMEOUT,
+        window: int = 200,
+    ):
+        self.base_url = base_url
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._probing = False
+        self._latencies: deque = deque(maxlen=window)
+
+    def _retry_after(self) -> float:
+        return self.opened_at + self.recovery_timeout - time.monotonic()
+
+    def before_call(self):
+        """호출 가능 여부를 확인합니다. 회로가 열려 있으면 LLMUnavailableError를 냅니다."""
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN and self._retry_after() <= 0:
+            self.state = HALF_OPEN
+            self._probing = False
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        self.rejected += 1
+        raise LLMUnavailableError(self.base_url, max(self._retry_after(), 1))
+
+    def abandon(self):
+        """호출이 취소되어 결과를 알 수 없을 때 시험 호출 자리를 돌려놓습니다."""
+        self._probing = False
+
+    def record_success(self, latency: Optional[float] = None):
+        """latency 없이 부르면 회로 상태만 갱신하고 헤지 지연 계산용 표본에는 넣지 않습니다."""
+        if latency is not None:
+            self._latencies.append(latency)
+        self.consecutive_failures = 0
+        self._probing = False
+        self.state = CLOSED
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._probing = False
+        if (
+            self.state == HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != OPEN:
+                self.trips += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    def p95(self) -> Optional[float]:
+        if len(self._latencies) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 지연(초). 표본이 부족하거나 회로가 닫혀 있지 않으면 None(헤지 안 함)."""
+        p95 = self.p95()
+        if p95 is None or self.state != CLOSED:
+            return None
+        return max(p95, LLM_HEDGE_MIN_DELAY)
+
+    def stats(self) -> Dict[str, Any]:
+        p95 = self.p95()
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "retry_after": round(max(self._retry_after(), 0), 3)
+            if self.is_open
+            else 0.0,
+            "p95_ms": round(p95 * 1000, 3) if p95 is not None else None,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+_endpoints: Dict[str, EndpointHealth] = {}
+
+
+def endpoint_health(base_url: str) -> EndpointHealth:
+    """게이트웨이 주소별 EndpointHealth를 프로세스 전역에서 공유합니다."""
+    health = _endpoints.get(base_url)
+    if health is None:
+        health = _endpoints[base_url] = EndpointHealth(base_url)
+    return health
+
+
+def endpoints_stats() -> Dict[str, Dict[str, Any]]:
+    return {url: health.stats() for url, health in _endpoints.items()}
@@ -0,0 +1,216 @@
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import openai
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from configs.llm_adapter import structured_output_key
+from configs.llm_resilience import LLMUnavailableError
+from configs.llm_scheduler import LLMOverloadedError
+from configs.setting import (
+    LLM_ROUTER_COOLDOWN,
+    LLM_ROUTER_EWMA_ALPHA,
+    LLM_ROUTER_MAX_ERROR_RATE,
+)
+from utils.logger import warning
+from utils.served_locally import collect_local_serves
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """제공자 SDK별 오류에서 HTTP 상태 코드를 꺼냅니다(httpx·openai: status_code, google-genai: code)."""
+    response = getattr(error, "response", None)
+    for status in (
+        getattr(error, "status_code", None),
+        getattr(response, "status_code", None),
+        getattr(error, "code", None),
+    ):
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def _is_provider_failure(error: Exception) -> bool:
+    """
+    다른 제공자로 넘길 오류인지 판단합니다. 연결 오류·시간 초과·5xx만 해당합니다.
+    로컬 부하 차단(LLMOverloadedError), 4xx, 응답 검증 오류는 어느 제공자로 보내도 같으므로 넘기지 않습니다.
+    """
+    if isinstance(error, LLMOverloadedError):
+        return False
+    if isinstance(
+        error,
+        (
+            httpx.TransportError,
+            openai.APIConnectionError,
+            TimeoutError,
+            ConnectionError,
+        ),
+    ):
+        return True
+    status = _status_code(error)
+    return status is not None and status >= 500
+
+
+class ProviderStats:
+    """
+    LLM 제공자 하나의 응답 시간·오류율 EWMA입니다.
+
+    - 오류율이 max_error_rate 이상이면 건강하지 않은(unhealthy) 것으로 보고 다른 제공자 뒤로 미룹니다.
+    - 마지막 실패 후 cooldown초가 지나면 다시 건강한 후보로 돌려 한 번 시도해 보게 합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        alpha: float = LLM_ROUTER_EWMA_ALPHA,
+        max_error_rate: float = LLM_ROUTER_MAX_ERROR_RATE,
+        cooldown: float = LLM_ROUTER_COOLDOWN,
+    ):
+        self.name = name
+        self.alpha = alpha
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.failed_at = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        if self.error_rate < self.max_error_rate:
+            return True
+        return time.monotonic() - self.failed_at >= self.cooldown
+
+    def record_success(self, latency: Optional[float] = None):
+        """latency 없이 부르면 오류율만 갱신하고 응답 시간 EWMA에는 반영하지 않습니다."""
+        self.calls += 1
+        if latency is not None:
+            self.latency = (
+                latency
+                if self.latency is None
+                else self.alpha * latency + (1 - self.alpha) * self.latency
+            )
+        self.error_rate *= 1 - self.alpha
+
+    def record_failure(self):
+        self.calls += 1
+        self.failures += 1
+        self.failed_at = time.monotonic()
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "latency_ms": round(self.latency * 1000, 3)
+            if self.latency is not None
+            else None,
+            "error_rate": round(self.error_rate, 4),
+            "calls": self.calls,
+            "failures": self.failures,
+        }
+
+
+_providers: Dict[str, ProviderStats] = {}
+
+
+def provider_stats(name: str) -> ProviderStats:
+    """제공자 이름별 ProviderStats를 프로세스 전역에서 공유합니다(temperature가 달라도 같은 기록)."""
+    stats = _providers.get(name)
+    if stats is None:
+        stats = _providers[name] = ProviderStats(name)
+    return stats
+
+
+def providers_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: stats.stats() for name, stats in _providers.items()}
+
+
+class LLMRouter:
+    """
+    허용 목록의 LLM 제공자 중 가장 빠른 건강한 제공자로 호출을 보내고, 실패하면 다음 제공자로 넘깁니다.
+
+    - 순서: 건강한 제공자 → EWMA 응답 시간이 짧은 제공자 → 허용 목록 순서.
+      아직 표본이 없는 제공자는 가장 빠른 것으로 보아 한 번씩 측정되게 합니다.
+    - 연결 오류·시간 초과·5xx일 때만 다음 제공자로 넘기고, 그 밖의 오류는 바로 올립니다.
+    - 응답 캐시 적중이나 합쳐진 호출로 처리된 결과는 성공으로만 세고 응답 시간 EWMA에는 넣지 않습니다.
+    - 모든 제공자가 실패하면 마지막 오류를 그대로 올립니다.
+    - ainvoke와 with_structured_output(..).ainvoke를 지원합니다. 토큰 스트리밍은 라우팅하지 않습니다.
+    """
+
+    def __init__(self, providers: Dict[str, BaseChatModel], temperature: float = 0.0):
+        if not providers:
+            raise ValueError("라우팅할 LLM 제공자가 없습니다.")
+        self.providers = providers
+        self.temperature = temperature
+        self._structured_runnables: Dict[Any, Runnable] = {}
+
+    @property
+    def model_name(self) -> str:
+        return "router(" + ",".join(self.providers) + ")"
+
+    def ranked(self) -> List[str]:
+        order = {name: i for i, name in enumerate(self.providers)}
+
+        def _rank(name: str):
+            stats = provider_stats(name)
+            latency = stats.latency if stats.latency is not None else 0.0
+            return (not stats.healthy, latency, order[name])
+
+        return sorted(self.providers, key=_rank)
+
+    async def _route(self, call: Callable[[str, BaseChatModel], Awaitable[Any]]) -> Any:
+        last_error: Optional[Exception] = None
+        for name in self.ranked():
+            stats = provider_stats(name)
+            started = time.perf_counter()
+            try:
+                with collect_local_serves() as served_locally:
+                    result = await call(name, self.providers[name])
+            except LLMUnavailableError as e:
+                # 회로가 열려 호출하지 않은 경우: 제공자 자체의 차단기가 이미 실패를 집계했으므로 전환만 함
+                warning(f"⚠️ LLM 제공자 {name} 회로 열림, 다음 제공자로 전환")
+                last_error = e
+                continue
+            except Exception as e:
+                if not _is_provider_failure(e):
+                    raise
+                stats.record_failure()
+                warning(f"⚠️ LLM 제공자 {name} 호출 실패, 다음 제공자로 전환: {e!r}")
+                last_error = e
+                continue
+            # 응답 캐시 적중·합쳐진 호출은 제공자를 거치지 않아 응답 시간 표본에서 뺌
+            if served_locally:
+                stats.record_success()
+            else:
+                stats.record_success(time.perf_counter() - started)
+            return result
+        raise last_error
+
+    async def ainvoke(self, input_data: Any, **kwargs) -> Any:
+        return await self._route(lambda _, llm: llm.ainvoke(input_data, **kwargs))
+
+    def with_structured_output(self, schema, **kwargs) -> Runnable:
+        memo_key = structured_output_key(schema, **kwargs)
+        cached = self._structured_runnables.get(memo_key)
+        if cached is not None:
+            return cached
+
+        # 제공자별 구조화 출력 Runnable은 처음 선택될 때 한 번만 만듦
+        per_provider: Dict[str, Runnable] = {}
+
+        def _structured(name: str, llm: BaseChatModel) -> Runnable:
+            if name not in per_provider:
+                per_provider[name] = llm.with_structured_output(schema, **kwargs)
+            return per_provider[name]
+
+        async def _call(input_data: Any) -> Any:
+            return await self._route(
+                lambda name, llm: _structured(name, llm).ainvoke(input_data)
+            )
+
+        runnable = RunnableLambda(_call)
+        if memo_key is not None:
+            self._structured_runnables[memo_key] = runnable
+        return runnable
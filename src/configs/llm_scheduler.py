@@ -0,0 +1,179 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Dict, List, Tuple
+
+from fastapi import HTTPException, status
+
+from configs.setting import LLM_MAX_IN_FLIGHT, LLM_MAX_QUEUE, LLM_QUEUE_TIMEOUT
+from utils.timing import timed
+
+
+class LLMPriority(IntEnum):
+    """값이 작을수록 먼저 게이트웨이 슬롯을 받습니다."""
+
+    SCENE = 0  # /play/scenario 장면 판정(장면 분석, 회복 아이템 선택)
+    DEFAULT = 1  # 정답 검증 등 그 밖의 호출
+    MINIGAME = 2  # 수수께끼·퀴즈 생성
+
+
+class LLMOverloadedError(HTTPException):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 LLM 호출을 거절할 때 발생합니다(503)."""
+
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": "1"},
+        )
+
+
+# 현재 요청의 LLM 호출 우선순위. 노드 태스크로 복사되므로 요청 진입점에서 한 번만 지정합니다.
+_priority: ContextVar[LLMPriority] = ContextVar(
+    "llm_priority", default=LLMPriority.DEFAULT
+)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority):
+    """블록 안에서 시작하는 LLM 호출의 우선순위를 지정합니다."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class LLMScheduler:
+    """
+    게이트웨이로 나가는 LLM 호출의 동시 실행 수를 max_in_flight로 제한하는 우선순위 대기열입니다.
+
+    - 슬롯이 비면 우선순위가 가장 높은(값이 작은) 대기자부터, 같은 우선순위는 먼저 온 순서대로 받습니다.
+    - 대기열이 max_queue만큼 차면 가장 낮은 우선순위 대기자를 밀어내고, 새 요청이 그보다 낮거나 같으면 새 요청을 거절합니다.
+    - queue_timeout초 안에 슬롯을 받지 못하면 거절합니다. 거절은 모두 LLMOverloadedError(503)입니다.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = LLM_MAX_IN_FLIGHT,
+        max_queue: int = LLM_MAX_QUEUE,
+        queue_timeout: float = LLM_QUEUE_TIMEOUT,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        # (우선순위, 도착 순번, future) 최소 힙
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._stats: Dict[LLMPriority, Dict[str, float]] = {
+            p: {"admitted": 0, "shed": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+            for p in LLMPriority
+        }
+
+    def _queued(self) -> int:
+        return sum(1 for _, _, f in self._waiters if not f.done())
+
+    def _record_wait(self, priority: LLMPriority, started: float):
+        waited = (time.perf_counter() - started) * 1000
+        stats = self._stats[priority]
+        stats["admitted"] += 1
+        stats["wait_ms_total"] += waited
+        stats["wait_ms_max"] = max(stats["wait_ms_max"], waited)
+
+    def _shed(self, priority: LLMPriority, reason: str) -> LLMOverloadedError:
+        self._stats[priority]["shed"] += 1
+        return LLMOverloadedError(f"LLM 요청이 많아 처리할 수 없습니다: {reason}")
+
+    def _evict_lowest(self, priority: LLMPriority) -> bool:
+        """새 요청보다 우선순위가 낮은 대기자 중 가장 늦게 온 대기자를 거절합니다."""
+        pending = [w for w in self._waiters if not w[2].done()]
+        if not pending:
+            return False
+        victim = max(pending, key=lambda w: (w[0], w[1]))
+        if victim[0] <= priority:
+            return False
+        victim[2].set_exception(self._shed(LLMPriority(victim[0]), "대기열 초과"))
+        return True
+
+    async def acquire(self, priority: LLMPriority):
+        started = time.perf_counter()
+        if self.in_flight < self.max_in_flight and not self._queued():
+            self.in_flight += 1
+            self._record_wait(priority, started)
+            return
+
+        if self._queued() >= self.max_queue and not self._evict_lowest(priority):
+            raise self._shed(priority, "대기열 초과")
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # 시간 초과와 동시에 슬롯을 넘겨받았으면 그대로 사용
+                self._record_wait(priority, started)
+                return
+            future.cancel()
+            raise self._shed(priority, "대기 시간 초과") from None
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # 넘겨받은 슬롯을 쓰지 못하므로 다음 대기자에게 넘김
+                self.release()
+            else:
+                future.cancel()
+            raise
+        self._record_wait(priority, started)
+
+    def try_acquire(self) -> bool:
+        """기다리는 요청이 없고 빈 슬롯이 있을 때만 즉시 슬롯을 잡습니다(대기하지 않음)."""
+        if self.in_flight >= self.max_in_flight or self._queued():
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # in_flight는 그대로 두고 슬롯을 다음 대기자에게 넘김
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: LLMPriority | None = None):
+        priority = _priority.get() if priority is None else priority
+        with timed("llm_queue"):
+            await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        classes = {}
+        for priority, stats in self._stats.items():
+            admitted = stats["admitted"]
+            classes[priority.name.lower()] = {
+                "admitted": int(admitted),
+                "shed": int(stats["shed"]),
+                "wait_ms_avg": round(stats["wait_ms_total"] / admitted, 3)
+                if admitted
+                else 0.0,
+                "wait_ms_max": round(stats["wait_ms_max"], 3),
+            }
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "queued": self._queued(),
+            "classes": classes,
+        }
+
+
+llm_scheduler = LLMScheduler()
@@ -1,6 +1,7 @@
 import sys
 
 import redis
+import redis.asyncio as aioredis
 from sshtunnel import SSHTunnelForwarder
 
 from configs.setting import (
@@ -42,6 +43,14 @@ redis_client = redis.StrictRedis(
     decode_responses=True,  # 데이터를 문자열로 자동 디코딩
 )
 
+# 요청 경로(이벤트 루프)에서 사용하는 비동기 Redis 클라이언트. 첫 명령 시점에 연결합니다.
+async_redis_client = aioredis.StrictRedis(
+    host=REDIS_HOST,
+    port=actual_redis_port,
+    password=REDIS_PASSWORD,
+    decode_responses=True,
+)
+
 def check_redis_connection():
     try:
         # 터널이 살아있는지 먼저 확인 (디버깅용)
@@ -31,6 +31,71 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 DB_PORT = int(os.getenv("DB_PORT"))
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# 설정 시 서버 측 파라미터 바인딩 + 같은 쿼리가 N회 실행되면 prepared statement로 등록 (0이면 즉시)
+# PgBouncer transaction 모드처럼 prepared statement를 지원하지 않는 환경에서는 비워둡니다.
+DB_PREPARE_THRESHOLD = (
+    int(os.getenv("DB_PREPARE_THRESHOLD"))
+    if os.getenv("DB_PREPARE_THRESHOLD")
+    else None
+)
+# 마스터 데이터 변경 알림(LISTEN/NOTIFY) 채널명
+MASTER_DATA_CHANNEL = os.getenv("MASTER_DATA_CHANNEL", "master_data_changed")
+# 마스터 데이터 캐시 최대 항목 수 (페이지 조회 파라미터가 키에 포함되므로 넘치면 오래 안 쓴 항목부터 제거)
+MASTER_DATA_CACHE_SIZE = int(os.getenv("MASTER_DATA_CACHE_SIZE", "4096"))
+# 세계관 정보(설정/시대/장소/캐릭터/능력) 키별 캐시 유지 시간(초)
+WORLD_CACHE_TTL = float(os.getenv("WORLD_CACHE_TTL", "300"))
+
+# PLAY
+# /play/scenario/batch 한 번에 받을 수 있는 장면 수와 동시에 판정할 장면 수
+PLAY_BATCH_MAX_SIZE = int(os.getenv("PLAY_BATCH_MAX_SIZE", "50"))
+PLAY_BATCH_CONCURRENCY = int(os.getenv("PLAY_BATCH_CONCURRENCY", "4"))
+# 로컬 장면 분류기의 확신도가 이 값 이상이면 LLM 분석을 생략합니다. 기본값은 1보다 커서 꺼져 있음(항상 LLM 사용)
+# 벤치마크 평가 문장이 학습 데이터와 같은 템플릿에서 나와 실제 요청에서의 정확도는 검증되지 않았으므로,
+# 실제 트래픽으로 확인한 뒤 0.7 전후로 켜세요. (test/bench_phase_classifier.py)
+PHASE_CLASSIFIER_THRESHOLD = float(os.getenv("PHASE_CLASSIFIER_THRESHOLD", "1.1"))
+# LLM 장면 분석 결과 캐시: 프로세스 내 LRU 항목 수, Redis 유지 시간(초), 수동 무효화용 버전 문자열
+SCENE_ANALYSIS_CACHE_SIZE = int(os.getenv("SCENE_ANALYSIS_CACHE_SIZE", "1024"))
+SCENE_ANALYSIS_CACHE_TTL = int(os.getenv("SCENE_ANALYSIS_CACHE_TTL", "86400"))
+SCENE_ANALYSIS_CACHE_VERSION = os.getenv("SCENE_ANALYSIS_CACHE_VERSION", "1")
+# 게이트웨이 장면 분석 조기 라우팅: off(전체 JSON 대기) | backfill(phase_type 확정 즉시 라우팅, 사유·확신도는 이어 받음)
+# | cancel(phase_type 확정 즉시 라우팅하고 나머지 생성 중단)
+# 조기 라우팅은 스트리밍 호출이라 LLM 응답 캐시와 동일 요청 합치기(single-flight)를 거치지 않으므로 기본은 off
+SCENE_ANALYSIS_EARLY_ROUTE = os.getenv("SCENE_ANALYSIS_EARLY_ROUTE", "off").lower()
+# 유사 장면 재사용: MinHash 추정 유사도(Jaccard) 임계값(1보다 크면 비활성), 색인 최대 항목 수, Redis 영속화 여부
+# 배경 묘사가 길면 행동 문장만 다른 장면도 0.7 안팎으로 나오므로 기본은 비활성이며, 켤 때는 0.85 이상을 권장
+SIMILAR_SCENE_THRESHOLD = float(os.getenv("SIMILAR_SCENE_THRESHOLD", "1.1"))
+SIMILAR_SCENE_INDEX_SIZE = int(os.getenv("SIMILAR_SCENE_INDEX_SIZE", "4096"))
+SIMILAR_SCENE_PERSIST = os.getenv("SIMILAR_SCENE_PERSIST", "false").lower() == "true"
+# temperature 0 LLM 응답 캐시: 사용 여부, 프로세스 내 LRU 항목 수, Redis 유지 시간(초), 수동 무효화용 버전 문자열
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "2048"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "86400"))
+LLM_CACHE_VERSION = os.getenv("LLM_CACHE_VERSION", "1")
+# 게이트웨이 LLM 호출 스케줄러: 동시 실행 수, 최대 대기 요청 수, 슬롯 대기 제한 시간(초)
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "16"))
+LLM_MAX_QUEUE = int(os.getenv("LLM_MAX_QUEUE", "64"))
+LLM_QUEUE_TIMEOUT = float(os.getenv("LLM_QUEUE_TIMEOUT", "5"))
+# 게이트웨이 회로 차단기: 회로를 여는 연속 실패 횟수, 열린 뒤 시험 호출까지 대기 시간(초)
+LLM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+LLM_BREAKER_RECOVERY_TIMEOUT = float(os.getenv("LLM_BREAKER_RECOVERY_TIMEOUT", "10"))
+# 헤지 요청: 사용 여부, 최소 지연(초), p95 계산에 필요한 최소 표본 수
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "0.5"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+# 장면 판정에 쓸 LLM 제공자. "router"면 아래 허용 목록 안에서 지연 시간·오류율로 제공자를 고름
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "gateway")
+# 라우터 허용 목록(쉼표 구분, 앞쪽이 초기 선호), EWMA 가중치, 제외 기준 오류율, 제외 후 재시도까지 대기 시간(초)
+LLM_ROUTER_PROVIDERS = [
+    p.strip().lower()
+    for p in os.getenv("LLM_ROUTER_PROVIDERS", "gateway").split(",")
+    if p.strip()
+]
+LLM_ROUTER_EWMA_ALPHA = float(os.getenv("LLM_ROUTER_EWMA_ALPHA", "0.3"))
+LLM_ROUTER_MAX_ERROR_RATE = float(os.getenv("LLM_ROUTER_MAX_ERROR_RATE", "0.5"))
+LLM_ROUTER_COOLDOWN = float(os.getenv("LLM_ROUTER_COOLDOWN", "30"))
 
 # REDIS
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
@@ -1,5 +1,6 @@
 from domains.gm.dtos.dice_check_result import DiceCheckResult
 from utils.dice_util import DiceUtil
+from utils.stream_events import emit_event
 
 
 class GmService:
@@ -23,7 +24,7 @@ class GmService:
         else:
             msg = "❌ 실패했습니다."
 
-        return DiceCheckResult(
+        dice_result = DiceCheckResult(
             message=msg,
             ability_score=result["ability_score"],
             roll_result=result["roll_result"],
@@ -31,3 +32,5 @@ class GmService:
             is_success=result["is_success"],
             is_critical_success=result["is_critical_success"],
         )
+        emit_event("dice", dice_result)
+        return dice_result
@@ -15,6 +15,10 @@ class PersonalityRequest(BaseModel):
         description="건너뛸 이전 페이지 정보들 = 페이지 * 페이지당 보여줄 행 수",
     )
     limit: int = Field(20, ge=1, le=100, description="페이지당 보여줄 정보 제한")
+    cursor: Optional[str] = Field(
+        None,
+        description="이전 응답의 meta.next_cursor. 지정하면 skip 대신 커서 기준으로 다음 페이지를 조회합니다.",
+    )
 
 
 class PersonalityResponse(BaseModel):
@@ -1,57 +1,106 @@
 from typing import List, Optional
 
-from common.dtos.pagination_meta import PaginationMeta
+from common.utils.pagination import (
+    build_cursor_page,
+    build_pagination_meta,
+    decode_cursor,
+    split_full_count,
+)
 from utils.load_sql import load_sql
+from utils.master_data_cache import master_data_cache
 
 
 class EnemyService:
     def __init__(self, cursor):
         self.cursor = cursor
         self.get_enemies_sql = load_sql("info", "get_enemies")
+        self.get_enemies_with_count_sql = load_sql("info", "get_enemies_with_count")
         self.count_enemies_sql = load_sql("info", "count_enemies")
         self.get_enemy_detail_sql = load_sql("info", "get_enemy_detail")
 
-    async def get_enemies(self, enemy_ids: Optional[List[int]], skip: int, limit: int):
+    async def get_enemies(
+        self,
+        enemy_ids: Optional[List[int]],
+        skip: int,
+        limit: int,
+        with_count: bool = True,
+        page_cursor: Optional[str] = None,
+    ):
+        """
+        적 목록을 조회합니다.
+        with_count=False면 전체 개수 집계를 생략하고 페이지네이션 메타 대신 None을 반환합니다.
+        page_cursor를 넘기면 skip 대신 마지막으로 본 ID 다음부터 읽는 커서(keyset) 모드로 동작합니다.
+        """
+        key = (
+            "enemies",
+            tuple(enemy_ids) if enemy_ids else None,
+            skip,
+            limit,
+            with_count,
+            page_cursor,
+        )
+        return await master_data_cache.get_or_load(
+            key,
+            lambda: self._fetch_enemies(
+                enemy_ids, skip, limit, with_count, page_cursor
+            ),
+        )
+
+    async def _fetch_enemies(
+        self,
+        enemy_ids: Optional[List[int]],
+        skip: int,
+        limit: int,
+        with_count: bool,
+        page_cursor: Optional[str],
+    ):
         params = {
             "enemy_ids": enemy_ids if enemy_ids else None,
             "limit": limit,
             "skip": skip,
+            "after_id": None,
         }
 
-        # 전체 개수 조회
-        self.cursor.execute(self.count_enemies_sql, params)
-        count_result = self.cursor.fetchone()
+        if page_cursor is not None:
+            # 커서 모드: 다음 페이지 존재 여부를 알기 위해 한 행을 더 조회
+            params.update(after_id=decode_cursor(page_cursor), limit=limit + 1, skip=0)
+            await self.cursor.execute(self.get_enemies_sql, params)
+            return build_cursor_page(await self.cursor.fetchall(), limit, "enemy_id")
 
-        total_count = count_result["count"] if count_result else 0
+        if not with_count:
+            await self.cursor.execute(self.get_enemies_sql, params)
+            return await self.cursor.fetchall(), None
 
-        # 데이터 목록 조회
-        self.cursor.execute(self.get_enemies_sql, params)
-        enemies = self.cursor.fetchall()
+        # 데이터 목록 + 전체 개수(COUNT(*) OVER()) 조회
+        await self.cursor.execute(self.get_enemies_with_count_sql, params)
+        enemies, total_count = split_full_count(await self.cursor.fetchall())
 
-        # 페이지네이션 메타데이터 계산
-        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
-        is_last_page = (skip + limit) >= total_count
+        if total_count is None:
+            # 빈 페이지에서는 윈도우 집계 값을 얻을 수 없으므로, skip이 범위를 벗어난 경우에만 개수를 따로 조회
+            total_count = 0
+            if skip > 0:
+                await self.cursor.execute(self.count_enemies_sql, params)
+                count_result = await self.cursor.fetchone()
+                total_count = count_result["count"] if count_result else 0
 
-        meta = PaginationMeta(
-            total_count=total_count,
-            skip=skip,
-            limit=limit,
-            is_last_page=is_last_page,
-            total_pages=total_pages,
-        )
-
-        return enemies, meta
+        last_id = enemies[-1]["enemy_id"] if enemies else None
+        return enemies, build_pagination_meta(total_count, skip, limit, last_id)
 
     async def get_enemy_detail(self, enemy_id: int):
         """
         특정 적의 상세 정보와 전리품(drops) 목록을 통합 조회합니다.
         """
+        return await master_data_cache.get_or_load(
+            ("enemy_detail", enemy_id), lambda: self._fetch_enemy_detail(enemy_id)
+        )
+
+    async def _fetch_enemy_detail(self, enemy_id: int):
         params = {"enemy_id": enemy_id}
 
         # 1. 상세 정보 쿼리 실행 (JSON 집계 쿼리 사용 권장)
         # self.get_enemy_detail_sql = load_sql("info", "get_enemy_detail")
-        self.cursor.execute(self.get_enemy_detail_sql, params)
-        enemy_detail = self.cursor.fetchone()
+        await self.cursor.execute(self.get_enemy_detail_sql, params)
+        enemy_detail = await self.cursor.fetchone()
 
         # 2. 데이터 존재 여부 확인
         if not enemy_detail or enemy_detail.get("enemy_id") is None:
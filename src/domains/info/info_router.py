@@ -51,7 +51,10 @@ class InfoHandler:
         # 서비스 계층 호출 (실제 구현 시 의존성 주입된 인스턴스 사용)
         try:
             items, meta = await item_service.get_items(
-                request_data.item_ids, request_data.skip, request_data.limit
+                request_data.item_ids,
+                request_data.skip,
+                request_data.limit,
+                page_cursor=request_data.cursor,
             )
 
             return {"data": {"items": items, "meta": meta}}
@@ -75,7 +78,10 @@ class InfoHandler:
     ):
         try:
             enemies, meta = await enemy_service.get_enemies(
-                request_data.enemy_ids, request_data.skip, request_data.limit
+                request_data.enemy_ids,
+                request_data.skip,
+                request_data.limit,
+                page_cursor=request_data.cursor,
             )
 
             return {"data": {"enemies": enemies, "meta": meta}}
@@ -123,7 +129,10 @@ class InfoHandler:
     ):
         try:
             npcs, meta = await npc_service.get_npcs(
-                request_data.npc_ids, request_data.skip, request_data.limit
+                request_data.npc_ids,
+                request_data.skip,
+                request_data.limit,
+                page_cursor=request_data.cursor,
             )
 
             return {"data": {"npcs": npcs, "meta": meta}}
@@ -169,7 +178,10 @@ class InfoHandler:
     ):
         try:
             personalities, meta = await personality_service.get_personalities(
-                request_data.personality_ids, request_data.skip, request_data.limit
+                request_data.personality_ids,
+                request_data.skip,
+                request_data.limit,
+                page_cursor=request_data.cursor,
             )
 
             return {"data": {"personalities": personalities, "meta": meta}}
@@ -2,52 +2,98 @@ from typing import List, Optional
 
 from fastapi import HTTPException
 
-from common.dtos.pagination_meta import PaginationMeta
+from common.utils.pagination import (
+    build_cursor_page,
+    build_pagination_meta,
+    decode_cursor,
+    split_full_count,
+)
 from domains.info.dtos.npc_dtos import NpcDetailResponse
 from utils.load_sql import load_sql
+from utils.master_data_cache import master_data_cache
 
 
 class NpcService:
     def __init__(self, cursor):
         self.cursor = cursor
         self.get_npcs_sql = load_sql("info", "get_npcs")
+        self.get_npcs_with_count_sql = load_sql("info", "get_npcs_with_count")
         self.count_npcs_sql = load_sql("info", "count_npcs")
         self.get_npc_sql = load_sql("info", "get_npc")
 
-    async def get_npcs(self, npc_ids: Optional[List[int]], skip: int, limit: int):
+    async def get_npcs(
+        self,
+        npc_ids: Optional[List[int]],
+        skip: int,
+        limit: int,
+        with_count: bool = True,
+        page_cursor: Optional[str] = None,
+    ):
+        """
+        NPC 목록을 조회합니다.
+        with_count=False면 전체 개수 집계를 생략하고 페이지네이션 메타 대신 None을 반환합니다.
+        page_cursor를 넘기면 skip 대신 마지막으로 본 ID 다음부터 읽는 커서(keyset) 모드로 동작합니다.
+        """
+        key = (
+            "npcs",
+            tuple(npc_ids) if npc_ids else None,
+            skip,
+            limit,
+            with_count,
+            page_cursor,
+        )
+        return await master_data_cache.get_or_load(
+            key, lambda: self._fetch_npcs(npc_ids, skip, limit, with_count, page_cursor)
+        )
+
+    async def _fetch_npcs(
+        self,
+        npc_ids: Optional[List[int]],
+        skip: int,
+        limit: int,
+        with_count: bool,
+        page_cursor: Optional[str],
+    ):
         params = {
             "npc_ids": npc_ids if npc_ids else None,
             "limit": limit,
             "skip": skip,
+            "after_id": None,
         }
 
-        # 전체 개수 조회
-        self.cursor.execute(self.count_npcs_sql, params)
-        count_result = self.cursor.fetchone()
-        # RealDictCursor를 사용하므로 키값으로 접근 (count, COUNT(*), 혹은 별칭)
-        total_count = count_result["count"] if count_result else 0
-
-        # 데이터 목록 조회
-        self.cursor.execute(self.get_npcs_sql, params)
-        npcs = self.cursor.fetchall()
-
-        # 페이지네이션 메타데이터 계산
-        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
-        is_last_page = (skip + limit) >= total_count
-
-        meta = PaginationMeta(
-            total_count=total_count,
-            skip=skip,
-            limit=limit,
-            is_last_page=is_last_page,
-            total_pages=total_pages,
-        )
+        if page_cursor is not None:
+            # 커서 모드: 다음 페이지 존재 여부를 알기 위해 한 행을 더 조회
+            params.update(after_id=decode_cursor(page_cursor), limit=limit + 1, skip=0)
+            await self.cursor.execute(self.get_npcs_sql, params)
+            return build_cursor_page(await self.cursor.fetchall(), limit, "npc_id")
+
+        if not with_count:
+            await self.cursor.execute(self.get_npcs_sql, params)
+            return await self.cursor.fetchall(), None
 
-        return npcs, meta
+        # 데이터 목록 + 전체 개수(COUNT(*) OVER()) 조회
+        await self.cursor.execute(self.get_npcs_with_count_sql, params)
+        npcs, total_count = split_full_count(await self.cursor.fetchall())
+
+        if total_count is None:
+            # 빈 페이지에서는 윈도우 집계 값을 얻을 수 없으므로, skip이 범위를 벗어난 경우에만 개수를 따로 조회
+            total_count = 0
+            if skip > 0:
+                await self.cursor.execute(self.count_npcs_sql, params)
+                count_result = await self.cursor.fetchone()
+                total_count = count_result["count"] if count_result else 0
+
+        last_id = npcs[-1]["npc_id"] if npcs else None
+        return npcs, build_pagination_meta(total_count, skip, limit, last_id)
 
     async def get_npc_by_id(self, npc_id: int) -> NpcDetailResponse:
-        self.cursor.execute(self.get_npc_sql, {"npc_id": npc_id})
-        row = self.cursor.fetchone()
+        return await master_data_cache.get_or_load(
+            ("npc", npc_id), lambda: self._fetch_npc_by_id(npc_id)
+        )
+
+    async def _fetch_npc_by_id(self, npc_id: int) -> NpcDetailResponse:
+        await self.cursor.execute(self.get_npc_sql, {"npc_id": npc_id})
+        row = await self.cursor.fetchone()
 
         if not row:
             raise HTTPException(status_code=404, detail="NPC를 찾을 수 없습니다.")
@@ -1,44 +1,90 @@
 from typing import List, Optional
 
-from common.dtos.pagination_meta import PaginationMeta
+from common.utils.pagination import (
+    build_cursor_page,
+    build_pagination_meta,
+    decode_cursor,
+    split_full_count,
+)
 from utils.load_sql import load_sql
+from utils.master_data_cache import master_data_cache
 
 
 class PersonalityService:
     def __init__(self, cursor):
         self.cursor = cursor
         self.get_personalities_sql = load_sql("info", "get_personalities")
+        self.get_personalities_with_count_sql = load_sql(
+            "info", "get_personalities_with_count"
+        )
         self.count_personalities_sql = load_sql("info", "count_personalities")
 
     async def get_personalities(
-        self, personality_ids: Optional[List[str]], skip: int, limit: int
+        self,
+        personality_ids: Optional[List[str]],
+        skip: int,
+        limit: int,
+        with_count: bool = True,
+        page_cursor: Optional[str] = None,
+    ):
+        """
+        성격 목록을 조회합니다.
+        with_count=False면 전체 개수 집계를 생략하고 페이지네이션 메타 대신 None을 반환합니다.
+        page_cursor를 넘기면 skip 대신 마지막으로 본 ID 다음부터 읽는 커서(keyset) 모드로 동작합니다.
+        """
+        key = (
+            "personalities",
+            tuple(personality_ids) if personality_ids is not None else None,
+            skip,
+            limit,
+            with_count,
+            page_cursor,
+        )
+        return await master_data_cache.get_or_load(
+            key,
+            lambda: self._fetch_personalities(
+                personality_ids, skip, limit, with_count, page_cursor
+            ),
+        )
+
+    async def _fetch_personalities(
+        self,
+        personality_ids: Optional[List[str]],
+        skip: int,
+        limit: int,
+        with_count: bool,
+        page_cursor: Optional[str],
     ):
         params = {
             "personality_ids": personality_ids,
             "limit": limit,
             "skip": skip,
+            "after_id": None,
         }
 
-        # 전체 개수 조회
-        self.cursor.execute(self.count_personalities_sql, params)
-        count_result = self.cursor.fetchone()
-
-        total_count = count_result["count"] if count_result else 0
+        if page_cursor is not None:
+            # 커서 모드: 다음 페이지 존재 여부를 알기 위해 한 행을 더 조회
+            params.update(
+                after_id=decode_cursor(page_cursor, str), limit=limit + 1, skip=0
+            )
+            await self.cursor.execute(self.get_personalities_sql, params)
+            return build_cursor_page(await self.cursor.fetchall(), limit, "id")
 
-        # 데이터 목록 조회
-        self.cursor.execute(self.get_personalities_sql, params)
-        personalities = self.cursor.fetchall()
+        if not with_count:
+            await self.cursor.execute(self.get_personalities_sql, params)
+            return await self.cursor.fetchall(), None
 
-        # 페이지네이션 메타데이터 계산
-        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
-        is_last_page = (skip + limit) >= total_count
+        # 데이터 목록 + 전체 개수(COUNT(*) OVER()) 조회
+        await self.cursor.execute(self.get_personalities_with_count_sql, params)
+        personalities, total_count = split_full_count(await self.cursor.fetchall())
 
-        meta = PaginationMeta(
-            total_count=total_count,
-            skip=skip,
-            limit=limit,
-            is_last_page=is_last_page,
-            total_pages=total_pages,
-        )
+        if total_count is None:
+            # 빈 페이지에서는 윈도우 집계 값을 얻을 수 없으므로, skip이 범위를 벗어난 경우에만 개수를 따로 조회
+            total_count = 0
+            if skip > 0:
+                await self.cursor.execute(self.count_personalities_sql, params)
+                count_result = await self.cursor.fetchone()
+                total_count = count_result["count"] if count_result else 0
 
-        return personalities, meta
+        last_id = personalities[-1]["id"] if personalities else None
+        return personalities, build_pagination_meta(total_count, skip, limit, last_id)
@@ -1,4 +1,4 @@
 -- name: count_enemies
 -- 전체 개수 조회 (페이지네이션 계산용)
 SELECT COUNT(*) FROM enemies
-WHERE (%(enemy_ids)s IS NULL OR enemy_id = ANY(%(enemy_ids)s));
+WHERE (%(enemy_ids)s::int[] IS NULL OR enemy_id = ANY(%(enemy_ids)s::int[]));
@@ -1,4 +1,4 @@
 -- name: count_items
 -- 전체 개수 조회 (페이지네이션 계산용)
 SELECT COUNT(*) FROM items
-WHERE (%(item_ids)s IS NULL OR item_id = ANY(%(item_ids)s));
+WHERE (%(item_ids)s::int[] IS NULL OR item_id = ANY(%(item_ids)s::int[]));
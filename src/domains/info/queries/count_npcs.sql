@@ -1,3 +1,3 @@
 -- name: count_npcs
 SELECT COUNT(*) FROM npcs
-WHERE (%(npc_ids)s IS NULL OR npc_id = ANY(%(npc_ids)s));
+WHERE (%(npc_ids)s::int[] IS NULL OR npc_id = ANY(%(npc_ids)s::int[]));
@@ -1,2 +0,0 @@
--- name: get_abilities
-SELECT * FROM abilities ORDER BY ability_id;
\ No newline at end of file
@@ -1,3 +0,0 @@
-SELECT *
-FROM characters
-ORDER BY character_id;
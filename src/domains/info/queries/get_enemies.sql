@@ -1,9 +1,11 @@
 -- name: get_enemies
 SELECT * FROM enemies
 WHERE (
-    %(enemy_ids)s IS NULL
+    %(enemy_ids)s::int[] IS NULL
     OR cardinality(%(enemy_ids)s::int[]) = 0  -- int 배열로 캐스팅
     OR enemy_id = ANY(%(enemy_ids)s::int[])   -- int 배열로 캐스팅
 )
+  -- 커서 모드: 마지막으로 본 ID 다음부터 조회 (NULL이면 처음부터)
+  AND enemy_id > COALESCE(%(after_id)s::int, -2147483648)
 ORDER BY enemy_id ASC
 LIMIT %(limit)s OFFSET %(skip)s;
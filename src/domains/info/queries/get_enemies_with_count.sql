@@ -0,0 +1,10 @@
+-- name: get_enemies_with_count
+-- 적 목록 조회 + 전체 개수(윈도우 집계)를 한 번의 쿼리로 조회
+SELECT *, COUNT(*) OVER() AS full_count FROM enemies
+WHERE (
+    %(enemy_ids)s::int[] IS NULL
+    OR cardinality(%(enemy_ids)s::int[]) = 0  -- int 배열로 캐스팅
+    OR enemy_id = ANY(%(enemy_ids)s::int[])   -- int 배열로 캐스팅
+)
+ORDER BY enemy_id ASC
+LIMIT %(limit)s OFFSET %(skip)s;
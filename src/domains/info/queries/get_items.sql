@@ -1,6 +1,9 @@
 -- name: get_items
 -- 아이템 목록 조회 및 필터링
 SELECT * FROM items
-WHERE (%(item_ids)s IS NULL OR item_id = ANY(%(item_ids)s))
+WHERE (%(item_ids)s::int[] IS NULL OR item_id = ANY(%(item_ids)s::int[]))
+  -- 커서 모드: 마지막으로 본 ID 다음부터 조회 (NULL이면 처음부터)
+  -- OR 대신 COALESCE 하한값을 써서 prepared statement의 generic plan에서도 인덱스 범위 스캔이 되도록 합니다.
+  AND item_id > COALESCE(%(after_id)s::int, -2147483648)
 ORDER BY item_id ASC
 LIMIT %(limit)s OFFSET %(skip)s;
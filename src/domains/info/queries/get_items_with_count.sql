@@ -0,0 +1,6 @@
+-- name: get_items_with_count
+-- 아이템 목록 조회 + 전체 개수(윈도우 집계)를 한 번의 쿼리로 조회
+SELECT *, COUNT(*) OVER() AS full_count FROM items
+WHERE (%(item_ids)s::int[] IS NULL OR item_id = ANY(%(item_ids)s::int[]))
+ORDER BY item_id ASC
+LIMIT %(limit)s OFFSET %(skip)s;
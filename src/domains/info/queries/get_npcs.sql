@@ -1,4 +1,6 @@
 SELECT * FROM npcs
-WHERE (%(npc_ids)s IS NULL OR npc_id = ANY(%(npc_ids)s))
+WHERE (%(npc_ids)s::int[] IS NULL OR npc_id = ANY(%(npc_ids)s::int[]))
+  -- 커서 모드: 마지막으로 본 ID 다음부터 조회 (NULL이면 처음부터)
+  AND npc_id > COALESCE(%(after_id)s::int, -2147483648)
 ORDER BY npc_id ASC
 LIMIT %(limit)s OFFSET %(skip)s;
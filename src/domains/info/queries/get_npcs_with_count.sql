@@ -0,0 +1,6 @@
+-- name: get_npcs_with_count
+-- NPC 목록 조회 + 전체 개수(윈도우 집계)를 한 번의 쿼리로 조회
+SELECT *, COUNT(*) OVER() AS full_count FROM npcs
+WHERE (%(npc_ids)s::int[] IS NULL OR npc_id = ANY(%(npc_ids)s::int[]))
+ORDER BY npc_id ASC
+LIMIT %(limit)s OFFSET %(skip)s;
@@ -1,9 +1,11 @@
 -- name: get_personalities
 SELECT * FROM personality
 WHERE (
-    %(personality_ids)s IS NULL
+    %(personality_ids)s::text[] IS NULL
     OR cardinality(%(personality_ids)s::text[]) = 0  -- text 배열로 캐스팅
     OR id = ANY(%(personality_ids)s::text[])   -- text 배열로 캐스팅
 )
+  -- 커서 모드: 마지막으로 본 ID 다음부터 조회 (NULL이면 처음부터)
+  AND id > COALESCE(%(after_id)s::text, '')
 ORDER BY id ASC
 LIMIT %(limit)s OFFSET %(skip)s;
@@ -0,0 +1,10 @@
+-- name: get_personalities_with_count
+-- 성격 목록 조회 + 전체 개수(윈도우 집계)를 한 번의 쿼리로 조회
+SELECT *, COUNT(*) OVER() AS full_count FROM personality
+WHERE (
+    %(personality_ids)s::text[] IS NULL
+    OR cardinality(%(personality_ids)s::text[]) = 0  -- text 배열로 캐스팅
+    OR id = ANY(%(personality_ids)s::text[])   -- text 배열로 캐스팅
+)
+ORDER BY id ASC
+LIMIT %(limit)s OFFSET %(skip)s;
@@ -0,0 +1,18 @@
+-- name: get_world
+-- 요청된 세계관 키만 한 번의 왕복으로 집계 조회 (요청하지 않은 키는 NULL)
+SELECT
+    CASE WHEN %(include_configs)s::boolean THEN
+        COALESCE((SELECT json_agg(c) FROM system_configs c), '[]'::json)
+    END AS configs,
+    CASE WHEN %(include_eras)s::boolean THEN
+        COALESCE((SELECT json_agg(e ORDER BY e.era_id) FROM world_eras e), '[]'::json)
+    END AS eras,
+    CASE WHEN %(include_locales)s::boolean THEN
+        COALESCE((SELECT json_agg(l ORDER BY l.locale_id) FROM world_locales l), '[]'::json)
+    END AS locales,
+    CASE WHEN %(include_characters)s::boolean THEN
+        COALESCE((SELECT json_agg(ch ORDER BY ch.character_id) FROM characters ch), '[]'::json)
+    END AS characters,
+    CASE WHEN %(include_abilities)s::boolean THEN
+        COALESCE((SELECT json_agg(a ORDER BY a.ability_id) FROM abilities a), '[]'::json)
+    END AS abilities;
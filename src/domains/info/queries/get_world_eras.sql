@@ -1,2 +0,0 @@
-SELECT * FROM world_eras
-ORDER BY era_id;
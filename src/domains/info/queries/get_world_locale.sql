@@ -0,0 +1,5 @@
+-- name: get_world_locale
+-- 장소 단건 조회 (locale_id 기본키 조회)
+SELECT *
+FROM world_locales
+WHERE locale_id = %(locale_id)s;
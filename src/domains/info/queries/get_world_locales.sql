@@ -1,3 +0,0 @@
-SELECT *
-FROM world_locales
-ORDER BY locale_id;
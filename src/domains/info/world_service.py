@@ -1,45 +1,84 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+from configs.setting import WORLD_CACHE_TTL
 from domains.info.dtos.world_dtos import WorldInfoKey
 from utils.load_sql import load_sql
+from utils.master_data_cache import master_data_cache
+
+WORLD_KEYS = [key.value for key in WorldInfoKey]
+LOCALE_INDEX_KEY = ("world", "locale_index")
 
 
 class WorldService:
     def __init__(self, cursor):
         self.cursor = cursor
-        self.get_sys_configs_sql = load_sql("info", "get_sys_configs")
-        self.get_world_eras_sql = load_sql("info", "get_world_eras")
-        self.get_world_locales_sql = load_sql("info", "get_world_locales")
-        self.get_characters_sql = load_sql("info", "get_characters")
-        self.get_abilities_sql = load_sql("info", "get_abilities")
+        self.get_world_sql = load_sql("info", "get_world")
+        self.get_world_locale_sql = load_sql("info", "get_world_locale")
 
     async def get_world(self, include_keys: Optional[List[WorldInfoKey]] = None):
+        """
+        요청된 세계관 정보를 키별 TTL 캐시에서 꺼내고,
+        캐시에 없는 키만 하나의 집계 쿼리(get_world)로 한 번에 조회합니다.
+        """
         target_keys = (
-            include_keys
+            [WorldInfoKey(key).value for key in include_keys]
             if include_keys
-            else ["configs", "eras", "locales", "characters", "abilities"]
+            else WORLD_KEYS
         )
 
-        result = {"configs": None, "eras": None, "locales": None, "characters": None, "abilities": None}
+        result = {key: None for key in WORLD_KEYS}
+        missing_keys = []
+        for key in target_keys:
+            cached = master_data_cache.get(("world", key))
+            if cached is None:
+                missing_keys.append(key)
+            else:
+                result[key] = cached
+
+        if missing_keys:
+            version = master_data_cache.version
+            params = {f"include_{key}": key in missing_keys for key in WORLD_KEYS}
+            await self.cursor.execute(self.get_world_sql, params)
+            row = await self.cursor.fetchone() or {}
 
-        if "configs" in target_keys:
-            self.cursor.execute(self.get_sys_configs_sql)
-            result["configs"] = self.cursor.fetchall()
+            for key in missing_keys:
+                rows = row.get(key) or []
+                result[key] = rows
+                master_data_cache.set(
+                    ("world", key), rows, ttl=WORLD_CACHE_TTL, version=version
+                )
 
-        if "eras" in target_keys:
-            self.cursor.execute(self.get_world_eras_sql)
-            result["eras"] = self.cursor.fetchall()
+            if WorldInfoKey.LOCALES.value in missing_keys:
+                # 전체 장소를 읽은 김에 locale_id 인덱스도 함께 갱신합니다.
+                master_data_cache.set(
+                    LOCALE_INDEX_KEY,
+                    {loc["locale_id"]: loc for loc in result["locales"]},
+                    ttl=WORLD_CACHE_TTL,
+                    version=version,
+                )
 
-        if "locales" in target_keys:
-            self.cursor.execute(self.get_world_locales_sql)
-            result["locales"] = self.cursor.fetchall()
+        return result
 
-        if "characters" in target_keys:
-            self.cursor.execute(self.get_characters_sql)
-            result["characters"] = self.cursor.fetchall()
+    async def get_locale(self, locale_id: int) -> Optional[Dict[str, Any]]:
+        """
+        locale_id로 장소 하나를 조회합니다.
+        메모리의 locale_id 인덱스를 먼저 확인하고, 없을 때만 기본키 단건 쿼리를 실행합니다.
+        """
+        index = master_data_cache.get(LOCALE_INDEX_KEY)
+        if index is not None and locale_id in index:
+            return index[locale_id]
 
-        if "abilities" in target_keys:
-            self.cursor.execute(self.get_abilities_sql)
-            result["abilities"] = self.cursor.fetchall()
+        version = master_data_cache.version
+        await self.cursor.execute(self.get_world_locale_sql, {"locale_id": locale_id})
+        locale = await self.cursor.fetchone()
+        if locale is None:
+            return None
 
-        return result
+        if index is None:
+            index = {}
+            master_data_cache.set(
+                LOCALE_INDEX_KEY, index, ttl=WORLD_CACHE_TTL, version=version
+            )
+        if version == master_data_cache.version:
+            index[locale_id] = locale
+        return locale
@@ -1,9 +1,10 @@
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from configs.llm_manager import LLMManager
+from configs.setting import PLAY_BATCH_MAX_SIZE
 from domains.gm.gm_service import GmService
 from domains.info.enemy_service import EnemyService
 from domains.info.item_service import ItemService
@@ -123,6 +124,29 @@ class PlaySceneResponse(BaseModel):
         None  # 룰 엔진 주사위 판정 기준(2d6 or 1d6) → 최대 / 최소
     )
     logs: Optional[List[str]] = None
+    timings: Optional[Dict[str, float]] = Field(
+        None,
+        description="구간별 소요 시간(ms). timings=true로 요청한 경우에만 포함됩니다.",
+    )
+
+
+class PlaySceneBatchRequest(BaseModel):
+    scenes: List[PlaySceneRequest] = Field(
+        min_length=1, max_length=PLAY_BATCH_MAX_SIZE, description="판정할 장면 목록"
+    )
+
+
+class PlaySceneBatchItem(BaseModel):
+    index: int = Field(description="요청 scenes 목록에서의 위치")
+    data: Optional[PlaySceneResponse] = None
+    status_code: int = Field(200, description="장면별 처리 결과 상태 코드")
+    error: Optional[str] = None
+
+
+class PlaySceneBatchResponse(BaseModel):
+    results: List[PlaySceneBatchItem]
+    succeeded: int
+    failed: int
 
 
 class HandlerUpdatePhase(BaseModel):
@@ -131,6 +155,20 @@ class HandlerUpdatePhase(BaseModel):
     logs: Optional[List[str]] = None
 
 
+def merge_logs(current: List[str], update: List[str]) -> List[str]:
+    """
+    logs 채널 리듀서.
+    노드는 state.logs를 복사한 뒤 새 로그를 덧붙여 반환하므로, 현재 로그와 겹치는 앞부분을 빼고 이어 붙입니다.
+    병렬 분기는 같은 입력 로그에서 출발하므로 각 분기가 추가한 로그만 합쳐집니다.
+    """
+    prefix = 0
+    for existing, incoming in zip(current, update):
+        if existing != incoming:
+            break
+        prefix += 1
+    return current + update[prefix:]
+
+
 # LangGraph State DTO
 class PlaySessionState(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -141,7 +179,7 @@ class PlaySessionState(BaseModel):
     diffs: List[EntityDiff] = Field(default_factory=list)
     relations: List[UpdateRelation] = Field(default_factory=list)
     is_success: Optional[bool] = None
-    logs: List[str] = Field(default_factory=list)
+    logs: Annotated[List[str], merge_logs] = Field(default_factory=list)
 
     # 플레이어
     current_player_id: str = ""
@@ -2,11 +2,13 @@ import asyncio
 import json
 import random
 from datetime import timedelta
+from typing import Set
 
 from fastapi.encoders import jsonable_encoder
-from langchain_core.prompts import ChatPromptTemplate
 
+from configs.llm_adapter import StructuredFieldStream
 from configs.llm_manager import LLMManager
+from configs.llm_scheduler import LLMPriority, llm_priority
 from configs.redis_conn import get_redis_client
 from domains.info.dtos.world_dtos import WorldInfoKey
 from domains.play.dtos.riddle_dtos import AnswerResponse, RiddleData
@@ -15,7 +17,12 @@ from domains.play.prompts.answer_validation_prompt import (
 )
 from domains.play.prompts.prob_generator_prompt import generate_quiz_prompt
 from domains.play.prompts.riddle_generator_prompt import generate_riddle_prompt
-from utils.load_prompt import load_prompt
+from utils.load_prompt import load_chat_prompt
+
+# 문제 생성 태스크가 끝났음을 알리는 큐 표식
+_DONE = object()
+# 클라이언트가 연결을 끊어도 생성·정답 저장이 끝날 때까지 태스크 참조를 유지
+_problem_tasks: Set[asyncio.Task] = set()
 
 
 class MinigameService:
@@ -39,47 +46,76 @@ class MinigameService:
             "npcs",
             "personalities",
         ]
-        self.prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    load_prompt(domain="play", filename="riddle_system_prompt.md"),
-                ),
-                ("human", "{input}"),
-            ]
+        # 레지스트리에서 컴파일된 템플릿을 공유하므로 요청마다 파일을 다시 읽지 않음
+        self.prompt = load_chat_prompt(
+            domain="play", filename="riddle_system_prompt.md"
         )
         self.chain = self.prompt | self.examiner
 
-    async def generate_and_save_riddle(self, user_id: int):
-        # 1. 구조화된 데이터 생성 (힌트 포함)
-        structured_llm = self.examiner.with_structured_output(RiddleData)
-        selected_theme = random.choice(self.riddle_themes)
-        riddle_obj = await structured_llm.ainvoke(
-            generate_riddle_prompt(theme=selected_theme)
-        )
-
-        # 2. REDIS에 정보 저장 (fail_count 초기값 0 추가)
-        redis_key = f"{self.REDIS_RIDDLE_PREFIX}{user_id}"
-        riddle_data_json = json.dumps(
+    def _save_answer(self, redis_key: str, problem: RiddleData):
+        # REDIS에 정보 저장 (fail_count 초기값 0 추가)
+        problem_data_json = json.dumps(
             {
-                "answer": riddle_obj.answer,
-                "hint": riddle_obj.hint,
-                "explanation": riddle_obj.explanation,
+                "answer": problem.answer,
+                "hint": problem.hint,
+                "explanation": problem.explanation,
                 "fail_count": 0,  # 틀린 횟수 추적용
                 "total_time_limit": self.LIMIT_TIME_MINUTES * 60,  # 초 단위 저장
             },
             ensure_ascii=False,
         )
+        self.redis.setex(
+            redis_key, timedelta(minutes=self.LIMIT_TIME_MINUTES), problem_data_json
+        )
 
-        self.redis.setex(redis_key, timedelta(minutes=15), riddle_data_json)
-
-        # 3. 문제 스트리밍
-        async def stream_riddle():
-            for char in riddle_obj.riddle:
-                yield char
-                await asyncio.sleep(0.05)
+    async def _stream_problem(self, prompt: str, redis_key: str):
+        """
+        문제 본문(riddle 필드)을 LLM이 생성하는 대로 흘려보내고, 생성이 끝나면 정답 정보를 Redis에 저장합니다.
+        생성은 별도 태스크에서 진행하므로 클라이언트가 중간에 연결을 끊어도 정답은 저장됩니다.
+        첫 조각은 미리 받아 두어 생성 실패가 스트리밍 시작 전에 예외(500)로 드러나도록 합니다.
+        """
+        problem_stream = StructuredFieldStream(
+            self.examiner, RiddleData, prompt, field="riddle"
+        )
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce():
+            try:
+                async for token in problem_stream:
+                    queue.put_nowait(token)
+                # 마지막 조각이 전달되기 전에 저장되므로 스트림을 다 받은 클라이언트는 바로 답을 제출할 수 있음
+                self._save_answer(redis_key, problem_stream.result)
+            except Exception as e:
+                queue.put_nowait(e)
+            finally:
+                queue.put_nowait(_DONE)
+
+        # 태스크는 생성 시점의 컨텍스트(우선순위)를 복사해 게이트웨이 슬롯을 요청
+        with llm_priority(LLMPriority.MINIGAME):
+            task = asyncio.create_task(produce())
+        _problem_tasks.add(task)
+        task.add_done_callback(_problem_tasks.discard)
+
+        first = await queue.get()
+        if isinstance(first, Exception):
+            raise first
+
+        async def stream():
+            item = first
+            while item is not _DONE:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+                item = await queue.get()
+
+        return stream()
 
-        return stream_riddle()
+    async def generate_and_save_riddle(self, user_id: int):
+        selected_theme = random.choice(self.riddle_themes)
+        return await self._stream_problem(
+            generate_riddle_prompt(theme=selected_theme),
+            f"{self.REDIS_RIDDLE_PREFIX}{user_id}",
+        )
 
     async def generate_and_save_quiz(
         self,
@@ -90,7 +126,6 @@ class MinigameService:
         personality_service,
         world_service,
     ):
-        structured_llm = self.examiner.with_structured_output(RiddleData)
         selected_theme = random.choice(self.cave_themes)
 
         # 1. 테마에 따른 서비스 매핑 (world_service를 기본값으로 설정)
@@ -123,7 +158,7 @@ class MinigameService:
         fetch_method = getattr(info_provider, method_name)
 
         if selected_theme in service_map.keys():
-            params = {method_param: [], "skip": 0, "limit": 500}
+            params = {method_param: [], "skip": 0, "limit": 500, "with_count": False}
             info = await fetch_method(**params)
             if hasattr(info, "data") and info.data is not None:
                 info = info.data
@@ -133,31 +168,11 @@ class MinigameService:
         info = jsonable_encoder(info)
 
         # 선택된 테마(selected_theme)로 조회된 정보(info)를 토대로 동굴 탐험대 세계관 문제 생성
-        quiz_obj = await structured_llm.ainvoke(
-            generate_quiz_prompt(theme=selected_theme, info=info)
+        return await self._stream_problem(
+            generate_quiz_prompt(theme=selected_theme, info=info),
+            f"{self.REDIS_WHAT_PREFIX}{user_id}",
         )
 
-        redis_key = f"{self.REDIS_WHAT_PREFIX}{user_id}"
-        quiz_data_json = json.dumps(
-            {
-                "answer": quiz_obj.answer,
-                "hint": quiz_obj.hint,
-                "explanation": quiz_obj.explanation,
-                "fail_count": 0,  # 틀린 횟수 추적용
-                "total_time_limit": self.LIMIT_TIME_MINUTES * 60,  # 초 단위 저장
-            },
-            ensure_ascii=False,
-        )
-
-        self.redis.setex(redis_key, timedelta(minutes=15), quiz_data_json)
-
-        async def stream_problem():
-            for char in quiz_obj.riddle:
-                yield char
-                await asyncio.sleep(0.05)
-
-        return stream_problem()
-
     async def check_user_answer(
         self, user_id: int, user_guess: str, flag: str = "RIDDLE"
     ) -> AnswerResponse:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi_utils.cbv import cbv
 from starlette.responses import StreamingResponse
 
@@ -18,13 +18,19 @@ from domains.info.item_service import ItemService
 from domains.info.npc_service import NpcService
 from domains.info.personality_service import PersonalityService
 from domains.info.world_service import WorldService
-from domains.play.dtos.play_dtos import PlaySceneRequest, PlaySceneResponse
+from domains.play.dtos.play_dtos import (
+    PlaySceneBatchRequest,
+    PlaySceneBatchResponse,
+    PlaySceneRequest,
+    PlaySceneResponse,
+)
 from domains.play.dtos.player_dtos import FullPlayerState
 from domains.play.dtos.riddle_dtos import AnswerRequest, AnswerResponse
 from domains.play.minigame_service import MinigameService
 from domains.play.play_service import PlayService
 from utils.logger import error
 from utils.proxy_request import proxy_request
+from utils.timing import server_timing_header
 
 play_router = APIRouter(prefix="/play", tags=["게임 플레이"])
 
@@ -39,10 +45,17 @@ class PlayRouter:
     async def play_scene(
         self,
         request: PlaySceneRequest,
+        response: Response,
+        timings: bool = Query(
+            False,
+            description="true면 노드/DB/LLM/프록시 구간별 소요 시간을 timings 필드와 Server-Timing 헤더로 반환합니다.",
+        ),
         play_service: PlayService = Depends(get_play_service),
     ):
         try:
-            result = await play_service.play_scene(request)
+            result = await play_service.play_scene(request, with_timings=timings)
+            if result.timings:
+                response.headers["Server-Timing"] = server_timing_header(result.timings)
             return {"data": result, "message": "룰 판정 결과를 반환합니다."}
         except HTTPException as he:
             raise he
@@ -53,6 +66,48 @@ class PlayRouter:
                 detail="알 수 없는 오류가 발생했습니다.",
             )
 
+    @play_router.post(
+        "/scenario/stream",
+        summary="장면 판정 진행 상황을 노드가 끝날 때마다 SSE(text/event-stream)로 전송합니다.",
+    )
+    async def stream_scene(
+        self,
+        request: PlaySceneRequest,
+        play_service: PlayService = Depends(get_play_service),
+    ):
+        """
+        analysis, target_enemy, dice, diffs 이벤트를 순서대로 보내고,
+        마지막에 final(PlaySceneResponse) 또는 error 이벤트로 끝납니다.
+        """
+        return StreamingResponse(
+            play_service.stream_scene(request),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @play_router.post(
+        "/scenario/batch",
+        summary="여러 장면을 한 번에 판정하고 장면별 결과 또는 오류를 반환합니다.",
+        response_model=WrappedResponse[PlaySceneBatchResponse],
+    )
+    async def play_scenes(
+        self,
+        request: PlaySceneBatchRequest,
+        play_service: PlayService = Depends(get_play_service),
+    ):
+        try:
+            result = await play_service.play_scenes(request.scenes)
+            return {
+                "data": result,
+                "message": f"{result.succeeded}건 성공, {result.failed}건 실패한 룰 판정 결과를 반환합니다.",
+            }
+        except Exception as e:
+            error(f"배치 시나리오 판정 오류: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="알 수 없는 오류가 발생했습니다.",
+            )
+
     @play_router.get(
         "/player/{player_id}",
         summary="대상 플레이어의 상세 정보(상태, 보유 아이템 목록, NPC 우호도 목록)를 조회합니다.",
@@ -1,6 +1,12 @@
-from langgraph.graph import END, StateGraph
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from fastapi import HTTPException
+from langgraph.graph import END, START, StateGraph
 
 from configs.llm_manager import LLMManager
+from configs.llm_scheduler import LLMPriority, llm_priority
+from configs.setting import LLM_PROVIDER, PLAY_BATCH_CONCURRENCY
 from domains.gm.gm_service import GmService
 from domains.info.enemy_service import EnemyService
 from domains.info.item_service import ItemService
@@ -8,15 +14,21 @@ from domains.info.world_service import WorldService
 from domains.play.dtos.play_dtos import (
     PhaseType,
     PhaseUpdate,
+    PlaySceneBatchItem,
+    PlaySceneBatchResponse,
     PlaySceneRequest,
     PlaySceneResponse,
     PlaySessionState,
-    SceneAnalysis,
+    merge_logs,
 )
 from domains.play.utils.nodes import (
+    _phase_from_sequence_type,
     analyze_scene_node,
     categorize_entities_node,
+    collect_analysis_backfills,
     fetch_world_data_node,
+    replace_analysis_logs,
+    share_player_states,
 )
 from domains.play.utils.phase_nodes.combat_node import combat_node
 from domains.play.utils.phase_nodes.dialogue_node import dialogue_node
@@ -25,75 +37,206 @@ from domains.play.utils.phase_nodes.nego_node import nego_node
 from domains.play.utils.phase_nodes.recovery_node import recovery_node
 from domains.play.utils.phase_nodes.rest_node import rest_node
 from domains.play.utils.phase_nodes.unknown_node import unknown_node
-from utils.logger import rule
+from utils.logger import error, rule
+from utils.stream_events import collect_stream_events, emit_event, sse_frame
+from utils.timing import collect_timings, round_timings, timed, timed_node
+
+# 페이즈 유형별 (노드 이름, 핸들러). 그래프 라우팅과 직접 실행 경로가 함께 사용합니다.
+PHASE_NODES = {
+    PhaseType.COMBAT: ("combat", combat_node),
+    PhaseType.EXPLORATION: ("exploration", exploration_node),
+    PhaseType.DIALOGUE: ("dialogue", dialogue_node),
+    PhaseType.NEGO: ("nego", nego_node),
+    PhaseType.REST: ("rest", rest_node),
+    PhaseType.RECOVERY: ("recovery", recovery_node),
+    PhaseType.UNKNOWN: ("unknown", unknown_node),
+}
+
+
+def _route_phase(state: PlaySessionState):
+    """analysis.phase_type 기반으로 적절한 위상 노드로 라우팅합니다."""
+    if state.analysis and state.analysis.phase_type:
+        return state.analysis.phase_type
+    return PhaseType.UNKNOWN
+
+
+def _apply_update(
+    state: PlaySessionState, update: Optional[Dict[str, Any]]
+) -> PlaySessionState:
+    """노드 반환값을 그래프와 같은 규칙(상태 필드만 반영, logs는 리듀서로 병합)으로 상태에 적용합니다."""
+    if not update:
+        return state
+    changes = {
+        key: value
+        for key, value in update.items()
+        if key in PlaySessionState.model_fields
+    }
+    if "logs" in changes:
+        changes["logs"] = merge_logs(state.logs, changes["logs"] or [])
+    return state.model_copy(update=changes)
+
+
+async def join_scene_context_node(state: PlaySessionState):
+    """장면 분석·월드 조회·엔티티 분류 결과가 모두 모인 뒤 페이즈 라우팅을 하기 위한 합류 지점입니다."""
+    return {}
+
+
+def build_play_graph():
+    """
+    플레이 판정용 랭그래프를 빌드·컴파일합니다.
+    그래프 구조는 요청과 무관하므로 프로세스당 한 번만 컴파일하고,
+    요청별 서비스(커서 바인딩)는 PlaySessionState를 통해 주입합니다.
+    서로 의존하지 않는 장면 분석(LLM)·월드 조회(DB)·엔티티 분류(상태 관리 서버)는 병렬로 실행합니다.
+    """
+    workflow = StateGraph(PlaySessionState)
+    rule("랭그래프 빌드")
+
+    # 노드 추가
+    workflow.add_node("analyze_scene", timed_node("analyze_scene", analyze_scene_node))
+    workflow.add_node(
+        "fetch_world_data", timed_node("fetch_world_data", fetch_world_data_node)
+    )
+    workflow.add_node(
+        "categorize_entities",
+        timed_node("categorize_entities", categorize_entities_node),
+    )
+    workflow.add_node(
+        "join_scene_context", timed_node("join_scene_context", join_scene_context_node)
+    )
+    for node_name, node in PHASE_NODES.values():
+        workflow.add_node(node_name, timed_node(node_name, node))
+
+    # 팬아웃: 세 노드를 동시에 실행
+    context_nodes = ["analyze_scene", "fetch_world_data", "categorize_entities"]
+    for node_name in context_nodes:
+        workflow.add_edge(START, node_name)
+
+    # 팬인: 세 노드가 모두 끝나야 합류 노드가 실행됨
+    workflow.add_edge(context_nodes, "join_scene_context")
+
+    # 페이즈 유형에 따라 조건부 간선 추가
+    workflow.add_conditional_edges(
+        "join_scene_context",
+        _route_phase,
+        {phase: node_name for phase, (node_name, _) in PHASE_NODES.items()},
+    )
+
+    # End points for each phase
+    for node_name, _ in PHASE_NODES.values():
+        workflow.add_edge(node_name, END)
+
+    return workflow.compile()
+
+
+# 프로세스 전역에서 공유하는 컴파일된 그래프 (요청마다 재빌드하지 않음)
+play_graph = build_play_graph()
 
 
 class PlayService:
-    def __init__(self, cursor, llm_provider="gateway"):
+    def __init__(self, cursor, llm_provider=LLM_PROVIDER):
         self.cursor = cursor
         self.llm_manager = LLMManager.get_instance(llm_provider)
-        self.analyzer = self.llm_manager.with_structured_output(SceneAnalysis)
         self.gm_service = GmService(cursor)
         self.world_service = WorldService(cursor)
         self.item_service = ItemService(cursor)
         self.enemy_service = EnemyService(cursor)
+        self.graph = play_graph
 
-        # 랭그래프 빌드
-        workflow = StateGraph(PlaySessionState)
-        rule("랭그래프 빌드")
-
-        # 노드 추가
-        workflow.add_node("analyze_scene", analyze_scene_node)
-        workflow.add_node("fetch_world_data", fetch_world_data_node)
-        workflow.add_node("categorize_entities", categorize_entities_node)
-        workflow.add_node("combat", combat_node)
-        workflow.add_node("exploration", exploration_node)
-        workflow.add_node("dialogue", dialogue_node)
-        workflow.add_node("nego", nego_node)
-        workflow.add_node("rest", rest_node)
-        workflow.add_node("recovery", recovery_node)
-        workflow.add_node("unknown", unknown_node)
-
-        # 엔트리 포인트 설정
-        workflow.set_entry_point("analyze_scene")
-
-        # 엣지 추가
-        workflow.add_edge("analyze_scene", "fetch_world_data")
-        workflow.add_edge("fetch_world_data", "categorize_entities")
-
-        # 페이즈 유형에 따라 조건부 간선 추가
-        workflow.add_conditional_edges(
-            "categorize_entities",
-            self._route_phase,
-            {
-                PhaseType.COMBAT: "combat",
-                PhaseType.EXPLORATION: "exploration",
-                PhaseType.DIALOGUE: "dialogue",
-                PhaseType.NEGO: "nego",
-                PhaseType.REST: "rest",
-                PhaseType.RECOVERY: "recovery",
-                PhaseType.UNKNOWN: "unknown",
-            },
-        )
+    async def play_scene(
+        self, request: PlaySceneRequest, with_timings: bool = False
+    ) -> PlaySceneResponse:
+        """
+        장면을 판정합니다.
+        with_timings=True면 노드/DB/LLM/프록시 구간별 소요 시간을 응답의 timings에 담습니다.
+        """
+        if not with_timings:
+            return await self._play_scene(request)
+
+        with collect_timings() as timings:
+            with timed("total"):
+                response = await self._play_scene(request)
+        response.timings = round_timings(timings)
+        return response
+
+    async def stream_scene(self, request: PlaySceneRequest) -> AsyncIterator[str]:
+        """
+        장면을 판정하면서 노드가 끝날 때마다 SSE 프레임을 내보냅니다.
+        분석 결과(analysis) → 전투 대상(target_enemy) → 주사위(dice) → 변동치(diffs) → 최종 응답(final) 순이며,
+        판정 중 오류가 나면 final 대신 error 이벤트로 끝납니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        with collect_stream_events(queue):
+            # 태스크는 생성 시점의 컨텍스트를 복사하므로 블록을 벗어나도 같은 큐로 이벤트를 보냄
+            task = asyncio.create_task(self._play_scene(request))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            while (event := await queue.get()) is not None:
+                yield sse_frame(event)
+
+            if task.cancelled():
+                return
+            exc = task.exception()
+            if exc is None:
+                yield sse_frame(("final", task.result()))
+            elif isinstance(exc, HTTPException):
+                yield sse_frame(
+                    ("error", {"status_code": exc.status_code, "detail": exc.detail})
+                )
+            else:
+                error(f"시나리오 스트리밍 판정 오류: {exc}")
+                detail = {
+                    "status_code": 500,
+                    "detail": "알 수 없는 오류가 발생했습니다.",
+                }
+                yield sse_frame(("error", detail))
+        finally:
+            # 클라이언트가 연결을 끊으면 남은 판정도 중단
+            if not task.done():
+                task.cancel()
+
+    async def play_scenes(
+        self,
+        requests: List[PlaySceneRequest],
+        max_concurrency: int = PLAY_BATCH_CONCURRENCY,
+    ) -> PlaySceneBatchResponse:
+        """
+        여러 장면을 최대 max_concurrency개씩 동시에 판정합니다.
+        - 서비스 객체와 커서는 배치 전체가 공유하고, DB 구간만 LazyCursor가 태스크별로 직렬화합니다.
+        - 같은 플레이어의 상태 조회와 아이템/적 조회는 배치 안에서 한 번만 수행됩니다.
+        - 한 장면의 실패가 다른 장면에 영향을 주지 않도록 장면별 결과와 오류를 따로 담습니다.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        # End points for each phase
-        workflow.add_edge("combat", END)
-        workflow.add_edge("exploration", END)
-        workflow.add_edge("dialogue", END)
-        workflow.add_edge("nego", END)
-        workflow.add_edge("rest", END)
-        workflow.add_edge("recovery", END)
-        workflow.add_edge("unknown", END)
+        async def _resolve(index: int, request: PlaySceneRequest) -> PlaySceneBatchItem:
+            async with semaphore:
+                try:
+                    return PlaySceneBatchItem(
+                        index=index, data=await self._play_scene(request)
+                    )
+                except HTTPException as he:
+                    return PlaySceneBatchItem(
+                        index=index, status_code=he.status_code, error=str(he.detail)
+                    )
+                except Exception as e:
+                    error(f"배치 장면 판정 오류 (index={index}): {e}")
+                    return PlaySceneBatchItem(
+                        index=index,
+                        status_code=500,
+                        error="알 수 없는 오류가 발생했습니다.",
+                    )
 
-        self.graph = workflow.compile()
+        with share_player_states():
+            results = await asyncio.gather(
+                *(_resolve(index, request) for index, request in enumerate(requests))
+            )
 
-    def _route_phase(self, state: PlaySessionState):
-        """analysis.phase_type 기반으로 적절한 위상 노드로 라우팅합니다."""
-        if state.analysis and state.analysis.phase_type:
-            return state.analysis.phase_type
-        return PhaseType.UNKNOWN
+        failed = sum(1 for item in results if item.error is not None)
+        return PlaySceneBatchResponse(
+            results=results, succeeded=len(results) - failed, failed=failed
+        )
 
-    async def play_scene(self, request: PlaySceneRequest) -> PlaySceneResponse:
+    async def _play_scene(self, request: PlaySceneRequest) -> PlaySceneResponse:
         initial_state = PlaySessionState(
             request=request,
             logs=[],
@@ -104,8 +247,64 @@ class PlayService:
             world_service=self.world_service,
         )
 
-        final_state: PlaySessionState = await self.graph.ainvoke(initial_state)
+        # 장면 판정의 LLM 호출(장면 분석, 회복 아이템 선택)은 미니게임보다 먼저 게이트웨이 슬롯을 받음
+        with llm_priority(LLMPriority.SCENE):
+            if _phase_from_sequence_type(request.sequence_type) is not None:
+                final_state = await self._run_hinted_phase(initial_state)
+            else:
+                # 그래프가 실패하면 블록을 벗어나면서 남은 이어 받기 태스크가 취소됨
+                with collect_analysis_backfills() as backfills:
+                    final_state = await self.graph.ainvoke(initial_state)
+                    await self._complete_analysis(final_state, backfills)
+
+        response = self._build_response(request, initial_state, final_state)
+        emit_event(
+            "diffs", {"success": response.success, "suggested": response.suggested}
+        )
+        return response
+
+    async def _complete_analysis(
+        self, final_state: Dict[str, Any], backfills: List[asyncio.Task]
+    ):
+        """
+        장면 분석이 phase_type만으로 조기 라우팅되었으면 이어 받은 사유·확신도로 분석 결과와 로그를 교체합니다.
+        이어 받기에 실패하거나 생성을 중단했으면 임시 분석 결과를 그대로 둡니다.
+        """
+        for backfill in backfills:
+            try:
+                with timed("analysis_backfill"):
+                    analysis = await backfill
+            except Exception as e:
+                error(f"장면 분석 사유 이어 받기 실패: {e!r}")
+                continue
+            if analysis is None:
+                continue
+            final_state["logs"] = replace_analysis_logs(
+                final_state.get("logs") or [], final_state["analysis"], analysis
+            )
+            final_state["analysis"] = analysis
+
+    async def _run_hinted_phase(self, state: PlaySessionState) -> PlaySessionState:
+        """
+        sequence_type 힌트로 페이즈가 정해진 장면은 LLM 분석이 필요 없으므로,
+        그래프 스케줄링 없이 분석 → 엔티티 분류 → 페이즈 핸들러를 차례로 직접 호출합니다.
+        페이즈 핸들러가 월드 데이터를 사용하지 않으므로 월드 조회는 생략합니다.
+        """
+        with timed("node.analyze_scene"):
+            state = _apply_update(state, await analyze_scene_node(state))
+        with timed("node.categorize_entities"):
+            state = _apply_update(state, await categorize_entities_node(state))
+
+        node_name, node = PHASE_NODES[_route_phase(state)]
+        with timed(f"node.{node_name}"):
+            return _apply_update(state, await node(state))
 
+    def _build_response(
+        self,
+        request: PlaySceneRequest,
+        initial_state: PlaySessionState,
+        final_state: Union[PlaySessionState, Dict[str, Any]],
+    ) -> PlaySceneResponse:
         if isinstance(final_state, dict):
             # 딕셔너리 데이터를 기반으로 응답 생성
             analysis = final_state.get("analysis") or initial_state.analysis
@@ -1,13 +1,18 @@
-import os
-from typing import Any, Dict
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
 
-import aiofiles
 from fastapi import HTTPException, status
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 
-from configs.setting import APP_ENV, STATE_MANAGER_URL
-from domains.info.dtos.world_dtos import WorldInfoKey
+from configs.llm_adapter import EarlyStructuredOutput, NarrativeChatModel
+from configs.setting import (
+    APP_ENV,
+    PHASE_CLASSIFIER_THRESHOLD,
+    SCENE_ANALYSIS_EARLY_ROUTE,
+    STATE_MANAGER_URL,
+)
 from domains.info.world_service import WorldService
 from domains.play.dtos.play_dtos import (
     EntityType,
@@ -16,8 +21,20 @@ from domains.play.dtos.play_dtos import (
     SceneAnalysis,
 )
 from domains.play.dtos.player_dtos import FullPlayerState
+from domains.play.utils.phase_classifier import get_phase_classifier
+from domains.play.utils.scene_analysis_cache import model_tag, scene_analysis_cache
+from domains.play.utils.similar_scene_index import context_key, similar_scene_index
+from utils.load_prompt import load_chat_prompt, load_prompt
 from utils.logger import debug, error, rule
 from utils.proxy_request import proxy_request
+from utils.stream_events import emit_event
+
+SCENE_ANALYSIS_PROMPT_FILE = "instruction.md"
+SCENE_ANALYSIS_HUMAN_TEMPLATE = "시나리오: {story}"
+# 조기 라우팅으로 사유가 아직 없을 때 쓰는 임시 분석 값
+EARLY_ROUTE_REASON = "phase_type 확정 후 조기 라우팅"
+# 장면 분석 프롬프트는 import 시점에 미리 컴파일해 요청 경로에서 파일 I/O나 템플릿 파싱이 없도록 함
+load_chat_prompt("play", SCENE_ANALYSIS_PROMPT_FILE, SCENE_ANALYSIS_HUMAN_TEMPLATE)
 
 
 def _phase_from_sequence_type(raw: str | None) -> PhaseType | None:
@@ -74,6 +91,60 @@ async def get_player_state_from_proxy(player_id: str) -> FullPlayerState:
         )
 
 
+# 배치 처리 중 같은 플레이어의 상태 조회를 공유하기 위한 player_id -> 조회 future.
+# share_player_states() 블록 밖에서는 None이라 매번 상태 관리 서버를 호출합니다.
+_player_state_memo: ContextVar[Optional[Dict[str, asyncio.Future]]] = ContextVar(
+    "player_state_memo", default=None
+)
+
+
+# 요청 하나에서 조기 라우팅한 장면 분석의 이어 받기 태스크 목록.
+# collect_analysis_backfills() 블록 밖에서는 None이라 조기 라우팅을 쓰지 않고 전체 분석을 기다립니다.
+_analysis_backfills: ContextVar[Optional[List[asyncio.Task]]] = ContextVar(
+    "analysis_backfills", default=None
+)
+
+
+@contextmanager
+def collect_analysis_backfills():
+    """
+    블록 안에서 시작된 장면 분석 이어 받기 태스크를 모읍니다.
+    블록을 벗어날 때 끝나지 않은 태스크는 취소해 게이트웨이 스트림과 스케줄러 슬롯을 돌려놓습니다.
+    """
+    backfills: List[asyncio.Task] = []
+    token = _analysis_backfills.set(backfills)
+    try:
+        yield backfills
+    finally:
+        _analysis_backfills.reset(token)
+        for task in backfills:
+            if not task.done():
+                task.cancel()
+
+
+@contextmanager
+def share_player_states():
+    """블록 안에서 시작된 장면들이 같은 플레이어 상태 조회 결과를 공유하도록 합니다."""
+    token = _player_state_memo.set({})
+    try:
+        yield
+    finally:
+        _player_state_memo.reset(token)
+
+
+async def fetch_player_state(player_id: str) -> FullPlayerState:
+    memo = _player_state_memo.get()
+    if memo is None:
+        return await get_player_state_from_proxy(player_id)
+
+    future = memo.get(player_id)
+    if future is None:
+        future = asyncio.ensure_future(get_player_state_from_proxy(player_id))
+        memo[player_id] = future
+    # 한 장면이 취소되어도 같은 조회를 기다리는 다른 장면에는 영향이 없도록 shield
+    return await asyncio.shield(future)
+
+
 async def categorize_entities_node(state: PlaySessionState) -> Dict[str, Any]:
     """
     씬의 엔티티를 분류하고 플레이어 상태를 조회하여 상태를 업데이트합니다.
@@ -97,7 +168,7 @@ async def categorize_entities_node(state: PlaySessionState) -> Dict[str, Any]:
 
     player_state = None
     if player_entity_id:
-        player_state = await get_player_state_from_proxy(player_entity_id)
+        player_state = await fetch_player_state(player_entity_id)
     else:
         error("Warning: Scene 내에 플레이어 엔티티가 존재하지 않습니다.")
         logs.append("Warning: Scene 내에 플레이어 엔티티가 존재하지 않습니다.")
@@ -113,9 +184,55 @@ async def categorize_entities_node(state: PlaySessionState) -> Dict[str, Any]:
     }
 
 
+def _analysis_logs(analysis: SceneAnalysis) -> List[str]:
+    return [
+        f"분석된 플레이 유형: {analysis.phase_type}",
+        f"사유: {analysis.reason}",
+        f"분석 확신도: {analysis.confidence}",
+    ]
+
+
+def replace_analysis_logs(
+    logs: List[str], provisional: SceneAnalysis, analysis: SceneAnalysis
+) -> List[str]:
+    """조기 라우팅 때 남긴 임시 분석 로그를 이어 받은 분석 결과의 로그로 바꿉니다."""
+    old, new = _analysis_logs(provisional), _analysis_logs(analysis)
+    for i in range(len(logs) - len(old) + 1):
+        if logs[i : i + len(old)] == old:
+            return logs[:i] + new + logs[i + len(old) :]
+    return logs + new
+
+
+def _analysis_update(
+    state: PlaySessionState, analysis: SceneAnalysis
+) -> Dict[str, Any]:
+    logs = state.logs[:] + _analysis_logs(analysis)
+    rule(f"분석된 플레이 유형: {analysis.phase_type}")
+    rule(f"분석 근거: {analysis.reason}")
+    rule(f"분석 확신도: {analysis.confidence}")
+    emit_event("analysis", analysis)
+    return {"analysis": analysis, "logs": logs}
+
+
+def _classify_locally(story: str) -> SceneAnalysis | None:
+    """로컬 분류기의 확신도가 임계값 이상일 때만 분석 결과를 반환합니다."""
+    classifier = get_phase_classifier()
+    if classifier is None:
+        return None
+    phase_type, confidence = classifier.predict(story)
+    if confidence < PHASE_CLASSIFIER_THRESHOLD:
+        return None
+    return SceneAnalysis(
+        phase_type=phase_type,
+        reason="로컬 장면 분류기 판정",
+        confidence=round(confidence, 4),
+    )
+
+
 async def analyze_scene_node(state: PlaySessionState) -> Dict[str, Any]:
     """
-    LLM을 사용하여 스토리를 분석하고 페이즈 유형을 결정합니다.
+    스토리를 분석하고 페이즈 유형을 결정합니다.
+    sequence_type 힌트 → 로컬 장면 분류기(확신도 임계값 이상) → 분석 결과 캐시(완전 일치 → 유사 장면) → LLM 순으로 시도합니다.
     """
     forced_phase = _phase_from_sequence_type(state.request.sequence_type)
     if forced_phase is not None:
@@ -124,42 +241,85 @@ async def analyze_scene_node(state: PlaySessionState) -> Dict[str, Any]:
             reason=f"sequence_type hint applied: {state.request.sequence_type}",
             confidence=1.0,
         )
-        logs = state.logs[:]
-        logs.append(f"분석된 플레이 유형: {analysis.phase_type}")
-        logs.append(f"사유: {analysis.reason}")
-        logs.append(f"분석 확신도: {analysis.confidence}")
-        rule(f"분석된 플레이 유형: {analysis.phase_type}")
-        rule(f"분석 근거: {analysis.reason}")
-        rule(f"분석 확신도: {analysis.confidence}")
-        return {"analysis": analysis, "logs": logs}
-
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    prompt_path = os.path.join(current_dir, "..", "prompts", "instruction.md")
-
-    async with aiofiles.open(prompt_path, mode="r", encoding="utf-8") as f:
-        system_instruction = await f.read()
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_instruction),
-            ("human", "시나리오: {story}"),
-        ]
+        return _analysis_update(state, analysis)
+
+    local_analysis = _classify_locally(state.request.story)
+    if local_analysis is not None:
+        return _analysis_update(state, local_analysis)
+
+    system_instruction = load_prompt("play", SCENE_ANALYSIS_PROMPT_FILE)
+
+    # 같은 스토리·프롬프트·모델 조합이면 이전 LLM 분석 결과를 재사용
+    llm_tag = model_tag(state.llm)
+    cache_key = scene_analysis_cache.make_key(
+        state.request.story, system_instruction, llm_tag
     )
+    cached_analysis = await scene_analysis_cache.get(cache_key)
+    if cached_analysis is not None:
+        return _analysis_update(state, cached_analysis)
+
+    # 이름이나 문장 일부만 다른 장면이면 가장 유사한 이전 분석 결과를 재사용
+    scene_context = context_key(system_instruction, llm_tag)
+    similar = similar_scene_index.lookup(state.request.story, scene_context)
+    if similar is not None:
+        similar_analysis, score = similar
+        reused = similar_analysis.model_copy(
+            update={
+                "reason": f"{similar_analysis.reason} (유사 장면 분석 재사용, 유사도 {score:.2f})"
+            }
+        )
+        return _analysis_update(state, reused)
+
+    prompt = load_chat_prompt(
+        "play", SCENE_ANALYSIS_PROMPT_FILE, SCENE_ANALYSIS_HUMAN_TEMPLATE
+    )
+    config: RunnableConfig = {"run_name": f"SceneAnalysis_{APP_ENV}"}
+
+    async def _remember(analysis: SceneAnalysis) -> SceneAnalysis:
+        await scene_analysis_cache.set(cache_key, analysis)
+        await similar_scene_index.add(
+            cache_key, state.request.story, scene_context, analysis
+        )
+        return analysis
+
+    backfills = _analysis_backfills.get()
+    if (
+        SCENE_ANALYSIS_EARLY_ROUTE in ("backfill", "cancel")
+        and backfills is not None
+        and isinstance(state.llm, NarrativeChatModel)
+    ):
+        # 라우팅에는 phase_type만 필요하므로 스트리밍 JSON에서 그 값이 확정되는 즉시 다음 노드로 진행
+        llm_instance = state.llm.with_structured_output(
+            SceneAnalysis,
+            early_field="phase_type",
+            cancel_rest=SCENE_ANALYSIS_EARLY_ROUTE == "cancel",
+        )
+        early: EarlyStructuredOutput = await (prompt | llm_instance).ainvoke(
+            {"story": state.request.story}, config
+        )
+        provisional = SceneAnalysis(
+            phase_type=early.value, reason=EARLY_ROUTE_REASON, confidence=0.0
+        )
+        backfills.append(asyncio.create_task(_backfill_analysis(early, _remember)))
+        return _analysis_update(state, provisional)
+
     llm_instance = state.llm.with_structured_output(SceneAnalysis)
     chain = prompt | llm_instance
-    config: RunnableConfig = {"run_name": f"SceneAnalysis_{APP_ENV}"}
 
     analysis = await chain.ainvoke({"story": state.request.story}, config)
+    await _remember(analysis)
 
-    logs = state.logs[:]
-    logs.append(f"분석된 플레이 유형: {analysis.phase_type}")
-    logs.append(f"사유: {analysis.reason}")
-    logs.append(f"분석 확신도: {analysis.confidence}")
-    rule(f"분석된 플레이 유형: {analysis.phase_type}")
-    rule(f"분석 근거: {analysis.reason}")
-    rule(f"분석 확신도: {analysis.confidence}")
+    return _analysis_update(state, analysis)
 
-    return {"analysis": analysis, "logs": logs}
+
+async def _backfill_analysis(
+    early: EarlyStructuredOutput, remember
+) -> SceneAnalysis | None:
+    """조기 라우팅 뒤 나머지 필드까지 받은 분석 결과를 캐시에 저장하고 반환합니다. 생성을 중단했으면 None."""
+    analysis = await early.result
+    if analysis is None:
+        return None
+    return await remember(analysis)
 
 
 async def fetch_world_data_node(state: PlaySessionState) -> Dict[str, Any]:
@@ -172,12 +332,7 @@ async def fetch_world_data_node(state: PlaySessionState) -> Dict[str, Any]:
 
     world_service: WorldService = state.world_service
 
-    world_data = await world_service.get_world(include_keys=[WorldInfoKey.LOCALES])
-    locales = world_data.get("locales", []) or []
-    locale = next(
-        (loc for loc in locales if loc.get("locale_id") == state.request.locale_id),
-        None,
-    )
+    locale = await world_service.get_locale(state.request.locale_id)
     if locale:
         rule(
             f"장소: {locale.get('name')} | 식별번호: {locale.get('locale_id')} | {locale.get('description')}"
@@ -185,4 +340,4 @@ async def fetch_world_data_node(state: PlaySessionState) -> Dict[str, Any]:
     else:
         rule(f"장소 정보를 찾을 수 없습니다. (ID: {state.request.locale_id})")
 
-    return {"세계 정보": world_data, "logs": logs}
+    return {"world_data": {"locale": locale}, "logs": logs}
@@ -0,0 +1,144 @@
+import json
+import math
+import os
+import random
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from domains.play.dtos.play_dtos import PhaseType
+from utils.logger import logger
+
+WEIGHTS_PATH = os.path.join(os.path.dirname(__file__), "phase_classifier_weights.json")
+NGRAM_RANGE = (1, 3)
+
+
+def _normalize(text: str) -> str:
+    return " " + re.sub(r"\s+", " ", str(text).strip().lower()) + " "
+
+
+def extract_ngrams(text: str) -> List[str]:
+    """공백 경계를 포함한 문자 n-gram 집합(중복 제거)을 반환합니다."""
+    normalized = _normalize(text)
+    grams = set()
+    for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+        for i in range(len(normalized) - n + 1):
+            grams.add(normalized[i : i + n])
+    grams.discard(" ")
+    return list(grams)
+
+
+class PhaseClassifier:
+    """
+    문자 n-gram 특징을 쓰는 다중 클래스 로지스틱 회귀(softmax) 장면 분류기입니다.
+    CPU 사전 조회와 덧셈만으로 추론하므로 장면당 수십 μs 안에 끝납니다.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[PhaseType],
+        weights: Dict[str, List[float]],
+        bias: List[float],
+    ):
+        self.labels = list(labels)
+        self.weights = weights
+        self.bias = bias
+
+    def predict_proba(self, text: str) -> Dict[PhaseType, float]:
+        grams = [g for g in extract_ngrams(text) if g in self.weights]
+        return dict(zip(self.labels, self._proba(grams)))
+
+    def _proba(self, grams: List[str]) -> List[float]:
+        # 문장 길이에 따라 점수 크기가 달라지지 않도록 특징 벡터를 L2 정규화(1/sqrt(n))합니다.
+        scale = 1.0 / math.sqrt(len(grams)) if grams else 0.0
+        scores = list(self.bias)
+        for gram in grams:
+            for k, w in enumerate(self.weights[gram]):
+                scores[k] += w * scale
+        top = max(scores)
+        exps = [math.exp(s - top) for s in scores]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+    def predict(self, text: str) -> Tuple[PhaseType, float]:
+        proba = self.predict_proba(text)
+        label = max(proba, key=proba.get)
+        return label, proba[label]
+
+    @classmethod
+    def train(
+        cls,
+        samples: Iterable[Tuple[str, PhaseType]],
+        epochs: int = 20,
+        learning_rate: float = 0.5,
+        l2: float = 1e-4,
+        min_count: int = 2,
+        seed: int = 42,
+    ) -> "PhaseClassifier":
+        """(문장, 페이즈) 목록으로 SGD 학습합니다. 두 번 미만 등장한 n-gram은 버립니다."""
+        labels = list(PhaseType)
+        index = {label: k for k, label in enumerate(labels)}
+        data = [(extract_ngrams(text), index[label]) for text, label in samples]
+
+        counts = Counter(gram for grams, _ in data for gram in grams)
+        vocab = {gram for gram, count in counts.items() if count >= min_count}
+        data = [([g for g in grams if g in vocab], y) for grams, y in data]
+
+        weights = {gram: [0.0] * len(labels) for gram in vocab}
+        bias = [0.0] * len(labels)
+        model = cls(labels, weights, bias)
+
+        rng = random.Random(seed)
+        for epoch in range(epochs):
+            rng.shuffle(data)
+            lr = learning_rate / (1 + epoch * 0.2)
+            for grams, y in data:
+                proba = model._proba(grams)
+                scale = 1.0 / math.sqrt(len(grams)) if grams else 0.0
+                for k in range(len(labels)):
+                    grad = proba[k] - (1.0 if k == y else 0.0)
+                    bias[k] -= lr * grad
+                    step = lr * grad * scale
+                    for gram in grams:
+                        row = weights[gram]
+                        row[k] -= step + lr * l2 * row[k]
+        return model
+
+    def save(self, path: str = WEIGHTS_PATH, precision: int = 2):
+        """가중치를 JSON으로 저장합니다. 반올림 후 0이 되는 n-gram은 생략합니다."""
+        weights = {}
+        for gram, row in sorted(self.weights.items()):
+            rounded = [round(w, precision) for w in row]
+            if any(rounded):
+                weights[gram] = rounded
+        payload = {
+            "labels": [label.value for label in self.labels],
+            "ngram_range": list(NGRAM_RANGE),
+            "bias": [round(b, precision) for b in self.bias],
+            "weights": weights,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str = WEIGHTS_PATH) -> "PhaseClassifier":
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        return cls(
+            [PhaseType(label) for label in payload["labels"]],
+            payload["weights"],
+            payload["bias"],
+        )
+
+
+@lru_cache(maxsize=1)
+def get_phase_classifier() -> Optional[PhaseClassifier]:
+    """배포된 가중치를 처음 사용할 때 한 번만 읽습니다. 가중치 파일이 없으면 None(항상 LLM 사용)입니다."""
+    try:
+        return PhaseClassifier.load()
+    except FileNotFoundError:
+        logger.warning(
+            f"⚠️ 장면 분류기 가중치 파일이 없어 LLM 분석만 사용합니다: {WEIGHTS_PATH}"
+        )
+        return None
@@ -57,7 +57,7 @@ async def calculate_player_combat_item_effect(
     resolved_numeric_ids: set[str] = set()
     if numeric_item_ids:
         items, _ = await item_service.get_items(
-            item_ids=list(set(numeric_item_ids)), skip=0, limit=100
+            item_ids=list(set(numeric_item_ids)), skip=0, limit=100, with_count=False
         )
         for db_item in items:
             if is_combat_item_type(db_item.get("type")):
@@ -3,6 +3,7 @@ from typing import Any, List, Optional, Set
 
 from domains.play.dtos.play_dtos import PlaySessionState, RelationType
 from utils.logger import rule
+from utils.stream_events import emit_event
 
 
 def normalize_for_match(value: str) -> str:
@@ -103,4 +104,5 @@ async def determine_target_enemy(
             logs.append(no_enemies_log)
             rule(no_enemies_log)
 
+    emit_event("target_enemy", {"enemy_state_ids": sorted(enemy_state_ids)})
     return enemy_state_ids
@@ -26,7 +26,7 @@ async def get_enemy_combat_info(
 
     enemy_rdb_ids = list(set([e.entity_id for e in enemies if e.entity_id is not None]))
     enemies_data, _ = await enemy_service.get_enemies(
-        enemy_ids=enemy_rdb_ids, skip=0, limit=100
+        enemy_ids=enemy_rdb_ids, skip=0, limit=100, with_count=False
     )
     enemy_details_map = {e["enemy_id"]: e for e in enemies_data}
 
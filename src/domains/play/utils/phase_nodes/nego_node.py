@@ -71,7 +71,7 @@ async def nego_node(state: PlaySessionState) -> Dict[str, Any]:
     # 4. 흥정 성공 처리
     if dice_result.is_success and item_map:
         item_data, _ = await item_service.get_items(
-            item_ids=list(item_map.keys()), skip=0, limit=1
+            item_ids=list(item_map.keys()), skip=0, limit=1, with_count=False
         )
 
         if item_data:
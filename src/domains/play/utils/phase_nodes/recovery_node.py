@@ -81,7 +81,7 @@ async def recovery_node(state: PlaySessionState) -> Dict[str, Any]:
     resolved_numeric_ids: set[str] = set()
     if numeric_item_ids:
         items, _ = await item_service.get_items(
-            item_ids=list(set(numeric_item_ids)), skip=0, limit=100
+            item_ids=list(set(numeric_item_ids)), skip=0, limit=100, with_count=False
         )
         for item in items:
             if not _is_potion_item(item.get("name"), item.get("type")):
@@ -0,0 +1,53 @@
+import hashlib
+from typing import Any
+
+from configs.setting import (
+    SCENE_ANALYSIS_CACHE_SIZE,
+    SCENE_ANALYSIS_CACHE_TTL,
+    SCENE_ANALYSIS_CACHE_VERSION,
+)
+from domains.play.dtos.play_dtos import SceneAnalysis
+from utils.two_tier_cache import TwoTierCache
+
+
+def model_tag(llm: Any) -> str:
+    """캐시 키에 넣을 모델 식별자. 모델 이름이나 temperature가 바뀌면 다른 키가 됩니다."""
+    name = getattr(llm, "model_name", None) or getattr(llm, "model", None) or ""
+    temperature = getattr(llm, "temperature", "")
+    return f"{type(llm).__name__}:{name}:{temperature}"
+
+
+class SceneAnalysisCache(TwoTierCache):
+    """
+    LLM 장면 분석(SceneAnalysis) 결과의 완전 일치 캐시입니다.
+
+    - 1차: 프로세스 내 LRU, 2차: Redis(TTL). Redis는 lifespan에서 연결하며, 없으면 1차만 사용합니다.
+    - 키는 공백을 정규화한 스토리 + 시스템 프롬프트 + 모델 식별자 + SCENE_ANALYSIS_CACHE_VERSION의 해시라서,
+      instruction.md나 모델이 바뀌면 이전 항목은 더 이상 조회되지 않고 TTL로 사라집니다.
+    - Redis 오류는 캐시 미스로 취급해 분석 요청을 실패시키지 않습니다.
+    """
+
+    REDIS_PREFIX = "scene_analysis:"
+    NAME = "장면 분석 캐시"
+
+    def __init__(
+        self,
+        maxsize: int = SCENE_ANALYSIS_CACHE_SIZE,
+        ttl: int = SCENE_ANALYSIS_CACHE_TTL,
+    ):
+        super().__init__(maxsize, ttl)
+
+    @staticmethod
+    def make_key(story: str, prompt: str, model: str) -> str:
+        normalized_story = " ".join(str(story).split())
+        raw = "\0".join([SCENE_ANALYSIS_CACHE_VERSION, model, prompt, normalized_story])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _encode(self, analysis: SceneAnalysis) -> str:
+        return analysis.model_dump_json()
+
+    def _decode(self, raw: str) -> SceneAnalysis:
+        return SceneAnalysis.model_validate_json(raw)
+
+
+scene_analysis_cache = SceneAnalysisCache()
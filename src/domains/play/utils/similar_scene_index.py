@@ -0,0 +1,198 @@
+import hashlib
+import json
+import random
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from configs.setting import (
+    SIMILAR_SCENE_INDEX_SIZE,
+    SIMILAR_SCENE_THRESHOLD,
+)
+from domains.play.dtos.play_dtos import SceneAnalysis
+from utils.logger import logger
+from utils.timing import timed
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240611)
+# 고정 시드의 범용 해시 계수: 프로세스가 달라도 같은 서명이 나와야 Redis에 저장한 서명을 재사용할 수 있음
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)
+]
+
+
+def _shingles(text: str) -> Set[int]:
+    normalized = " ".join(str(text).split())
+    if len(normalized) < SHINGLE_SIZE:
+        grams = {normalized}
+    else:
+        grams = {
+            normalized[i : i + SHINGLE_SIZE]
+            for i in range(len(normalized) - SHINGLE_SIZE + 1)
+        }
+    return {
+        int.from_bytes(
+            hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for g in grams
+    }
+
+
+def minhash(text: str) -> Tuple[int, ...]:
+    """문자 3-gram 집합의 MinHash 서명. 두 서명의 일치 비율이 Jaccard 유사도의 추정치입니다."""
+    shingles = _shingles(text)
+    return tuple(min((a * x + b) % _PRIME for x in shingles) for a, b in _PERMUTATIONS)
+
+
+def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / NUM_PERM
+
+
+def context_key(prompt: str, model: str) -> str:
+    """프롬프트·모델이 다르면 같은 스토리라도 재사용하지 않도록 항목을 구분하는 키입니다."""
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()[:16]
+
+
+class SimilarSceneIndex:
+    """
+    이전에 LLM으로 분석한 스토리의 MinHash 서명을 밴드 LSH로 색인해,
+    이름이나 문장 일부만 다른 장면의 SceneAnalysis를 재사용합니다.
+
+    - 후보는 16개 밴드(밴드당 4행) 중 하나라도 일치하는 항목이고, 추정 유사도가 threshold 이상일 때만 채택합니다.
+    - 항목 수는 maxsize로 제한하며 가장 오래 쓰이지 않은 항목부터 제거합니다.
+    - redis를 연결하면 추가된 항목을 리스트로 저장해 재시작 후 load()로 복원합니다.
+    """
+
+    REDIS_KEY = "similar_scene_index"
+
+    def __init__(
+        self,
+        maxsize: int = SIMILAR_SCENE_INDEX_SIZE,
+        threshold: float = SIMILAR_SCENE_THRESHOLD,
+    ):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.redis = None
+        self.hits = 0
+        self.misses = 0
+        # entry_id -> (context, 서명, 분석 결과)
+        self._entries: "OrderedDict[str, Tuple[str, Tuple[int, ...], SceneAnalysis]]" = OrderedDict()
+        # (context, 밴드 번호, 밴드 값) -> entry_id 집합
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Set[str]] = {}
+
+    @staticmethod
+    def _bands(signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(b, signature[b * ROWS : (b + 1) * ROWS]) for b in range(BANDS)]
+
+    def _insert(
+        self,
+        entry_id: str,
+        context: str,
+        signature: Tuple[int, ...],
+        analysis: SceneAnalysis,
+    ):
+        if entry_id in self._entries:
+            self._entries.move_to_end(entry_id)
+            return
+        self._entries[entry_id] = (context, signature, analysis)
+        for band, values in self._bands(signature):
+            self._buckets.setdefault((context, band, values), set()).add(entry_id)
+        while len(self._entries) > self.maxsize:
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        entry_id, (context, signature, _) = self._entries.popitem(last=False)
+        for band, values in self._bands(signature):
+            bucket = self._buckets.get((context, band, values))
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[(context, band, values)]
+
+    def lookup(self, story: str, context: str) -> Optional[Tuple[SceneAnalysis, float]]:
+        """가장 유사한 항목의 분석 결과와 유사도를 반환합니다. 임계값 미만이면 None입니다."""
+        if self.threshold > 1 or not self._entries:
+            return None
+
+        signature = minhash(story)
+        candidates: Set[str] = set()
+        for band, values in self._bands(signature):
+            candidates |= self._buckets.get((context, band, values), set())
+
+        best_id, best_score = None, 0.0
+        for entry_id in candidates:
+            score = similarity(signature, self._entries[entry_id][1])
+            if score > best_score:
+                best_id, best_score = entry_id, score
+
+        if best_id is None or best_score < self.threshold:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(best_id)
+        self.hits += 1
+        return self._entries[best_id][2], best_score
+
+    async def add(
+        self, entry_id: str, story: str, context: str, analysis: SceneAnalysis
+    ):
+        if self.threshold > 1:
+            return
+        signature = minhash(story)
+        self._insert(entry_id, context, signature, analysis)
+        if self.redis is None:
+            return
+        record = json.dumps(
+            {
+                "id": entry_id,
+                "context": context,
+                "signature": list(signature),
+                "analysis": analysis.model_dump(mode="json"),
+            },
+            ensure_ascii=False,
+        )
+        try:
+            with timed("redis"):
+                await self.redis.lpush(self.REDIS_KEY, record)
+                await self.redis.ltrim(self.REDIS_KEY, 0, self.maxsize - 1)
+        except Exception as e:
+            logger.warning(f"⚠️ 유사 장면 색인(Redis) 저장 실패: {e}")
+
+    async def load(self):
+        """Redis에 저장된 최근 항목으로 색인을 채웁니다. 오래된 항목부터 넣어 최근 항목이 LRU 뒤쪽에 오도록 합니다."""
+        if self.redis is None:
+            return
+        try:
+            records = await self.redis.lrange(self.REDIS_KEY, 0, self.maxsize - 1)
+        except Exception as e:
+            logger.warning(f"⚠️ 유사 장면 색인(Redis) 복원 실패: {e}")
+            return
+        for raw in reversed(records):
+            record = json.loads(raw)
+            self._insert(
+                record["id"],
+                record["context"],
+                tuple(record["signature"]),
+                SceneAnalysis.model_validate(record["analysis"]),
+            )
+        logger.info(f"✅ 유사 장면 색인 복원: {len(self._entries)}건")
+
+    def clear(self):
+        self._entries.clear()
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+similar_scene_index = SimilarSceneIndex()
@@ -1,4 +1,4 @@
-from psycopg2 import IntegrityError
+from psycopg import IntegrityError
 
 from domains.scenario.dtos.scenario_dtos import (
     EnemyCreateRequest,
@@ -9,6 +9,7 @@ from domains.scenario.dtos.scenario_dtos import (
 )
 from utils.load_sql import load_sql
 from utils.logger import error
+from utils.master_data_cache import master_data_cache
 
 
 class ScenarioService:
@@ -25,25 +26,26 @@ class ScenarioService:
             item_dict = request.model_dump()
             item_dict["type"] = request.type.value  # Enum을 문자열로 변환
 
-            self.cursor.execute(self.add_item_sql, item_dict)
-            result = self.cursor.fetchone()
+            await self.cursor.execute(self.add_item_sql, item_dict)
+            result = await self.cursor.fetchone()
 
             if not result:
                 raise ValueError("아이템 저장 후 ID를 반환받지 못했습니다.")
 
             # 3. 성공 시 커밋
-            self.cursor.commit()
+            await self.cursor.commit()
+            await master_data_cache.invalidate_and_notify(self.cursor)
             return result["item_id"]
 
         except IntegrityError as e:
-            self.cursor.rollback()
+            await self.cursor.rollback()
             if "already exists" in str(e):
                 raise ValueError(f"이미 존재하는 아이템 이름입니다: {request.name}")
             raise ValueError(f"데이터 무결성 오류가 발생했습니다: {str(e)}")
 
         except Exception as e:
             if self.cursor:
-                self.cursor.rollback()
+                await self.cursor.rollback()
             error(f"[시나리오 서비스 오류] {e}")
             raise e
 
@@ -51,25 +53,26 @@ class ScenarioService:
         try:
             item_dict = request.model_dump()
 
-            self.cursor.execute(self.add_enemy_sql, item_dict)
-            result = self.cursor.fetchone()
+            await self.cursor.execute(self.add_enemy_sql, item_dict)
+            result = await self.cursor.fetchone()
 
             if not result:
                 raise ValueError("아이템 저장 후 ID를 반환받지 못했습니다.")
 
             # 3. 성공 시 커밋
-            self.cursor.commit()
+            await self.cursor.commit()
+            await master_data_cache.invalidate_and_notify(self.cursor)
             return result["enemy_id"]
 
         except IntegrityError as e:
-            self.cursor.rollback()
+            await self.cursor.rollback()
             if "already exists" in str(e):
                 raise ValueError(f"이미 존재하는 적 이름입니다: {request.name}")
             raise ValueError(f"데이터 무결성 오류가 발생했습니다: {str(e)}")
 
         except Exception as e:
             if self.cursor:
-                self.cursor.rollback()
+                await self.cursor.rollback()
             error(f"[시나리오 서비스 오류] {e}")
             raise e
 
@@ -77,19 +80,20 @@ class ScenarioService:
         try:
             drop_data = request.model_dump()
 
-            self.cursor.execute(self.add_enemy_drop_sql, drop_data)
-            result = self.cursor.fetchone()
+            await self.cursor.execute(self.add_enemy_drop_sql, drop_data)
+            result = await self.cursor.fetchone()
 
             if not result:
                 raise ValueError("드롭 정보 저장 후 ID를 반환받지 못했습니다.")
 
             # 3. 성공 시 커밋
-            self.cursor.commit()
+            await self.cursor.commit()
+            await master_data_cache.invalidate_and_notify(self.cursor)
             return result["drop_id"]
 
         except IntegrityError as e:
             # 외래키 제약 조건 위반 처리 (enemy_id나 item_id가 없을 때)
-            self.cursor.rollback()
+            await self.cursor.rollback()
             error_msg = str(e)
             if 'is not present in table "enemies"' in error_msg:
                 raise ValueError(f"존재하지 않는 적(ID: {request.enemy_id})입니다.")
@@ -101,7 +105,7 @@ class ScenarioService:
         except Exception as e:
             # 기타 시스템 에러 발생 시 롤백
             if self.cursor:
-                self.cursor.rollback()
+                await self.cursor.rollback()
             error(f"[시나리오 서비스 오류] {e}")
             raise e
 
@@ -109,42 +113,44 @@ class ScenarioService:
         try:
             item_dict = request.model_dump()
 
-            self.cursor.execute(self.add_npc_sql, item_dict)
-            result = self.cursor.fetchone()
+            await self.cursor.execute(self.add_npc_sql, item_dict)
+            result = await self.cursor.fetchone()
 
             if not result:
                 raise ValueError("아이템 저장 후 ID를 반환받지 못했습니다.")
 
             # 3. 성공 시 커밋
-            self.cursor.commit()
+            await self.cursor.commit()
+            await master_data_cache.invalidate_and_notify(self.cursor)
             return result["npc_id"]
 
         except IntegrityError as e:
-            self.cursor.rollback()
+            await self.cursor.rollback()
             if "already exists" in str(e):
                 raise ValueError(f"이미 존재하는 NPC 이름입니다: {request.name}")
             raise ValueError(f"데이터 무결성 오류가 발생했습니다: {str(e)}")
 
         except Exception as e:
             if self.cursor:
-                self.cursor.rollback()
+                await self.cursor.rollback()
             error(f"[시나리오 서비스 오류] {e}")
             raise e
 
     async def add_npc_inventory(self, request: NpcInventoryCreateRequest) -> int:
         try:
             data = request.model_dump()
-            self.cursor.execute(self.add_npc_inventory_sql, data)
-            result = self.cursor.fetchone()
+            await self.cursor.execute(self.add_npc_inventory_sql, data)
+            result = await self.cursor.fetchone()
 
             if not result:
                 raise ValueError("NPC 인벤토리 저장 후 ID를 반환받지 못했습니다.")
 
-            self.cursor.commit()
+            await self.cursor.commit()
+            await master_data_cache.invalidate_and_notify(self.cursor)
             return result["inventory_id"]
 
         except IntegrityError as e:
-            self.cursor.rollback()
+            await self.cursor.rollback()
             error_msg = str(e)
             if "npcs" in error_msg:
                 raise ValueError(f"존재하지 않는 NPC(ID: {request.npc_id})입니다.")
@@ -153,5 +159,5 @@ class ScenarioService:
             raise ValueError(f"데이터 무결성 오류: {error_msg}")
         except Exception as e:
             if self.cursor:
-                self.cursor.rollback()
+                await self.cursor.rollback()
             raise e
@@ -1,5 +1,6 @@
 -- name: count_sessions
--- 전체 개수 조회 (페이지네이션 계산용)
+-- 전체 개수 조회 (페이지네이션 계산용, get_sessions와 같은 조건)
 SELECT COUNT(*)
 FROM user_sessions
-WHERE user_id = %(user_id)s;
\ No newline at end of file
+WHERE user_id = %(user_id)s
+  AND (%(is_deleted)s::boolean IS TRUE OR is_deleted = FALSE);
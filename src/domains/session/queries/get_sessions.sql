@@ -7,6 +7,8 @@ FROM user_sessions
 WHERE user_id = %(user_id)s
   -- is_deleted가 True이면 뒤의 조건과 상관없이 항상 참(전체 조회)
   -- is_deleted가 False이면 실제 컬럼의 is_deleted = False인 것만 조회
-  AND (%(is_deleted)s IS TRUE OR is_deleted = FALSE)
+  AND (%(is_deleted)s::boolean IS TRUE OR is_deleted = FALSE)
+  -- 커서 모드: 마지막으로 본 ID 다음부터 조회 (NULL이면 처음부터)
+  AND session_id > COALESCE(%(after_id)s::text, '')
 ORDER BY session_id ASC
 LIMIT %(limit)s OFFSET %(skip)s;
@@ -0,0 +1,12 @@
+-- name: get_sessions_with_count
+-- 세션 목록 조회 + 전체 개수(윈도우 집계)를 한 번의 쿼리로 조회
+SELECT
+    user_id,
+    session_id,
+    created_at,
+    COUNT(*) OVER() AS full_count
+FROM user_sessions
+WHERE user_id = %(user_id)s
+  AND (%(is_deleted)s::boolean IS TRUE OR is_deleted = FALSE)
+ORDER BY session_id ASC
+LIMIT %(limit)s OFFSET %(skip)s;
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi_utils.cbv import cbv
 
@@ -30,11 +32,15 @@ class SessionRouter:
         is_deleted: bool = Query(
             False, description="삭제된 세션 포함 여부 (true: 삭제됨, false: 활성 상태)"
         ),
+        cursor: Optional[str] = Query(
+            None,
+            description="이전 응답의 meta.next_cursor. 지정하면 skip 대신 커서 기준으로 다음 페이지를 조회합니다.",
+        ),
         session_service: SessionService = Depends(get_session_service),
     ):
         try:
             sessions, meta = await session_service.get_user_sessions(
-                user_id, skip, limit, is_deleted
+                user_id, skip, limit, is_deleted, page_cursor=cursor
             )
 
             return {"data": {"sessions": sessions, "meta": meta}}
@@ -1,7 +1,13 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from common.dtos.pagination_meta import PaginationMeta
+from common.utils.pagination import (
+    build_cursor_page,
+    build_pagination_meta,
+    decode_cursor,
+    split_full_count,
+)
 from domains.session.dtos.session_dtos import (
     SessionRequest,
     SessionResponse,
@@ -22,6 +28,9 @@ class SessionService:
     def __init__(self, cursor):
         self.cursor = cursor
         self.get_sessions_sql = load_sql("session", "get_sessions")
+        self.get_sessions_with_count_sql = load_sql(
+            "session", "get_sessions_with_count"
+        )
         self.count_sessions_sql = load_sql("session", "count_sessions")
         self.insert_session_sql = load_sql("session", "insert_session")
         self.del_session_by_session_id_sql = load_sql(
@@ -29,22 +38,55 @@ class SessionService:
         )
 
     async def get_user_sessions(
-        self, user_id: int, skip: int, limit: int, is_deleted: bool = False
-    ) -> tuple[List[SessionResponse], PaginationMeta]:
+        self,
+        user_id: int,
+        skip: int,
+        limit: int,
+        is_deleted: bool = False,
+        with_count: bool = True,
+        page_cursor: Optional[str] = None,
+    ) -> tuple[List[SessionResponse], Optional[PaginationMeta]]:
+        """
+        유저의 세션 목록을 조회합니다.
+        with_count=False면 전체 개수 집계를 생략하고 페이지네이션 메타 대신 None을 반환합니다.
+        page_cursor를 넘기면 skip 대신 마지막으로 본 session_id 다음부터 읽는 커서(keyset) 모드로 동작합니다.
+        """
         params = {
             "user_id": user_id,
             "skip": skip,
             "limit": limit,
             "is_deleted": is_deleted,
+            "after_id": None,
         }
 
+        if page_cursor is not None:
+            # 커서 모드: 다음 페이지 존재 여부를 알기 위해 한 행을 더 조회
+            params.update(
+                after_id=decode_cursor(page_cursor, str), limit=limit + 1, skip=0
+            )
+
         try:
-            self.cursor.execute(self.count_sessions_sql, params)
-            count_result = self.cursor.fetchone()
-            total_count = count_result["count"] if count_result else 0
+            if page_cursor is not None:
+                await self.cursor.execute(self.get_sessions_sql, params)
+                return build_cursor_page(
+                    await self.cursor.fetchall(), limit, "session_id"
+                )
+
+            if not with_count:
+                await self.cursor.execute(self.get_sessions_sql, params)
+                return await self.cursor.fetchall(), None
 
-            self.cursor.execute(self.get_sessions_sql, params)
-            sessions = self.cursor.fetchall()
+            # 데이터 목록 + 전체 개수(COUNT(*) OVER()) 조회
+            await self.cursor.execute(self.get_sessions_with_count_sql, params)
+            sessions, total_count = split_full_count(await self.cursor.fetchall())
+
+            if total_count is None:
+                # 빈 페이지에서는 윈도우 집계 값을 얻을 수 없으므로, skip이 범위를 벗어난 경우에만 개수를 따로 조회
+                total_count = 0
+                if skip > 0:
+                    await self.cursor.execute(self.count_sessions_sql, params)
+                    count_result = await self.cursor.fetchone()
+                    total_count = count_result["count"] if count_result else 0
         except Exception as exc:
             if not _is_missing_user_sessions_table(exc):
                 raise
@@ -54,19 +96,13 @@ class SessionService:
             )
             total_count = 0
             sessions = []
+            if page_cursor is not None:
+                return build_cursor_page(sessions, limit, "session_id")
+            if not with_count:
+                return sessions, None
 
-        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
-        is_last_page = (skip + limit) >= total_count
-
-        meta = PaginationMeta(
-            total_count=total_count,
-            skip=skip,
-            limit=limit,
-            is_last_page=is_last_page,
-            total_pages=total_pages,
-        )
-
-        return sessions, meta
+        last_id = sessions[-1]["session_id"] if sessions else None
+        return sessions, build_pagination_meta(total_count, skip, limit, last_id)
 
     async def add_user_session(self, request: SessionRequest) -> SessionResponse:
         params = {
@@ -74,8 +110,8 @@ class SessionService:
             "session_id": request.session_id,
         }
         try:
-            self.cursor.execute(self.insert_session_sql, params)
-            self.cursor.connection.commit()
+            await self.cursor.execute(self.insert_session_sql, params)
+            await self.cursor.commit()
         except Exception as exc:
             if not _is_missing_user_sessions_table(exc):
                 raise
@@ -93,8 +129,8 @@ class SessionService:
     async def del_user_session(self, request: SessionRequest) -> str:
         params = {"session_id": request.session_id}
         try:
-            self.cursor.execute(self.del_session_by_session_id_sql, params)
-            self.cursor.connection.commit()
+            await self.cursor.execute(self.del_session_by_session_id_sql, params)
+            await self.cursor.commit()
         except Exception as exc:
             if not _is_missing_user_sessions_table(exc):
                 raise
@@ -17,16 +17,16 @@ class UserService:
         self.del_user_sql = load_sql("user", "delete_user")
 
     async def get_user(self, user_id: int) -> UserInfo | None:
-        self.cursor.execute(self.get_user_sql, (user_id,))
-        user_data = self.cursor.fetchone()
+        await self.cursor.execute(self.get_user_sql, (user_id,))
+        user_data = await self.cursor.fetchone()
 
         if user_data:
             return UserInfo(**user_data)
         return None
 
     async def create_user(self, request: UserCreateRequest) -> UserInfo:
-        self.cursor.execute(self.add_user_sql, request.model_dump())
-        user_data = self.cursor.fetchone()
+        await self.cursor.execute(self.add_user_sql, request.model_dump())
+        user_data = await self.cursor.fetchone()
 
         if user_data:
             return UserInfo(**user_data)
@@ -34,16 +34,16 @@ class UserService:
         raise Exception("회원 가입에 실패했습니다.")
 
     async def update_user(self, request: UserUpdateRequest) -> UserInfo | None:
-        self.cursor.execute(self.update_user_sql, request.model_dump())
-        user_data = self.cursor.fetchone()
+        await self.cursor.execute(self.update_user_sql, request.model_dump())
+        user_data = await self.cursor.fetchone()
 
         if user_data:
             return UserInfo(**user_data)
         return None
 
     async def update_user_password(self, request: UserPWUpdateRequest) -> int | None:
-        self.cursor.execute(self.update_user_password_sql, request.model_dump())
-        user_data = self.cursor.fetchone()
+        await self.cursor.execute(self.update_user_password_sql, request.model_dump())
+        user_data = await self.cursor.fetchone()
 
         if user_data:
             return user_data["user_id"]
@@ -51,8 +51,8 @@ class UserService:
         return None
 
     async def del_user(self, user_id: int) -> int | None:
-        self.cursor.execute(self.del_user_sql, (user_id,))
-        user_data = self.cursor.fetchone()
+        await self.cursor.execute(self.del_user_sql, (user_id,))
+        user_data = await self.cursor.fetchone()
 
         if user_data:
             return user_data["user_id"]
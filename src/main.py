@@ -8,7 +8,7 @@ except ImportError:
     pass
 
 from contextlib import asynccontextmanager
-from typing import Dict
+from typing import Any, Dict
 
 from fastapi import FastAPI, HTTPException, Request, status
 from starlette.middleware.cors import CORSMiddleware
@@ -16,19 +16,27 @@ from starlette.middleware.cors import CORSMiddleware
 from configs.api_routers import API_ROUTERS
 from configs.database import check_db_connection, rdb_tunnel
 from configs.exceptions import init_exception_handlers
+from configs.llm_adapter import llm_single_flight
+from configs.llm_cache import llm_response_cache
+from configs.llm_resilience import endpoint_health, endpoints_stats
+from configs.llm_router import providers_stats
+from configs.llm_scheduler import llm_scheduler
 from configs.redis_conn import check_redis_connection, redis_tunnel
+from domains.play.utils.scene_analysis_cache import scene_analysis_cache
+from domains.play.utils.similar_scene_index import similar_scene_index
 from src.common.dtos.common_response import CustomJSONResponse
 from src.configs.logging_config import LOGGING_CONFIG
 from src.configs.origins import origins
-from src.configs.setting import APP_ENV, APP_PORT, REMOTE_HOST
+from src.configs.setting import APP_ENV, APP_PORT, LLM_GATEWAY_URL, REMOTE_HOST
 from src.utils.lifespan_handlers import shutdown_event_handler, startup_event_handler
 from utils.logger import info
+from utils.master_data_cache import master_data_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 서버가 시작될 때 실행
-    startup_event_handler()
+    await startup_event_handler()
     yield  # 서버가 동작하는 지점
     # 서버가 종료될 때 실행
     await shutdown_event_handler()
@@ -88,10 +96,20 @@ def read_root():
 
 
 @app.get("/health")
-def health_check() -> Dict[str, str]:
-    health_status = {"status": "ok", "db": "connected", "redis": "connected"}
+async def health_check() -> Dict[str, Any]:
+    # 아직 호출이 없어도 기본 게이트웨이 상태가 보이도록 등록
+    endpoint_health(LLM_GATEWAY_URL)
+    health_status = {
+        "status": "ok",
+        "db": "connected",
+        "redis": "connected",
+        # 게이트웨이 회로 상태(closed/open/half_open)는 참고용이며 헬스 체크 실패로 보지 않음
+        "llm_gateway": {
+            url: stats["state"] for url, stats in endpoints_stats().items()
+        },
+    }
     try:
-        check_db_connection()
+        await check_db_connection()
         check_redis_connection()
         return health_status
     except Exception as e:
@@ -102,6 +120,20 @@ def health_check() -> Dict[str, str]:
         )
 
 
+@app.get("/metrics", summary="캐시 적중률 등 런타임 지표를 조회합니다.")
+async def metrics() -> Dict[str, Any]:
+    return {
+        "master_data_cache": master_data_cache.stats(),
+        "scene_analysis_cache": scene_analysis_cache.stats(),
+        "similar_scene_index": similar_scene_index.stats(),
+        "llm_single_flight": llm_single_flight.stats(),
+        "llm_response_cache": llm_response_cache.stats(),
+        "llm_scheduler": llm_scheduler.stats(),
+        "llm_gateway": endpoints_stats(),
+        "llm_providers": providers_stats(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,10 +1,17 @@
 import httpx
 
-from src.configs.database import check_db_connection
+from configs.database import check_db_connection, close_db_pool, open_db_pool
+from configs.llm_cache import llm_response_cache
+from domains.play.utils.scene_analysis_cache import scene_analysis_cache
+from domains.play.utils.similar_scene_index import similar_scene_index
 from src.configs.http_client import http_holder
-from src.configs.redis_conn import check_redis_connection
-from src.configs.setting import APP_PORT
+from src.configs.redis_conn import async_redis_client, check_redis_connection
+from src.configs.setting import APP_PORT, SIMILAR_SCENE_PERSIST
 from src.utils.logger import info, rule
+from utils.master_data_cache import (
+    start_master_data_listener,
+    stop_master_data_listener,
+)
 
 
 def _initialize_http_client():
@@ -22,14 +29,27 @@ def _print_startup_message():
     print("⭐" * 40)
 
 
-def startup_event_handler():
-    check_db_connection()
+async def startup_event_handler():
+    await open_db_pool()
+    await check_db_connection()
     check_redis_connection()
+    scene_analysis_cache.redis = async_redis_client
+    llm_response_cache.redis = async_redis_client
+    if SIMILAR_SCENE_PERSIST:
+        similar_scene_index.redis = async_redis_client
+        await similar_scene_index.load()
+    start_master_data_listener()
     _initialize_http_client()
     _print_startup_message()
 
 
 async def shutdown_event_handler():
+    await stop_master_data_listener()
+    await close_db_pool()
+    scene_analysis_cache.redis = None
+    llm_response_cache.redis = None
+    similar_scene_index.redis = None
+    await async_redis_client.aclose()
     if http_holder.client:
         await http_holder.client.aclose()
         info("HTTP 클라이언트 종료 중...")
@@ -1,17 +1,53 @@
 import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+from langchain_core.prompts import ChatPromptTemplate
+
+SRC_ROOT = Path(os.path.dirname(os.path.abspath(__file__))).parent
+
+
+def _scan_prompts() -> Dict[Tuple[str, str], str]:
+    """
+    src/domains/*/prompts/*.md 파일을 한 번만 읽어 (도메인, 파일명) 키로 등록합니다.
+    """
+    registry = {}
+    for file_path in sorted((SRC_ROOT / "domains").glob("*/prompts/*.md")):
+        domain = file_path.parent.parent.name
+        registry[(domain, file_path.name)] = file_path.read_text(encoding="utf-8")
+    return registry
+
+
+# 프로세스 전역 프롬프트 레지스트리 (import 시점에 1회 스캔)
+PROMPT_REGISTRY: Dict[Tuple[str, str], str] = _scan_prompts()
 
 
 def load_prompt(domain: str, filename: str) -> str:
     """
-    특정 도메인의 prompts 폴더 내의 파일을 읽어옵니다.
+    특정 도메인의 prompts 폴더 내의 파일을 레지스트리에서 가져옵니다.
     경로: src/domains/{domain}/prompts/{filename}
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    src_root = os.path.abspath(os.path.join(current_dir, ".."))
-    file_path = os.path.join(src_root, "domains", domain, "prompts", filename)
+    try:
+        return PROMPT_REGISTRY[(domain, filename)]
+    except KeyError:
+        file_path = SRC_ROOT / "domains" / domain / "prompts" / filename
+        raise FileNotFoundError(
+            f"프롬프트 파일을 찾을 수 없습니다: {file_path}"
+        ) from None
 
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"프롬프트 파일을 찾을 수 없습니다: {file_path}")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return f.read()
+@lru_cache(maxsize=None)
+def load_chat_prompt(
+    domain: str, filename: str, human_template: str = "{input}"
+) -> ChatPromptTemplate:
+    """
+    프롬프트 파일을 system 메시지로, human_template을 사용자 메시지로 하는 ChatPromptTemplate을 1회만 컴파일합니다.
+    ChatPromptTemplate은 불변이라 요청 간에 공유해도 안전합니다.
+    """
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", load_prompt(domain, filename)),
+            ("human", human_template),
+        ]
+    )
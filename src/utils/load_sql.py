@@ -1,17 +1,33 @@
 import os
+from pathlib import Path
+from typing import Dict, Tuple
 
+SRC_ROOT = Path(os.path.dirname(os.path.abspath(__file__))).parent
 
-def load_sql(domain: str, filename: str):
+
+def _scan_queries() -> Dict[Tuple[str, str], str]:
     """
-    특정 도메인의 queries 폴더 내의 SQL 파일을 읽어옵니다.
-    경로: src/domains/{domain}/queries/{filename}
+    src/domains/*/queries/*.sql 파일을 한 번만 읽어 (도메인, 파일명) 키로 등록합니다.
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    src_root = os.path.abspath(os.path.join(current_dir, ".."))
-    file_path = os.path.join(src_root, "domains", domain, "queries", f"{filename}.sql")
+    registry = {}
+    for file_path in sorted((SRC_ROOT / "domains").glob("*/queries/*.sql")):
+        domain = file_path.parent.parent.name
+        registry[(domain, file_path.stem)] = file_path.read_text(encoding="utf-8")
+    return registry
+
+
+# 프로세스 전역 SQL 레지스트리 (import 시점에 1회 스캔)
+SQL_REGISTRY: Dict[Tuple[str, str], str] = _scan_queries()
 
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"SQL 파일을 찾을 수 없습니다: {file_path}.sql")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return f.read()
+def load_sql(domain: str, filename: str):
+    """
+    특정 도메인의 queries 폴더 내의 SQL 파일을 레지스트리에서 가져옵니다.
+    경로: src/domains/{domain}/queries/{filename}
+    - 서비스가 요청마다 생성되더라도 디스크 I/O는 발생하지 않습니다.
+    """
+    try:
+        return SQL_REGISTRY[(domain, filename)]
+    except KeyError:
+        file_path = SRC_ROOT / "domains" / domain / "queries" / f"{filename}.sql"
+        raise FileNotFoundError(f"SQL 파일을 찾을 수 없습니다: {file_path}") from None
@@ -0,0 +1,182 @@
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import psycopg
+
+from configs.database import conninfo
+from configs.setting import MASTER_DATA_CACHE_SIZE, MASTER_DATA_CHANNEL
+from utils.logger import logger
+from utils.single_flight import SingleFlight
+
+
+class MasterDataCache:
+    """
+    아이템/적/NPC/성격/세계관 등 마스터 데이터용 프로세스 전역 read-through 캐시입니다.
+
+    - 마스터 데이터는 /scenario/* 쓰기 API로만 변경되므로, 변경 시점에 버전을 올려 전체를 무효화합니다.
+    - 다른 워커의 변경은 PostgreSQL LISTEN/NOTIFY 채널로 전달받습니다.
+    - 쓰기 API를 거치지 않는 테이블(세계관 등)은 키별 TTL을 지정해 주기적으로 다시 읽습니다.
+    - 캐시된 값은 여러 요청이 공유하므로 호출 측에서 수정하지 않아야 합니다.
+    - 같은 키를 동시에 조회하면 첫 요청만 로더를 실행하고 나머지는 그 결과를 기다립니다(single-flight).
+    - 키에 클라이언트가 정하는 페이지 파라미터가 들어가므로 maxsize를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다(LRU).
+    """
+
+    def __init__(self, maxsize: int = MASTER_DATA_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.instance_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        # key -> (버전, 값, 만료 시각(monotonic) 또는 None)
+        self._store: "OrderedDict[Hashable, Tuple[int, Any, Optional[float]]]" = (
+            OrderedDict()
+        )
+        # 같은 키의 동시 로드를 하나로 합침
+        self._single_flight = SingleFlight()
+
+    def get(self, key: Hashable, default: Any = None):
+        """유효한 캐시 값을 반환하고 적중/실패 횟수를 기록합니다."""
+        entry = self._store.get(key)
+        if entry is not None and entry[0] == self.version:
+            expires_at = entry[2]
+            if expires_at is None or expires_at > time.monotonic():
+                self._store.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._store[key]
+        self.misses += 1
+        return default
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        version: Optional[int] = None,
+    ):
+        """
+        값을 저장합니다. version을 넘기면 조회를 시작한 시점의 버전과 비교해,
+        그 사이 무효화가 있었다면 이전 버전의 값은 저장하지 않습니다.
+        """
+        if version is not None and version != self.version:
+            return
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._store[key] = (self.version, value, expires_at)
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ):
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        # 로드를 시작한 시점의 버전을 기록해 그 사이 무효화되면 저장하지 않음
+        version = self.version
+
+        async def _load():
+            loaded = await loader()
+            self.set(key, loaded, ttl=ttl, version=version)
+            return loaded
+
+        return await self._single_flight.run(key, _load)
+
+    def invalidate(self):
+        self.version += 1
+        self.invalidations += 1
+        self._store.clear()
+        # 진행 중인 조회는 이전 버전 값을 읽고 있을 수 있으므로 새 요청이 합류하지 않게 합니다.
+        self._single_flight.clear()
+
+    async def invalidate_and_notify(self, cursor):
+        """로컬 캐시를 비우고, 같은 DB를 바라보는 다른 워커에게 변경을 알립니다."""
+        self.invalidate()
+        try:
+            await cursor.execute(
+                "SELECT pg_notify(%(channel)s, %(sender)s)",
+                {"channel": MASTER_DATA_CHANNEL, "sender": self.instance_id},
+            )
+            await cursor.fetchone()
+        except Exception as e:
+            # 쓰기는 이미 커밋되었으므로 알림 실패가 요청 실패로 이어지지 않게 합니다.
+            logger.warning(f"⚠️ 마스터 데이터 변경 알림 전송 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "version": self.version,
+            "entries": len(self._store),
+            "maxsize": self.maxsize,
+            "evictions": self.evictions,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+master_data_cache = MasterDataCache()
+
+
+async def listen_master_data_changes(cache: MasterDataCache = master_data_cache):
+    """
+    마스터 데이터 변경 채널을 구독하며 다른 워커의 NOTIFY를 받으면 캐시를 무효화합니다.
+    연결이 끊기면 그 사이 놓친 알림이 있을 수 있으므로 재연결 시 캐시를 한 번 비웁니다.
+    """
+    retry_delay = 1.0
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                conninfo, autocommit=True
+            ) as conn:
+                await conn.execute(f"LISTEN {MASTER_DATA_CHANNEL}")
+                cache.invalidate()
+                retry_delay = 1.0
+                logger.info(
+                    f"✅ 마스터 데이터 변경 채널 구독 시작: {MASTER_DATA_CHANNEL}"
+                )
+                async for notify in conn.notifies():
+                    if notify.payload != cache.instance_id:
+                        cache.invalidate()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"⚠️ 마스터 데이터 변경 채널 연결 끊김, {retry_delay:.0f}초 후 재시도: {e}"
+            )
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30.0)
+
+
+class MasterDataListenerHolder:
+    task: Optional[asyncio.Task] = None
+
+
+listener_holder = MasterDataListenerHolder()
+
+
+def start_master_data_listener():
+    listener_holder.task = asyncio.create_task(listen_master_data_changes())
+
+
+async def stop_master_data_listener():
+    if listener_holder.task:
+        listener_holder.task.cancel()
+        try:
+            await listener_holder.task
+        except asyncio.CancelledError:
+            pass
+        listener_holder.task = None
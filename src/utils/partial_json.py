@@ -0,0 +1,48 @@
+import json
+import re
+from typing import Optional, Tuple
+
+
+def _scan_string_field(text: str, field: str) -> Tuple[Optional[str], bool]:
+    """최상위 문자열 필드의 현재까지 값과, 닫는 따옴표까지 도착했는지 여부를 반환합니다."""
+    match = re.search(rf'"{re.escape(field)}"\s*:\s*"', text)
+    if match is None:
+        return None, False
+
+    raw = []
+    closed = False
+    i = match.end()
+    while i < len(text):
+        ch = text[i]
+        if ch == '"':
+            closed = True
+            break
+        if ch == "\\":
+            # \uXXXX는 6글자, 나머지 이스케이프는 2글자가 모두 도착해야 해석
+            width = 6 if text[i + 1 : i + 2] == "u" else 2
+            if i + width > len(text):
+                break
+            raw.append(text[i : i + width])
+            i += width
+            continue
+        raw.append(ch)
+        i += 1
+
+    return json.loads(f'"{"".join(raw)}"', strict=False), closed
+
+
+def partial_string_field(text: str, field: str) -> Optional[str]:
+    """
+    스트리밍 중인(아직 닫히지 않은) JSON 객체 텍스트에서 최상위 문자열 필드의 현재까지 값을 꺼냅니다.
+
+    - 필드의 여는 따옴표가 아직 오지 않았으면 None을 반환합니다.
+    - 끝이 잘린 이스케이프(예: "\\", "\\u12")는 다음 청크가 올 때까지 제외합니다.
+    - 중첩 객체 안의 같은 이름 필드는 구분하지 않으므로 최상위에만 있는 필드에 사용합니다.
+    """
+    return _scan_string_field(text, field)[0]
+
+
+def closed_string_field(text: str, field: str) -> Optional[str]:
+    """partial_string_field와 같지만, 필드 값의 닫는 따옴표가 도착해 값이 확정된 경우에만 반환합니다."""
+    value, closed = _scan_string_field(text, field)
+    return value if closed else None
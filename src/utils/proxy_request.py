@@ -3,6 +3,7 @@ from fastapi import HTTPException, status
 
 from configs.http_client import http_holder
 from utils.logger import debug
+from utils.timing import timed
 
 
 async def proxy_request(
@@ -33,12 +34,13 @@ async def proxy_request(
         )
 
     try:
-        response = await client.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json,
-        )
+        with timed("proxy"):
+            response = await client.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+            )
 
         if response.status_code >= 400:
             raise HTTPException(
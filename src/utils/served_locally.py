@@ -0,0 +1,29 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+# LLM 호출이 업스트림 요청 없이 처리된 경로("cache", "coalesced") 수집기.
+# 수집 중이 아닐 때는 None이라 mark_served_locally()가 아무 일도 하지 않습니다.
+_local_serves: ContextVar[Optional[List[str]]] = ContextVar(
+    "local_serves", default=None
+)
+
+
+@contextmanager
+def collect_local_serves():
+    """
+    블록 안의 LLM 호출이 응답 캐시 적중이나 합쳐진 호출(single-flight follower)로 처리되었는지 모읍니다.
+    목록이 비어 있지 않으면 측정한 소요 시간은 제공자 응답 시간이 아닙니다.
+    """
+    sources: List[str] = []
+    token = _local_serves.set(sources)
+    try:
+        yield sources
+    finally:
+        _local_serves.reset(token)
+
+
+def mark_served_locally(source: str):
+    sources = _local_serves.get()
+    if sources is not None:
+        sources.append(source)
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    같은 키의 비동기 호출이 동시에 들어오면 첫 호출(leader)만 실행하고
+    나머지(coalesced)는 그 결과나 예외를 함께 받습니다.
+
+    - 결과를 저장하지 않으므로 호출이 끝난 뒤 들어온 요청은 다시 실행합니다.
+    - leader가 취소되면 기다리던 호출 중 하나가 새 leader가 되어 다시 실행합니다.
+    - 기다리던 호출이 취소되어도 leader 실행에는 영향을 주지 않습니다.
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.coalesced = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                self.coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.leaders += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 호출이 없어도 "never retrieved" 경고가 남지 않도록 소비
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def clear(self):
+        """
+        진행 중인 호출을 목록에서 떼어내 이후 들어오는 호출이 합류하지 않고 새로 실행하게 합니다.
+        이미 기다리던 호출은 원래 leader의 결과를 그대로 받습니다.
+        """
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.leaders + self.coalesced
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,45 @@
+import asyncio
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional, Tuple
+
+from pydantic import BaseModel
+
+# 스트리밍 응답 중일 때만 설정되는 (이벤트 이름, 데이터) 큐.
+# 평소에는 None이라 emit_event()가 아무 일도 하지 않습니다.
+# 랭그래프 노드 태스크로 컨텍스트가 복사되어도 같은 큐를 가리키므로 모든 노드의 이벤트가 한곳에 모입니다.
+_events: ContextVar[Optional[asyncio.Queue]] = ContextVar("stream_events", default=None)
+
+
+@contextmanager
+def collect_stream_events(queue: asyncio.Queue):
+    """블록 안에서(또는 블록 안에서 만든 태스크에서) 발생한 이벤트를 queue로 보냅니다."""
+    token = _events.set(queue)
+    try:
+        yield queue
+    finally:
+        _events.reset(token)
+
+
+def emit_event(name: str, data: Any):
+    queue = _events.get()
+    if queue is not None:
+        queue.put_nowait((name, data))
+
+
+def _to_jsonable(data: Any) -> Any:
+    if isinstance(data, BaseModel):
+        return data.model_dump(mode="json")
+    if isinstance(data, (list, tuple, set)):
+        return [_to_jsonable(item) for item in data]
+    if isinstance(data, dict):
+        return {key: _to_jsonable(value) for key, value in data.items()}
+    return data
+
+
+def sse_frame(event: Tuple[str, Any]) -> str:
+    """(이벤트 이름, 데이터)를 text/event-stream 프레임 문자열로 변환합니다."""
+    name, data = event
+    payload = json.dumps(_to_jsonable(data), ensure_ascii=False, default=str)
+    return f"event: {name}\ndata: {payload}\n\n"
@@ -0,0 +1,59 @@
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Optional
+
+# 요청 단위 구간별 소요 시간(ms) 수집기. 수집 중이 아닐 때는 None이라 timed()가 즉시 통과합니다.
+# LangGraph 노드 태스크로 컨텍스트가 복사되어도 같은 dict를 공유하므로 합산이 유지됩니다.
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("timings", default=None)
+
+
+@contextmanager
+def collect_timings():
+    """블록 안에서 timed()로 측정된 구간을 모아 dict로 제공합니다."""
+    timings: Dict[str, float] = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def timed(name: str):
+    """
+    구간 소요 시간을 단조 시계(perf_counter)로 측정해 같은 이름끼리 합산합니다.
+    수집기가 없으면 ContextVar 조회 한 번만 하고 넘어갑니다.
+    """
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        timings[name] = timings.get(name, 0.0) + elapsed
+
+
+def timed_node(name: str, node: Callable[..., Awaitable]):
+    """랭그래프 노드를 node.<name> 구간으로 측정하도록 감쌉니다."""
+
+    @functools.wraps(node)
+    async def _wrapper(state):
+        with timed(f"node.{name}"):
+            return await node(state)
+
+    return _wrapper
+
+
+def round_timings(timings: Dict[str, float]) -> Dict[str, float]:
+    return {name: round(value, 3) for name, value in timings.items()}
+
+
+def server_timing_header(timings: Dict[str, float]) -> str:
+    """W3C Server-Timing 헤더 값으로 변환합니다. (예: db;dur=3.2, llm;dur=812.5)"""
+    return ", ".join(f"{name};dur={value:.3f}" for name, value in timings.items())
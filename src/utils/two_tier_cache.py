@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.logger import logger
+from utils.timing import timed
+
+
+class TwoTierCache:
+    """
+    1차: 프로세스 내 LRU, 2차: Redis(TTL) 캐시의 공통 저장소입니다.
+
+    - 하위 클래스는 REDIS_PREFIX와 로그에 쓸 NAME을 정하고,
+      값을 Redis 문자열로 바꾸는 방법이 다르면 _encode/_decode를 바꿉니다(기본은 문자열 그대로).
+    - redis는 lifespan에서 연결하며, 없으면 1차만 사용합니다.
+    - Redis 오류는 캐시 미스로 취급해 호출을 실패시키지 않습니다.
+    """
+
+    REDIS_PREFIX = ""
+    NAME = "캐시"
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.redis = None
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self._lru: "OrderedDict[str, Any]" = OrderedDict()
+
+    def _encode(self, value: Any) -> str:
+        return value
+
+    def _decode(self, raw: str) -> Any:
+        return raw
+
+    def _remember(self, key: str, value: Any):
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def get_local(self, key: str) -> Optional[Any]:
+        """프로세스 내 LRU만 조회합니다. 적중하지 않아도 미스로 세지 않습니다."""
+        value = self._lru.get(key)
+        if value is None:
+            return None
+        self._lru.move_to_end(key)
+        self.l1_hits += 1
+        return value
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.get_local(key)
+        if value is not None:
+            return value
+
+        if self.redis is not None:
+            try:
+                with timed("redis"):
+                    raw = await self.redis.get(self.REDIS_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"⚠️ {self.NAME}(Redis) 조회 실패: {e}")
+                raw = None
+            if raw:
+                value = self._decode(raw)
+                self._remember(key, value)
+                self.l2_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any):
+        self._remember(key, value)
+        if self.redis is None:
+            return
+        try:
+            with timed("redis"):
+                await self.redis.set(
+                    self.REDIS_PREFIX + key, self._encode(value), ex=self.ttl
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ {self.NAME}(Redis) 저장 실패: {e}")
+
+    def clear(self, **kwargs: Any):
+        """프로세스 내 LRU만 비웁니다. Redis 항목은 TTL로 만료됩니다."""
+        self._lru.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.l1_hits + self.l2_hits
+        total = hits + self.misses
+        return {
+            "entries": len(self._lru),
+            "redis": self.redis is not None,
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,139 @@
+"""
+sequence_type 힌트 장면의 그래프 경로 vs 직접 실행 경로 벤치마크
+
+실행: python test/bench_hinted_play_scene.py [반복 횟수]
+- test/play_*_scenario_request.json 픽스처마다 파일 이름의 페이즈를 sequence_type 힌트로 넣습니다.
+- 주사위/DB/상태 관리 서버 호출은 지연 없는 스텁으로 바꿔 오케스트레이션 비용만 비교합니다.
+- graph : 힌트 판별을 끈 상태로 랭그래프(팬아웃/팬인 + 상태 병합)를 거치는 경로
+- direct: 힌트로 페이즈가 정해져 핸들러를 직접 호출하는 경로
+"""
+
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+TEST_DIR = Path(__file__).resolve().parent
+sys.path[:0] = [str(TEST_DIR.parent), str(TEST_DIR.parent / "src")]
+
+from domains.gm.gm_service import GmService  # noqa: E402
+from domains.info.enemy_service import EnemyService  # noqa: E402
+from domains.info.item_service import ItemService  # noqa: E402
+from domains.info.world_service import WorldService  # noqa: E402
+from domains.play import play_service as play_service_module  # noqa: E402
+from domains.play.dtos.play_dtos import PlaySceneRequest  # noqa: E402
+from domains.play.dtos.player_dtos import (  # noqa: E402
+    FullPlayerState,
+    PlayerStateResponse,
+)
+from domains.play.play_service import PlayService  # noqa: E402
+from domains.play.utils import nodes  # noqa: E402
+
+
+class StubGmService(GmService):
+    def __init__(self):
+        super().__init__(cursor=None)
+
+    async def rolling_dice(self, *_args, **_kwargs):
+        return SimpleNamespace(
+            message="벤치마크",
+            is_critical_success=False,
+            roll_result=8,
+            ability_score=2,
+            total=10,
+            is_success=True,
+        )
+
+
+class StubWorldService(WorldService):
+    def __init__(self):
+        super().__init__(cursor=None)
+
+    async def get_locale(self, locale_id):
+        return {"locale_id": locale_id, "name": "벤치마크", "description": ""}
+
+
+class StubItemService(ItemService):
+    def __init__(self):
+        super().__init__(cursor=None)
+
+    async def get_items(self, *_args, **_kwargs):
+        return [], None
+
+
+class StubEnemyService(EnemyService):
+    def __init__(self):
+        super().__init__(cursor=None)
+
+    async def get_enemies(self, *_args, **_kwargs):
+        return [], None
+
+
+async def _fake_player_state(_player_id: str) -> FullPlayerState:
+    return FullPlayerState(
+        player=PlayerStateResponse(hp=10, gold=0, items=[]),
+        player_npc_relations=[],
+    )
+
+
+def _build_service() -> PlayService:
+    service = PlayService(cursor=None)
+    service.gm_service = StubGmService()
+    service.world_service = StubWorldService()
+    service.item_service = StubItemService()
+    service.enemy_service = StubEnemyService()
+    return service
+
+
+def _load_requests() -> list[PlaySceneRequest]:
+    requests = []
+    for path in sorted(TEST_DIR.glob("play_*_scenario_request*.json")):
+        # play_combat_scenario_request_2.json -> COMBAT
+        hint = path.stem.split("_")[1].upper()
+        if nodes._phase_from_sequence_type(hint) is None:
+            continue
+        data = json.loads(path.read_text(encoding="utf-8"))
+        requests.append(PlaySceneRequest(**{**data, "sequence_type": hint}))
+    return requests
+
+
+async def _measure(label: str, requests, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        for request in requests:
+            service = _build_service()
+            start = time.perf_counter()
+            await service.play_scene(request)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(
+        f"{label:<7} | 평균 {statistics.mean(samples):8.3f}ms | p50 {p50:8.3f}ms | p99 {p99:8.3f}ms"
+    )
+    return samples
+
+
+async def main(iterations: int = 100):
+    logging.disable(logging.CRITICAL)
+    nodes.get_player_state_from_proxy = _fake_player_state
+    requests = _load_requests()
+    print(f"힌트 장면 {len(requests)}종 x {iterations}회")
+
+    direct_resolver = play_service_module._phase_from_sequence_type
+    play_service_module._phase_from_sequence_type = lambda _: None
+    graph = await _measure("graph", requests, iterations)
+
+    play_service_module._phase_from_sequence_type = direct_resolver
+    direct = await _measure("direct", requests, iterations)
+
+    print(f"장면당 절감: {statistics.mean(graph) - statistics.mean(direct):.3f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
@@ -0,0 +1,137 @@
+"""
+로컬 장면 분류기 + LLM 폴백 vs LLM 단독 장면 분석 벤치마크
+
+실행: python test/bench_phase_classifier.py [확신도 임계값]
+- 평가 데이터: test/test_results/llm_classification_*.json (llm_classification_test.py로 기록한 모델별 LLM 분석 결과)
+- 분류기는 평가 문장과 그 유사 문장(문자 3-gram Jaccard가 NEAR_DUPLICATE_JACCARD 이상)을 뺀
+  학습 데이터로 새로 학습해 held-out 정확도를 측정합니다. 평가 문장은 학습 문장과 같은 템플릿에서
+  나온 것이 많아, 완전히 같은 문장만 빼면 정확도가 부풀려집니다.
+- LLM 단독: 기록된 LLM 판정/소요 시간을 그대로 사용합니다.
+- 하이브리드: 로컬 확신도가 임계값 이상이면 로컬 판정과 실측 소요 시간을,
+  미만이면 로컬 추론 시간 + 기록된 LLM 판정/소요 시간을 사용합니다.
+"""
+
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+TEST_DIR = Path(__file__).resolve().parent
+sys.path[:0] = [str(TEST_DIR), str(TEST_DIR.parent), str(TEST_DIR.parent / "src")]
+
+from train_phase_classifier import load_training_samples  # noqa: E402
+
+from configs.setting import PHASE_CLASSIFIER_THRESHOLD  # noqa: E402
+from domains.play.dtos.play_dtos import PhaseType  # noqa: E402
+from domains.play.utils.phase_classifier import PhaseClassifier  # noqa: E402
+
+# 평가 문장과 이 값 이상 겹치는 학습 문장은 같은 템플릿으로 보고 학습에서 뺌
+NEAR_DUPLICATE_JACCARD = 0.5
+# 설정이 분류기를 끈 값(> 1)이면 이 임계값으로 측정
+DEFAULT_BENCH_THRESHOLD = 0.7
+
+
+def _percentiles(samples_ms: list[float]) -> str:
+    ordered = sorted(samples_ms)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {p50:9.3f}ms | p99 {p99:9.3f}ms"
+
+
+def _trigrams(text: str) -> set[str]:
+    normalized = re.sub(r"\s+", " ", text.strip())
+    return {normalized[i : i + 3] for i in range(len(normalized) - 2)}
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def _held_out(samples, eval_stories: set[str]):
+    """평가 문장과 같거나 거의 같은(같은 템플릿) 학습 문장을 뺀 목록을 반환합니다."""
+    eval_grams = [_trigrams(story) for story in eval_stories]
+    kept = []
+    for text, label in samples:
+        grams = _trigrams(text)
+        if all(_jaccard(grams, other) < NEAR_DUPLICATE_JACCARD for other in eval_grams):
+            kept.append((text, label))
+    return kept
+
+
+def _load_llm_runs() -> list[tuple[str, list[dict]]]:
+    runs = []
+    for path in sorted((TEST_DIR / "test_results").glob("llm_classification_*.json")):
+        result = json.loads(path.read_text(encoding="utf-8"))
+        details = []
+        for row in result["details"]:
+            details.append(
+                {
+                    # 기록 시 붙인 " (인덱스)" 접미사 제거
+                    "story": re.sub(r" \(\d+\)$", "", row["story"]),
+                    "expected": PhaseType(row["expected"]),
+                    "actual": row["actual"],
+                    "elapsed_ms": row["elapsed"] * 1000,
+                }
+            )
+        runs.append((result["model_info"], details))
+    return runs
+
+
+def main(threshold: float):
+    runs = _load_llm_runs()
+    eval_stories = {row["story"] for _, details in runs for row in details}
+    samples = load_training_samples()
+    train_samples = _held_out(samples, eval_stories)
+    classifier = PhaseClassifier.train(train_samples)
+    print(
+        f"학습 {len(train_samples)}문장 (유사 문장 {len(samples) - len(train_samples)}개 제외)"
+        f" | 평가 {len(eval_stories)}문장 | 임계값 {threshold}"
+    )
+
+    local = {}
+    for story in eval_stories:
+        start = time.perf_counter()
+        prediction = classifier.predict(story)
+        local[story] = (prediction, (time.perf_counter() - start) * 1000)
+
+    local_ms = [elapsed for _, elapsed in local.values()]
+    rows = [row for _, details in runs for row in details]
+    local_correct = sum(local[row["story"]][0][0] == row["expected"] for row in rows)
+    print(
+        f"{'local-only':<18} | 정확도 {local_correct / len(rows):.3f} | "
+        f"{_percentiles(local_ms)}"
+    )
+
+    for model, details in runs:
+        llm_ms = [row["elapsed_ms"] for row in details]
+        llm_acc = sum(row["actual"] == row["expected"].value for row in details)
+
+        hybrid_ms, hybrid_acc, covered = [], 0, 0
+        for row in details:
+            (phase, confidence), elapsed = local[row["story"]]
+            if confidence >= threshold:
+                covered += 1
+                hybrid_ms.append(elapsed)
+                hybrid_acc += phase == row["expected"]
+            else:
+                hybrid_ms.append(elapsed + row["elapsed_ms"])
+                hybrid_acc += row["actual"] == row["expected"].value
+
+        n = len(details)
+        print(f"[{model}] {n}문장")
+        print(f"  {'llm-only':<16} | 정확도 {llm_acc / n:.3f} | {_percentiles(llm_ms)}")
+        print(
+            f"  {'local+llm':<16} | 정확도 {hybrid_acc / n:.3f} | {_percentiles(hybrid_ms)}"
+            f" | LLM 생략 {covered / n:.0%}"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(float(sys.argv[1]))
+    elif PHASE_CLASSIFIER_THRESHOLD <= 1:
+        main(PHASE_CLASSIFIER_THRESHOLD)
+    else:
+        main(DEFAULT_BENCH_THRESHOLD)
@@ -0,0 +1,53 @@
+"""
+PlayService 요청당 생성 비용 벤치마크
+
+실행: python test/bench_play_service.py [반복 횟수]
+- before: 요청마다 랭그래프를 빌드·컴파일하던 기존 방식
+- after : 프로세스 전역 컴파일 그래프를 재사용하는 현재 방식
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from domains.play.play_service import PlayService, build_play_graph  # noqa: E402
+
+
+def _measure(label: str, fn, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(
+        f"{label:<8} | 평균 {statistics.mean(samples):8.3f}ms | p50 {p50:8.3f}ms | p99 {p99:8.3f}ms"
+    )
+    return samples
+
+
+def main(iterations: int = 200):
+    cursor = MagicMock()
+
+    def before():
+        PlayService(cursor)
+        build_play_graph()
+
+    def after():
+        PlayService(cursor)
+
+    print(f"PlayService 생성 비용 ({iterations}회)")
+    old = _measure("before", before, iterations)
+    new = _measure("after", after, iterations)
+    print(f"요청당 절감: {statistics.mean(old) - statistics.mean(new):.3f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from configs.database import LazyCursor
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.description = None
+        self.closed = False
+
+    async def execute(self, query, params=None):
+        if query.startswith("FAIL"):
+            raise RuntimeError("boom")
+        self.description = [("x",)] if query.startswith("SELECT") else None
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    async def fetchall(self):
+        return list(self.rows)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self):
+        return FakeCursor(self.rows)
+
+
+class FakePool:
+    def __init__(self, rows=None):
+        self.rows = rows or [{"x": 1}]
+        self.checked_out = 0
+        self.getconn_calls = 0
+
+    async def getconn(self):
+        self.checked_out += 1
+        self.getconn_calls += 1
+        return FakeConnection(self.rows)
+
+    async def putconn(self, conn):
+        self.checked_out -= 1
+
+
+@pytest.mark.asyncio
+async def test_lazy_cursor_never_checks_out_without_execute():
+    pool = FakePool()
+    cursor = LazyCursor(pool)
+
+    await cursor.close()
+
+    assert pool.getconn_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_lazy_cursor_releases_connection_after_fetch():
+    pool = FakePool()
+    cursor = LazyCursor(pool)
+
+    await cursor.execute("SELECT 1")
+    assert pool.checked_out == 1
+
+    assert await cursor.fetchone() == {"x": 1}
+    assert pool.checked_out == 0
+
+    await cursor.execute("SELECT 2")
+    assert await cursor.fetchall() == [{"x": 1}]
+    assert pool.checked_out == 0
+    assert pool.getconn_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_lazy_cursor_releases_after_statement_without_result_or_error():
+    pool = FakePool()
+    cursor = LazyCursor(pool)
+
+    await cursor.execute("DELETE FROM t")
+    assert pool.checked_out == 0
+
+    with pytest.raises(RuntimeError):
+        await cursor.execute("FAIL")
+    assert pool.checked_out == 0
+
+
+@pytest.mark.asyncio
+async def test_lazy_cursor_serializes_concurrent_tasks_sharing_one_cursor():
+    pool = FakePool()
+    cursor = LazyCursor(pool)
+    max_checked_out = 0
+
+    async def _query():
+        nonlocal max_checked_out
+        await cursor.execute("SELECT 1")
+        max_checked_out = max(max_checked_out, pool.checked_out)
+        await asyncio.sleep(0)
+        return await cursor.fetchone()
+
+    results = await asyncio.gather(*[_query() for _ in range(5)])
+
+    assert results == [{"x": 1}] * 5
+    assert max_checked_out == 1
+    assert pool.checked_out == 0
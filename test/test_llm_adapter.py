@@ -0,0 +1,390 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from langchain_core.messages import SystemMessage
+
+from configs import llm_adapter, llm_resilience
+from configs.llm_adapter import (
+    NarrativeChatModel,
+    StructuredFieldStream,
+    llm_single_flight,
+)
+from domains.play.dtos.play_dtos import PhaseType, SceneAnalysis
+from domains.play.dtos.riddle_dtos import RiddleData
+from utils.partial_json import closed_string_field, partial_string_field
+from utils.served_locally import collect_local_serves
+
+
+@pytest.fixture(autouse=True)
+def fresh_endpoints(monkeypatch):
+    # 실패를 흉내 내는 테스트가 공유 회로 차단기를 열지 않도록 게이트웨이 상태를 테스트마다 새로 만듦
+    monkeypatch.setattr(llm_resilience, "_endpoints", {})
+
+
+class OtherAnalysis(SceneAnalysis):
+    pass
+
+
+def _gateway_response(content: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "id": "c1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+        },
+    )
+
+
+def test_structured_output_runnable_is_memoized_per_schema():
+    model = NarrativeChatModel(client=httpx.AsyncClient())
+
+    runnable = model.with_structured_output(SceneAnalysis)
+
+    assert model.with_structured_output(SceneAnalysis) is runnable
+    assert model.with_structured_output(OtherAnalysis) is not runnable
+    # 다른 옵션으로 요청하면 앞서 만든 Runnable을 돌려주지 않음
+    assert model.with_structured_output(SceneAnalysis, include_raw=True) is not runnable
+    assert (
+        model.with_structured_output(SceneAnalysis, method="json_mode") is not runnable
+    )
+
+
+@pytest.mark.asyncio
+async def test_structured_output_does_not_regenerate_schema_per_call(monkeypatch):
+    requests = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return _gateway_response(
+            '{"phase_type": "전투", "reason": "공격", "confidence": 0.9}'
+        )
+
+    model = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    runnable = model.with_structured_output(SceneAnalysis)
+
+    def _fail():
+        raise AssertionError("호출마다 JSON Schema를 다시 만들면 안 됩니다.")
+
+    monkeypatch.setattr(SceneAnalysis, "model_json_schema", _fail)
+
+    for _ in range(2):
+        result = await runnable.ainvoke([SystemMessage(content="분석하세요")])
+        assert result.phase_type == PhaseType.COMBAT
+
+    system_prompt = requests[0]["messages"][0]["content"]
+    assert system_prompt.startswith("분석하세요")
+    assert '"phase_type"' in system_prompt
+    assert requests[0] == requests[1]
+    assert llm_adapter._schema_instruction.cache_info().currsize >= 1
+
+
+def _sse(*deltas: str) -> bytes:
+    lines = [
+        "data: "
+        + json.dumps(
+            {"choices": [{"index": 0, "delta": {"content": d}, "finish_reason": None}]},
+            ensure_ascii=False,
+        )
+        for d in deltas
+    ]
+    lines.append("data: [DONE]")
+    return ("\n\n".join(lines) + "\n\n").encode("utf-8")
+
+
+def _streaming_model(handler) -> NarrativeChatModel:
+    return NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        llm_retry_base_delay=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_astream_yields_gateway_deltas_as_chunks():
+    bodies = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            content=_sse("동굴", " 입구", "에서"),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    chunks = [c async for c in _streaming_model(_handler).astream("안녕") if c.content]
+
+    assert [c.content for c in chunks] == ["동굴", " 입구", "에서"]
+    assert bodies[0]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_astream_retries_server_errors_before_first_chunk():
+    statuses = iter([503, 200])
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status != 200:
+            return httpx.Response(status)
+        return httpx.Response(200, content=_sse("ok"))
+
+    chunks = [c async for c in _streaming_model(_handler).astream("안녕") if c.content]
+
+    assert [c.content for c in chunks] == ["ok"]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"answer": "달"', None),
+        ('{"riddle": "낮에는', "낮에는"),
+        ('{"riddle": "줄\\n바꿈 \\"따옴표\\" \\u', '줄\n바꿈 "따옴표" '),
+        ('{"riddle": "한글 \\uD55C", "hint": "x"}', "한글 한"),
+    ],
+)
+def test_partial_string_field_decodes_incomplete_json(text, expected):
+    assert partial_string_field(text, "riddle") == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"phase_type": "휴', None),
+        ('{"phase_type": "휴식"', "휴식"),
+        ('{"phase_type": "휴식", "reason": "모닥', "휴식"),
+    ],
+)
+def test_closed_string_field_waits_for_closing_quote(text, expected):
+    assert closed_string_field(text, "phase_type") == expected
+
+
+def _held_sse(release: asyncio.Event, *, head: str, tail: str):
+    """head까지 보낸 뒤 release가 설정될 때까지 나머지(tail) 전송을 멈추는 SSE 본문입니다."""
+
+    async def _body():
+        yield _sse(head)[: -len(b"data: [DONE]\n\n")]
+        await release.wait()
+        yield _sse(tail)
+
+    return _body()
+
+
+@pytest.mark.asyncio
+async def test_early_field_resolves_before_rest_of_json_and_backfills():
+    release = asyncio.Event()
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=_held_sse(
+                release,
+                head='{"phase_type": "휴식", "reason": "모닥',
+                tail='불 옆 휴식", "confidence": 0.8}',
+            ),
+        )
+
+    runnable = _streaming_model(_handler).with_structured_output(
+        SceneAnalysis, early_field="phase_type"
+    )
+
+    early = await asyncio.wait_for(runnable.ainvoke("분석해줘"), timeout=2)
+
+    assert early.value == "휴식"
+    assert not early.result.done()
+    release.set()
+    analysis = await early.result
+    assert analysis.phase_type == PhaseType.REST
+    assert analysis.reason == "모닥불 옆 휴식"
+    assert analysis.confidence == 0.8
+
+
+@pytest.mark.asyncio
+async def test_early_field_can_cancel_rest_of_generation():
+    release = asyncio.Event()
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=_held_sse(
+                release, head='{"phase_type": "전투", "rea', tail='son": "x"}'
+            ),
+        )
+
+    model = _streaming_model(_handler)
+    runnable = model.with_structured_output(
+        SceneAnalysis, early_field="phase_type", cancel_rest=True
+    )
+
+    early = await asyncio.wait_for(runnable.ainvoke("분석해줘"), timeout=2)
+
+    assert early.value == "전투"
+    assert await asyncio.wait_for(early.result, timeout=2) is None
+    assert runnable is not model.with_structured_output(
+        SceneAnalysis, early_field="phase_type"
+    )
+
+
+@pytest.mark.asyncio
+async def test_early_field_surfaces_errors_before_the_value_is_known():
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400)
+
+    runnable = _streaming_model(_handler).with_structured_output(
+        SceneAnalysis, early_field="phase_type"
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await runnable.ainvoke("분석해줘")
+
+
+@pytest.mark.asyncio
+async def test_structured_field_stream_forwards_field_tokens_then_validates():
+    payload = json.dumps(
+        {
+            "riddle": "밤에만 뜨는 것은?",
+            "answer": "달",
+            "hint": "하늘",
+            "explanation": "달",
+        },
+        ensure_ascii=False,
+    )
+    pieces = [payload[i : i + 5] for i in range(0, len(payload), 5)]
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_sse(*pieces))
+
+    stream = StructuredFieldStream(
+        _streaming_model(_handler), RiddleData, "수수께끼를 내줘", field="riddle"
+    )
+    tokens = [t async for t in stream]
+
+    assert len(tokens) > 1
+    assert "".join(tokens) == "밤에만 뜨는 것은?"
+    assert stream.result.answer == "달"
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_upstream_request():
+    release = asyncio.Event()
+    posted = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        await release.wait()
+        return _gateway_response("Y")
+
+    model = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        temperature=0.0,
+    )
+    before = llm_single_flight.stats()
+
+    calls = [asyncio.create_task(model.ainvoke("정답이 맞나요?")) for _ in range(3)]
+    other = asyncio.create_task(model.ainvoke("정답이 틀렸나요?"))
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*calls, other)
+
+    assert len(posted) == 2
+    assert {r.content for r in results} == {"Y"}
+    # 호출마다 별도 메시지 객체를 받아 서로의 메타데이터 변경이 섞이지 않음
+    assert len({id(r) for r in results}) == 4
+    after = llm_single_flight.stats()
+    assert after["leaders"] - before["leaders"] == 2
+    assert after["coalesced"] - before["coalesced"] == 2
+    assert after["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_followers_are_marked_as_served_locally():
+    release = asyncio.Event()
+
+    async def _handler(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return _gateway_response("Y")
+
+    model = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        temperature=0.0,
+    )
+
+    async def _call():
+        with collect_local_serves() as served_locally:
+            await model.ainvoke("정답이 맞나요?")
+        return served_locally
+
+    calls = [asyncio.create_task(_call()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert sorted(await asyncio.gather(*calls)) == [[], ["coalesced"]]
+
+
+@pytest.mark.asyncio
+async def test_sampling_calls_are_not_coalesced():
+    release = asyncio.Event()
+    posted = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        number = len(posted)
+        await release.wait()
+        return _gateway_response(f"수수께끼 {number}")
+
+    model = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        temperature=0.7,
+    )
+    before = llm_single_flight.stats()
+
+    calls = [asyncio.create_task(model.ainvoke("수수께끼를 내줘")) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    # 같은 프롬프트라도 샘플링 호출은 각자 업스트림 요청을 보내 서로 다른 결과를 받음
+    assert len(posted) == 2
+    assert len({r.content for r in results}) == 2
+    assert llm_single_flight.stats()["coalesced"] == before["coalesced"]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_share_upstream_failure_and_next_call_retries():
+    responses = iter([500, 200])
+    release = asyncio.Event()
+
+    async def _handler(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        status = next(responses)
+        return httpx.Response(status) if status != 200 else _gateway_response("ok")
+
+    model = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        temperature=0.0,
+        llm_retry_attempts=1,
+    )
+
+    calls = [asyncio.create_task(model.ainvoke("hi")) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+    outcomes = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert all(isinstance(o, httpx.HTTPStatusError) for o in outcomes)
+    assert (await model.ainvoke("hi")).content == "ok"
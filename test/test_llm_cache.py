@@ -0,0 +1,140 @@
+import json
+
+import httpx
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+
+from configs import llm_adapter
+from configs.http_client import http_holder
+from configs.llm_cache import LLMResponseCache, llm_response_cache
+from configs.llm_manager import LLMManager
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    """LLMManager가 만드는 게이트웨이 모델의 요청을 가로채 기록합니다."""
+    posted = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        posted.append(body)
+        content = '{"ok": true}' if body.get("response_format") else "Y"
+        return httpx.Response(
+            200,
+            json={
+                "id": "c1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+    monkeypatch.setattr(LLMManager, "_instances", {})
+    monkeypatch.setattr(llm_adapter, "LLM_GATEWAY_URL", "http://gateway")
+    monkeypatch.setattr(
+        http_holder,
+        "client",
+        httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    monkeypatch.setattr(llm_response_cache, "redis", None)
+    llm_response_cache.clear()
+    yield posted
+    llm_response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_deterministic_calls_are_served_from_cache_without_network(gateway):
+    evaluator = LLMManager.get_instance("gateway", temperature=0.0)
+    before = llm_response_cache.stats()
+
+    first = await evaluator.ainvoke("정답이 '달'인가요?")
+    second = await evaluator.ainvoke("정답이 '달'인가요?")
+
+    assert first.content == second.content == "Y"
+    assert len(gateway) == 1
+    after = llm_response_cache.stats()
+    assert after["l1_hits"] - before["l1_hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sampling_calls_bypass_cache(gateway):
+    examiner = LLMManager.get_instance("gateway", temperature=0.9)
+
+    await examiner.ainvoke("수수께끼를 내줘")
+    await examiner.ainvoke("수수께끼를 내줘")
+
+    assert examiner.cache is False
+    assert len(gateway) == 2
+
+
+@pytest.mark.asyncio
+async def test_call_parameters_are_part_of_the_key(gateway):
+    evaluator = LLMManager.get_instance("gateway", temperature=0.0)
+
+    plain = await evaluator.ainvoke("분석해줘")
+    structured = await evaluator.ainvoke(
+        "분석해줘", response_format={"type": "json_object"}
+    )
+    cached = await evaluator.ainvoke(
+        "분석해줘", response_format={"type": "json_object"}
+    )
+
+    assert len(gateway) == 2
+    assert plain.content == "Y"
+    assert structured.content == cached.content == [{"ok": True}]
+    assert cached.additional_kwargs["parsed"] == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_survives_process_local_clear():
+    cache = LLMResponseCache(ttl=60)
+    cache.redis = FakeRedis()
+    generation = ChatGeneration(
+        message=AIMessage(content="Y"), generation_info={"finish_reason": "stop"}
+    )
+    await cache.aupdate("prompt", "llm", [generation])
+    cache.clear()
+
+    restored = await cache.alookup("prompt", "llm")
+
+    assert restored[0].message.content == "Y"
+    assert restored[0].generation_info == {"finish_reason": "stop"}
+    assert cache.redis.ttls[cache.REDIS_PREFIX + cache.make_key("prompt", "llm")] == 60
+    assert cache.stats()["l2_hits"] == 1
+    assert await cache.alookup("prompt", "other-llm") is None
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_entry():
+    cache = LLMResponseCache(maxsize=2)
+    generation = ChatGeneration(message=AIMessage(content="Y"))
+    for prompt in ("a", "b"):
+        await cache.aupdate(prompt, "llm", [generation])
+    assert await cache.alookup("a", "llm") is not None
+    await cache.aupdate("c", "llm", [generation])
+
+    assert await cache.alookup("b", "llm") is None
+    assert await cache.alookup("a", "llm") is not None
+    assert cache.stats()["entries"] == 2
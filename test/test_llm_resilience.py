@@ -0,0 +1,202 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from configs import llm_adapter, llm_resilience
+from configs.llm_adapter import NarrativeChatModel
+from configs.llm_resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    EndpointHealth,
+    LLMUnavailableError,
+    endpoint_health,
+)
+from configs.llm_scheduler import LLMScheduler
+
+
+def _completion(content: str = "ok") -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "id": "c1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+        },
+    )
+
+
+def _model(handler, **kwargs) -> NarrativeChatModel:
+    kwargs.setdefault("llm_retry_base_delay", 0)
+    return NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_endpoints(monkeypatch):
+    monkeypatch.setattr(llm_resilience, "_endpoints", {})
+
+
+def test_breaker_opens_after_consecutive_failures_and_probes_once(monkeypatch):
+    health = EndpointHealth("http://gateway", failure_threshold=2, recovery_timeout=10)
+    health.record_failure()
+    health.before_call()
+    health.record_failure()
+    assert health.state == OPEN
+
+    with pytest.raises(LLMUnavailableError) as exc_info:
+        health.before_call()
+    assert exc_info.value.status_code == 503
+
+    # 복구 대기 시간이 지나면 시험 호출 하나만 허용
+    health.opened_at -= 10
+    health.before_call()
+    assert health.state == HALF_OPEN
+    with pytest.raises(LLMUnavailableError):
+        health.before_call()
+
+    health.record_success(0.1)
+    assert health.state == CLOSED
+    assert health.stats()["trips"] == 1
+    assert health.stats()["rejected"] == 2
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast_without_backoff_or_network():
+    calls = []
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(502)
+
+    model = _model(_handler, llm_retry_attempts=3, llm_retry_base_delay=5)
+    health = endpoint_health("http://gateway")
+    health.failure_threshold = 1
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(httpx.HTTPStatusError):
+        await model.ainvoke("hi")
+    with pytest.raises(LLMUnavailableError):
+        await model.ainvoke("hi again")
+
+    # 첫 실패로 회로가 열려 5초 백오프 없이 바로 끝나고, 두 번째 호출은 네트워크를 쓰지 않음
+    assert loop.time() - started < 1
+    assert calls == [1]
+    assert health.state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip_the_breaker():
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400)
+
+    model = _model(_handler, llm_retry_attempts=1)
+    health = endpoint_health("http://gateway")
+    health.failure_threshold = 1
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await model.ainvoke("hi")
+
+    assert health.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_first_response_wins(monkeypatch):
+    monkeypatch.setattr(llm_adapter, "LLM_HEDGE_ENABLED", True)
+    monkeypatch.setattr(llm_resilience, "LLM_HEDGE_MIN_DELAY", 0.01)
+    posted = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        if len(posted) == 1:
+            await asyncio.sleep(5)
+            return _completion("slow")
+        return _completion("fast")
+
+    scheduler = LLMScheduler(max_in_flight=2)
+    monkeypatch.setattr(llm_adapter, "llm_scheduler", scheduler)
+    health = endpoint_health("http://gateway")
+    for _ in range(20):
+        health.record_success(0.01)
+
+    result = await _model(_handler).ainvoke("hi")
+
+    assert result.content == "fast"
+    assert len(posted) == 2
+    assert health.stats()["hedges"] == 1
+    assert health.stats()["hedge_wins"] == 1
+    # 헤지 요청이 따로 잡은 슬롯까지 모두 반환됨
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_skipped_when_no_scheduler_slot_is_free(monkeypatch):
+    monkeypatch.setattr(llm_adapter, "LLM_HEDGE_ENABLED", True)
+    monkeypatch.setattr(llm_resilience, "LLM_HEDGE_MIN_DELAY", 0.01)
+    monkeypatch.setattr(llm_adapter, "llm_scheduler", LLMScheduler(max_in_flight=1))
+    posted = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        posted.append(1)
+        await asyncio.sleep(0.1)
+        return _completion("only")
+
+    health = endpoint_health("http://gateway")
+    for _ in range(20):
+        health.record_success(0.01)
+
+    result = await _model(_handler).ainvoke("hi")
+
+    assert result.content == "only"
+    assert posted == [1]
+    assert health.stats()["hedges"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedging_waits_for_samples_before_sending_duplicates(monkeypatch):
+    monkeypatch.setattr(llm_adapter, "LLM_HEDGE_ENABLED", True)
+    posted = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        posted.append(1)
+        await asyncio.sleep(0.05)
+        return _completion()
+
+    await _model(_handler).ainvoke("hi")
+
+    assert posted == [1]
+    assert endpoint_health("http://gateway").stats()["hedges"] == 0
+
+
+@pytest.mark.asyncio
+async def test_streams_close_breaker_without_skewing_hedge_delay(monkeypatch):
+    monkeypatch.setattr(llm_resilience, "LLM_HEDGE_MIN_SAMPLES", 1)
+    payload = {"choices": [{"index": 0, "delta": {"content": "안녕"}}]}
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        body = f"data: {json.dumps(payload)}\n\ndata: [DONE]\n\n".encode()
+        return httpx.Response(200, content=body)
+
+    health = endpoint_health("http://gateway")
+    health.state = HALF_OPEN
+
+    chunks = [chunk async for chunk in _model(_handler).astream("hi")]
+
+    assert "".join(str(c.content) for c in chunks) == "안녕"
+    assert health.state == CLOSED
+    # 첫 바이트 시간은 전체 응답 기준인 헤지 지연 표본에 들어가지 않음
+    assert health.p95() is None
@@ -0,0 +1,257 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from configs import llm_adapter, llm_manager, llm_resilience, llm_router
+from configs.llm_adapter import NarrativeChatModel
+from configs.llm_cache import LLMResponseCache
+from configs.llm_manager import LLMManager
+from configs.llm_resilience import endpoint_health
+from configs.llm_router import LLMRouter, provider_stats
+from configs.llm_scheduler import LLMOverloadedError, LLMScheduler
+
+
+class Verdict(BaseModel):
+    answer: str
+
+
+class StandInGateway:
+    """게이트웨이 대신 응답하는 로컬 HTTP 서버. delay·status를 테스트 중에 바꿀 수 있습니다."""
+
+    def __init__(self, answer: str, delay: float = 0.0, status: int = 200):
+        self.answer = answer
+        self.delay = delay
+        self.status = status
+        # 설정하면 스키마와 무관한 응답 본문을 그대로 돌려줌
+        self.raw_content = None
+        self.hits = 0
+        gateway = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                gateway.hits += 1
+                time.sleep(gateway.delay)
+                body = json.dumps(
+                    {
+                        "id": "c1",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": "gpt-4o",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": gateway.raw_content
+                                    or json.dumps({"answer": gateway.answer}),
+                                },
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    }
+                ).encode()
+                self.send_response(gateway.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def model(self) -> NarrativeChatModel:
+        return NarrativeChatModel(
+            base_url=self.url,
+            client=httpx.AsyncClient(),
+            llm_retry_attempts=1,
+        )
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    monkeypatch.setattr(llm_router, "_providers", {})
+    monkeypatch.setattr(llm_resilience, "_endpoints", {})
+
+
+@pytest.fixture
+def gateways():
+    started = []
+
+    def _start(*args, **kwargs) -> StandInGateway:
+        gateway = StandInGateway(*args, **kwargs)
+        started.append(gateway)
+        return gateway
+
+    yield _start
+    for gateway in started:
+        gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_structured_calls_go_to_the_fastest_provider(gateways):
+    slow = gateways("slow", delay=0.2)
+    fast = gateways("fast")
+    router = LLMRouter({"slow": slow.model(), "fast": fast.model()})
+    analyze = router.with_structured_output(Verdict)
+
+    # 표본이 없는 제공자는 허용 목록 순서대로 한 번씩 측정됨
+    assert (await analyze.ainvoke("q")).answer == "slow"
+    assert (await analyze.ainvoke("q")).answer == "fast"
+    for _ in range(3):
+        assert (await analyze.ainvoke("q")).answer == "fast"
+
+    assert router.ranked() == ["fast", "slow"]
+    assert slow.hits == 1
+    assert fast.hits == 4
+    assert router.with_structured_output(Verdict) is analyze
+    assert router.with_structured_output(Verdict, include_raw=True) is not analyze
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_fails_over_and_is_demoted(gateways):
+    primary = gateways("primary", status=500)
+    backup = gateways("backup", delay=0.05)
+    router = LLMRouter({"primary": primary.model(), "backup": backup.model()})
+    analyze = router.with_structured_output(Verdict)
+
+    assert (await analyze.ainvoke("q")).answer == "backup"
+    assert provider_stats("primary").failures == 1
+    # 오류율이 기준 미만이면 아직 짧은 지연(표본 없음) 덕분에 먼저 시도됨
+    assert (await analyze.ainvoke("q")).answer == "backup"
+
+    assert not provider_stats("primary").healthy
+    assert router.ranked() == ["backup", "primary"]
+    assert (await analyze.ainvoke("q")).answer == "backup"
+    assert primary.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_demoted_provider_is_retried_after_cooldown(gateways):
+    primary = gateways("primary", status=500)
+    backup = gateways("backup")
+    router = LLMRouter({"primary": primary.model(), "backup": backup.model()})
+
+    await router.ainvoke("q")
+    await router.ainvoke("q")
+    assert router.ranked()[0] == "backup"
+
+    primary.status = 200
+    provider_stats("primary").failed_at -= provider_stats("primary").cooldown
+    result = await router.ainvoke("q")
+
+    assert "primary" in str(result.content)
+    assert primary.hits == 3
+    assert (
+        provider_stats("primary").error_rate < provider_stats("primary").max_error_rate
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_do_not_skew_provider_latency(gateways):
+    slow = gateways("slow", delay=0.1)
+    model = slow.model()
+    model.cache = LLMResponseCache()
+    router = LLMRouter({"slow": model})
+    analyze = router.with_structured_output(Verdict)
+
+    await analyze.ainvoke("q")
+    measured = provider_stats("slow").latency
+    assert (await analyze.ainvoke("q")).answer == "slow"
+
+    # 캐시 적중은 성공으로만 세고 응답 시간 EWMA는 그대로 둠
+    assert slow.hits == 1
+    assert provider_stats("slow").calls == 2
+    assert provider_stats("slow").latency == measured
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_raises_the_last_error(gateways):
+    first = gateways("first", status=502)
+    second = gateways("second", status=503)
+    router = LLMRouter({"first": first.model(), "second": second.model()})
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await router.with_structured_output(Verdict).ainvoke("q")
+
+    assert exc_info.value.response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_client_and_validation_errors_are_raised_without_failover(gateways):
+    rejecting = gateways("rejecting", status=400)
+    malformed = gateways("malformed")
+    malformed.raw_content = '{"unexpected": 1}'
+    backup = gateways("backup")
+
+    router = LLMRouter({"rejecting": rejecting.model(), "backup": backup.model()})
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await router.with_structured_output(Verdict).ainvoke("q")
+    assert exc_info.value.response.status_code == 400
+
+    router = LLMRouter({"malformed": malformed.model(), "backup": backup.model()})
+    with pytest.raises(ValidationError):
+        await router.with_structured_output(Verdict).ainvoke("q")
+
+    assert backup.hits == 0
+    assert provider_stats("rejecting").failures == 0
+    assert provider_stats("malformed").failures == 0
+
+
+@pytest.mark.asyncio
+async def test_local_load_shedding_is_not_spread_to_other_providers(
+    gateways, monkeypatch
+):
+    monkeypatch.setattr(
+        llm_adapter, "llm_scheduler", LLMScheduler(max_in_flight=0, max_queue=0)
+    )
+    primary = gateways("primary")
+    backup = gateways("backup")
+    router = LLMRouter({"primary": primary.model(), "backup": backup.model()})
+
+    with pytest.raises(LLMOverloadedError):
+        await router.ainvoke("q")
+
+    assert primary.hits == backup.hits == 0
+    assert provider_stats("primary").failures == 0
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_over_without_double_counting(gateways):
+    primary = gateways("primary")
+    backup = gateways("backup")
+    health = endpoint_health(primary.url)
+    health.failure_threshold = 1
+    health.record_failure()
+    router = LLMRouter({"primary": primary.model(), "backup": backup.model()})
+
+    result = await router.with_structured_output(Verdict).ainvoke("q")
+
+    assert result.answer == "backup"
+    assert primary.hits == 0
+    assert provider_stats("primary").failures == 0
+
+
+def test_manager_builds_router_from_allow_list(monkeypatch):
+    monkeypatch.setattr(LLMManager, "_instances", {})
+    monkeypatch.setattr(llm_manager, "LLM_ROUTER_PROVIDERS", ["gateway", "router"])
+
+    router = LLMManager.get_instance("router", temperature=0.0)
+
+    assert isinstance(router, LLMRouter)
+    assert list(router.providers) == ["gateway"]
+    assert router.providers["gateway"] is LLMManager.get_instance("gateway", 0.0)
+    assert LLMManager.get_instance("router", temperature=0.0) is router
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from configs.llm_scheduler import (
+    LLMOverloadedError,
+    LLMPriority,
+    LLMScheduler,
+    llm_priority,
+)
+
+
+async def _hold(scheduler: LLMScheduler, priority, order: list, release: asyncio.Event):
+    async with scheduler.slot(priority):
+        order.append(priority)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_slots_go_to_highest_priority_waiter_first():
+    scheduler = LLMScheduler(max_in_flight=1, max_queue=10, queue_timeout=1)
+    order = []
+    release = asyncio.Event()
+    release.set()
+
+    await scheduler.acquire(LLMPriority.DEFAULT)
+    waiters = [
+        asyncio.create_task(_hold(scheduler, p, order, release))
+        for p in (LLMPriority.MINIGAME, LLMPriority.DEFAULT, LLMPriority.SCENE)
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.stats()["queued"] == 3
+
+    scheduler.release()
+    await asyncio.gather(*waiters)
+
+    assert order == [LLMPriority.SCENE, LLMPriority.DEFAULT, LLMPriority.MINIGAME]
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_lowest_priority_first():
+    scheduler = LLMScheduler(max_in_flight=1, max_queue=1, queue_timeout=1)
+    await scheduler.acquire(LLMPriority.SCENE)
+
+    quiz = asyncio.create_task(scheduler.acquire(LLMPriority.MINIGAME))
+    await asyncio.sleep(0)
+
+    with pytest.raises(LLMOverloadedError):
+        await scheduler.acquire(LLMPriority.MINIGAME)
+
+    scene = asyncio.create_task(scheduler.acquire(LLMPriority.SCENE))
+    await asyncio.sleep(0)
+    with pytest.raises(LLMOverloadedError) as exc_info:
+        await quiz
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+    scheduler.release()
+    await scene
+    stats = scheduler.stats()["classes"]
+    assert stats["minigame"]["shed"] == 2
+    assert stats["scene"]["admitted"] == 2
+
+
+@pytest.mark.asyncio
+async def test_waiting_past_timeout_is_rejected_quickly():
+    scheduler = LLMScheduler(max_in_flight=1, max_queue=10, queue_timeout=0.05)
+    await scheduler.acquire(LLMPriority.SCENE)
+
+    with pytest.raises(LLMOverloadedError):
+        await scheduler.acquire(LLMPriority.DEFAULT)
+
+    # 시간 초과된 대기자는 이후 슬롯을 가져가지 않음
+    scheduler.release()
+    assert scheduler.in_flight == 0
+    assert scheduler.stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_its_slot():
+    scheduler = LLMScheduler(max_in_flight=1, max_queue=10, queue_timeout=1)
+    order = []
+    release = asyncio.Event()
+    release.set()
+    await scheduler.acquire(LLMPriority.SCENE)
+    first = asyncio.create_task(_hold(scheduler, LLMPriority.SCENE, order, release))
+    second = asyncio.create_task(_hold(scheduler, LLMPriority.DEFAULT, order, release))
+    await asyncio.sleep(0)
+
+    # 슬롯을 넘겨받는 순간 취소되어도 다음 대기자가 슬롯을 받아야 함
+    scheduler.release()
+    first.cancel()
+    await asyncio.gather(first, return_exceptions=True)
+    await second
+
+    assert order[-1] == LLMPriority.DEFAULT
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_uses_priority_from_context():
+    scheduler = LLMScheduler(max_in_flight=4, max_queue=10, queue_timeout=1)
+
+    with llm_priority(LLMPriority.MINIGAME):
+        async with scheduler.slot():
+            pass
+    async with scheduler.slot():
+        pass
+
+    classes = scheduler.stats()["classes"]
+    assert classes["minigame"]["admitted"] == 1
+    assert classes["default"]["admitted"] == 1
@@ -0,0 +1,33 @@
+import pytest
+
+from utils import load_prompt as load_prompt_module
+from utils.load_prompt import PROMPT_REGISTRY, load_chat_prompt, load_prompt
+
+
+def test_registry_preloads_every_domain_prompt():
+    assert ("play", "instruction.md") in PROMPT_REGISTRY
+    assert ("play", "riddle_system_prompt.md") in PROMPT_REGISTRY
+
+
+def test_prompts_are_served_without_disk_io(monkeypatch):
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("요청 경로에서 프롬프트 파일을 다시 읽으면 안 됩니다.")
+
+    monkeypatch.setattr("builtins.open", _fail)
+    monkeypatch.setattr(load_prompt_module.Path, "read_text", _fail)
+
+    assert load_prompt("play", "instruction.md")
+    assert load_chat_prompt("play", "instruction.md", "시나리오: {story}")
+
+
+def test_chat_prompt_is_compiled_once_per_template():
+    first = load_chat_prompt("play", "riddle_system_prompt.md")
+
+    assert load_chat_prompt("play", "riddle_system_prompt.md") is first
+    assert load_chat_prompt("play", "riddle_system_prompt.md", "{story}") is not first
+    assert first.input_variables == ["input"]
+
+
+def test_load_prompt_raises_for_unknown_prompt():
+    with pytest.raises(FileNotFoundError):
+        load_prompt("play", "does_not_exist.md")
@@ -0,0 +1,25 @@
+import pytest
+
+from utils import load_sql as load_sql_module
+from utils.load_sql import SQL_REGISTRY, load_sql
+
+
+def test_registry_preloads_every_domain_query():
+    assert ("info", "get_items") in SQL_REGISTRY
+    assert ("scenario", "add_item") in SQL_REGISTRY
+    assert ("session", "get_sessions") in SQL_REGISTRY
+
+
+def test_load_sql_reads_from_registry_without_disk_io(monkeypatch):
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("요청 경로에서 파일을 다시 읽으면 안 됩니다.")
+
+    monkeypatch.setattr("builtins.open", _fail)
+    monkeypatch.setattr(load_sql_module.Path, "read_text", _fail)
+
+    assert "FROM items" in load_sql("info", "get_items")
+
+
+def test_load_sql_raises_for_unknown_query():
+    with pytest.raises(FileNotFoundError):
+        load_sql("info", "does_not_exist")
@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+
+from domains.info.dtos.world_dtos import WorldInfoKey
+from domains.info.item_service import ItemService
+from domains.info.world_service import WorldService
+from utils.master_data_cache import MasterDataCache, master_data_cache
+
+
+class CountingCursor:
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, query, params=None):
+        self.executed.append(query)
+
+    async def fetchone(self):
+        return {"count": 1}
+
+    async def fetchall(self):
+        return [{"item_id": 1, "name": "회복 물약"}]
+
+
+@pytest.fixture(autouse=True)
+def fresh_master_data_cache():
+    master_data_cache.invalidate()
+    yield
+    master_data_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_hits_and_misses_per_key():
+    cache = MasterDataCache()
+    calls = []
+
+    async def _load():
+        calls.append(1)
+        return ["row"]
+
+    assert await cache.get_or_load("k", _load) == ["row"]
+    assert await cache.get_or_load("k", _load) == ["row"]
+
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_store_value_loaded_across_invalidation():
+    cache = MasterDataCache()
+
+    async def _load_and_invalidate():
+        cache.invalidate()
+        return "stale"
+
+    await cache.get_or_load("k", _load_and_invalidate)
+
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = MasterDataCache()
+    calls = []
+    release = asyncio.Event()
+
+    async def _load():
+        calls.append(1)
+        await release.wait()
+        return ["row"]
+
+    waiters = [asyncio.create_task(cache.get_or_load("k", _load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [["row"]] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_retry_when_loading_request_is_cancelled():
+    cache = MasterDataCache()
+    started = asyncio.Event()
+
+    async def _slow_load():
+        started.set()
+        await asyncio.Event().wait()
+
+    async def _fast_load():
+        return ["row"]
+
+    owner = asyncio.create_task(cache.get_or_load("k", _slow_load))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_load("k", _fast_load))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await waiter == ["row"]
+
+
+@pytest.mark.asyncio
+async def test_requests_after_invalidation_do_not_join_stale_load():
+    cache = MasterDataCache()
+    release = asyncio.Event()
+
+    async def _stale_load():
+        await release.wait()
+        return ["old"]
+
+    async def _fresh_load():
+        return ["new"]
+
+    stale = asyncio.create_task(cache.get_or_load("k", _stale_load))
+    await asyncio.sleep(0)
+    cache.invalidate()
+
+    assert await cache.get_or_load("k", _fresh_load) == ["new"]
+    release.set()
+    assert await stale == ["old"]
+    assert cache.get("k") == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_item_service_serves_repeated_reads_from_memory():
+    cursor = CountingCursor()
+    service = ItemService(cursor)
+
+    first_items, _ = await service.get_items([1], 0, 10)
+    second_items, _ = await ItemService(cursor).get_items([1], 0, 10)
+
+    assert first_items == second_items
+    assert len(cursor.executed) == 1
+
+    master_data_cache.invalidate()
+    await service.get_items([1], 0, 10)
+    assert len(cursor.executed) == 2
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    cache = MasterDataCache()
+    now = [100.0]
+    monkeypatch.setattr("utils.master_data_cache.time.monotonic", lambda: now[0])
+
+    cache.set("k", "v", ttl=10)
+    assert cache.get("k") == "v"
+
+    now[0] += 11
+    assert cache.get("k") is None
+
+
+def test_cache_evicts_least_recently_used_beyond_maxsize():
+    cache = MasterDataCache(maxsize=2)
+
+    cache.set(("items", 0, 10), "a")
+    cache.set(("items", 10, 10), "b")
+    assert cache.get(("items", 0, 10)) == "a"
+    cache.set(("items", 20, 10), "c")
+
+    assert cache.get(("items", 10, 10)) is None
+    assert cache.get(("items", 0, 10)) == "a"
+    assert cache.get(("items", 20, 10)) == "c"
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
+
+
+class WorldCursor(CountingCursor):
+    async def fetchone(self):
+        return {
+            "configs": [],
+            "eras": [],
+            "locales": [{"locale_id": 1, "name": "숲"}],
+            "characters": [],
+            "abilities": [],
+        }
+
+
+@pytest.mark.asyncio
+async def test_world_service_fetches_missing_keys_in_one_query_and_caches_them():
+    cursor = WorldCursor()
+
+    locales_only = await WorldService(cursor).get_world([WorldInfoKey.LOCALES])
+    assert locales_only["locales"] == [{"locale_id": 1, "name": "숲"}]
+    assert locales_only["configs"] is None
+    assert len(cursor.executed) == 1
+
+    await WorldService(cursor).get_world([WorldInfoKey.LOCALES])
+    assert len(cursor.executed) == 1
+
+    everything = await WorldService(cursor).get_world()
+    assert everything["abilities"] == []
+    assert len(cursor.executed) == 2
+
+
+class LocaleCursor(CountingCursor):
+    async def fetchone(self):
+        return {"locale_id": 7, "name": "동굴"}
+
+
+@pytest.mark.asyncio
+async def test_get_locale_uses_index_warmed_by_get_world():
+    cursor = WorldCursor()
+    await WorldService(cursor).get_world([WorldInfoKey.LOCALES])
+
+    locale = await WorldService(cursor).get_locale(1)
+
+    assert locale == {"locale_id": 1, "name": "숲"}
+    assert len(cursor.executed) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_locale_falls_back_to_keyed_query_and_indexes_result():
+    cursor = LocaleCursor()
+
+    assert (await WorldService(cursor).get_locale(7))["name"] == "동굴"
+    assert (await WorldService(cursor).get_locale(7))["name"] == "동굴"
+
+    assert len(cursor.executed) == 1
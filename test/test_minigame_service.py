@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from configs.llm_adapter import NarrativeChatModel
+from domains.play import minigame_service
+from domains.play.minigame_service import MinigameService
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def setex(self, key, _ttl, value):
+        self.store[key] = value
+
+
+def _frame(delta: str) -> bytes:
+    payload = {"choices": [{"index": 0, "delta": {"content": delta}}]}
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode()
+
+
+def _service(monkeypatch, handler) -> MinigameService:
+    monkeypatch.setattr(minigame_service, "get_redis_client", FakeRedis)
+    service = MinigameService(cursor=None)
+    service.examiner = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_answer_is_saved_even_if_client_disconnects_mid_stream(monkeypatch):
+    rest_of_json = asyncio.Event()
+
+    async def _body():
+        yield _frame('{"riddle": "밤에만')
+        await rest_of_json.wait()
+        yield _frame(' 뜨는 것은?", "answer": "달", "hint": "하늘", ')
+        yield _frame('"explanation": "밤하늘에 뜸"}')
+        yield b"data: [DONE]\n\n"
+
+    service = _service(monkeypatch, lambda _: httpx.Response(200, content=_body()))
+
+    stream = await service._stream_problem("수수께끼를 내줘", "riddle:answer:1")
+    assert await anext(stream) == "밤에만"
+    # 클라이언트가 첫 조각만 받고 연결을 끊음
+    await stream.aclose()
+    rest_of_json.set()
+    await asyncio.gather(*minigame_service._problem_tasks)
+
+    saved = json.loads(service.redis.store["riddle:answer:1"])
+    assert saved["answer"] == "달"
+    assert saved["fail_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_generation_failure_surfaces_before_streaming_starts(monkeypatch):
+    service = _service(monkeypatch, lambda _: httpx.Response(400))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await service._stream_problem("수수께끼를 내줘", "riddle:answer:1")
+
+    assert service.redis.store == {}
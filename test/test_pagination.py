@@ -0,0 +1,132 @@
+import pytest
+from fastapi import HTTPException
+
+from common.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    split_full_count,
+)
+from domains.info.item_service import ItemService
+from utils.master_data_cache import master_data_cache
+
+
+class PagingCursor:
+    def __init__(self, rows, count=0):
+        self.rows = rows
+        self.count = count
+        self.executed = []
+
+    async def execute(self, query, params=None):
+        self.executed.append(query)
+
+    async def fetchone(self):
+        return {"count": self.count}
+
+    async def fetchall(self):
+        return [dict(row) for row in self.rows]
+
+
+@pytest.fixture(autouse=True)
+def fresh_master_data_cache():
+    master_data_cache.invalidate()
+    yield
+    master_data_cache.invalidate()
+
+
+def test_split_full_count_strips_window_column():
+    rows, total = split_full_count([{"item_id": 1, "full_count": 12}])
+
+    assert rows == [{"item_id": 1}]
+    assert total == 12
+    assert split_full_count([]) == ([], None)
+
+
+@pytest.mark.asyncio
+async def test_get_items_with_count_uses_single_windowed_query():
+    service = ItemService(PagingCursor([{"item_id": 1, "full_count": 25}]))
+
+    items, meta = await service.get_items(None, 0, 10)
+
+    assert items == [{"item_id": 1}]
+    assert meta.total_count == 25
+    assert meta.total_pages == 3
+    assert service.cursor.executed == [service.get_items_with_count_sql]
+
+
+@pytest.mark.asyncio
+async def test_get_items_without_count_skips_count_and_meta():
+    service = ItemService(PagingCursor([{"item_id": 1}]))
+
+    items, meta = await service.get_items([1], 0, 10, with_count=False)
+
+    assert items == [{"item_id": 1}]
+    assert meta is None
+    assert service.cursor.executed == [service.get_items_sql]
+
+
+@pytest.mark.asyncio
+async def test_get_items_out_of_range_page_falls_back_to_count_query():
+    service = ItemService(PagingCursor([], count=25))
+
+    items, meta = await service.get_items(None, 40, 10)
+
+    assert items == []
+    assert meta.total_count == 25
+    assert meta.is_last_page is True
+    assert service.cursor.executed == [
+        service.get_items_with_count_sql,
+        service.count_items_sql,
+    ]
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor(42)) == 42
+    assert decode_cursor(encode_cursor("sess-007"), str) == "sess-007"
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("!!not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "last_id, id_type",
+    [("42", int), ({"id": 1}, int), (True, int), (None, int), (42, str)],
+)
+def test_cursor_with_wrong_id_type_is_rejected_as_bad_request(last_id, id_type):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(encode_cursor(last_id), id_type)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_items_cursor_mode_reads_one_extra_row_without_count():
+    cursor = PagingCursor([{"item_id": 11}, {"item_id": 12}, {"item_id": 13}])
+    service = ItemService(cursor)
+
+    params_seen = []
+    original_execute = cursor.execute
+
+    async def _execute(query, params=None):
+        params_seen.append(params)
+        await original_execute(query, params)
+
+    cursor.execute = _execute
+
+    items, meta = await service.get_items(None, 0, 2, page_cursor=encode_cursor(10))
+
+    assert items == [{"item_id": 11}, {"item_id": 12}]
+    assert meta.is_last_page is False
+    assert meta.total_count is None
+    assert decode_cursor(meta.next_cursor) == 12
+    assert params_seen[0]["after_id"] == 10
+    assert params_seen[0]["limit"] == 3
+    assert cursor.executed == [service.get_items_sql]
+
+
+@pytest.mark.asyncio
+async def test_offset_mode_meta_offers_cursor_for_next_page():
+    service = ItemService(PagingCursor([{"item_id": 5, "full_count": 25}]))
+
+    _, meta = await service.get_items(None, 0, 10)
+
+    assert decode_cursor(meta.next_cursor) == 5
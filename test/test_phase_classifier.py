@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from domains.gm.gm_service import GmService
+from domains.info.enemy_service import EnemyService
+from domains.info.item_service import ItemService
+from domains.info.world_service import WorldService
+from domains.play.dtos.play_dtos import (
+    EntityType,
+    EntityUnit,
+    PhaseType,
+    PlaySceneRequest,
+    PlaySessionState,
+    SceneAnalysis,
+)
+from domains.play.utils import nodes
+from domains.play.utils.phase_classifier import PhaseClassifier, get_phase_classifier
+
+
+def _state(story: str, llm) -> PlaySessionState:
+    cursor = MagicMock()
+    request = PlaySceneRequest(
+        session_id="s1",
+        scenario_id="sc1",
+        locale_id=0,
+        entities=[
+            EntityUnit(
+                state_entity_id="player-1",
+                phase_id=1,
+                entity_name="player",
+                entity_type=EntityType.PLAYER,
+            )
+        ],
+        relations=[],
+        story=story,
+    )
+    return PlaySessionState(
+        request=request,
+        logs=[],
+        item_service=ItemService(cursor=cursor),
+        enemy_service=EnemyService(cursor=cursor),
+        gm_service=GmService(cursor=cursor),
+        world_service=WorldService(cursor=cursor),
+        llm=llm,
+    )
+
+
+def _llm_returning(analysis: SceneAnalysis, calls: list):
+    async def _invoke(_prompt):
+        calls.append(1)
+        return analysis
+
+    return MagicMock(with_structured_output=lambda _schema: RunnableLambda(_invoke))
+
+
+@pytest.mark.parametrize(
+    "story, expected",
+    [
+        ("고블린이 녹슨 칼을 휘두르며 달려든다.", PhaseType.COMBAT),
+        ('"이 검 값을 조금만 깎아주시겠소?"', PhaseType.NEGO),
+        ("상처에 붕대를 감고 회복 물약을 마신다.", PhaseType.RECOVERY),
+    ],
+)
+def test_shipped_classifier_labels_clear_scenes(story, expected):
+    phase_type, confidence = get_phase_classifier().predict(story)
+
+    assert phase_type == expected
+    assert 0.0 < confidence <= 1.0
+
+
+def test_trained_classifier_round_trips_through_json(tmp_path):
+    samples = [
+        ("검을 휘두르며 공격한다", PhaseType.COMBAT),
+        ("적이 칼로 공격한다", PhaseType.COMBAT),
+        ("모닥불 옆에서 잠을 잔다", PhaseType.REST),
+        ("침낭에서 잠을 청한다", PhaseType.REST),
+    ]
+    classifier = PhaseClassifier.train(samples, epochs=30)
+    path = tmp_path / "weights.json"
+    classifier.save(str(path))
+
+    loaded = PhaseClassifier.load(str(path))
+
+    assert loaded.predict("칼로 공격한다")[0] == PhaseType.COMBAT
+    assert loaded.predict("잠을 잔다")[0] == PhaseType.REST
+
+
+@pytest.mark.asyncio
+async def test_confident_local_prediction_skips_llm(monkeypatch):
+    monkeypatch.setattr(nodes, "PHASE_CLASSIFIER_THRESHOLD", 0.0)
+    calls = []
+    llm = _llm_returning(
+        SceneAnalysis(phase_type=PhaseType.UNKNOWN, reason="LLM", confidence=0.5), calls
+    )
+
+    result = await nodes.analyze_scene_node(
+        _state("고블린이 녹슨 칼을 휘두르며 달려든다.", llm)
+    )
+
+    assert calls == []
+    assert result["analysis"].phase_type == PhaseType.COMBAT
+    assert result["analysis"].reason == "로컬 장면 분류기 판정"
+
+
+@pytest.mark.asyncio
+async def test_low_confidence_falls_back_to_llm(monkeypatch):
+    monkeypatch.setattr(nodes, "PHASE_CLASSIFIER_THRESHOLD", 1.1)
+    calls = []
+    llm_analysis = SceneAnalysis(
+        phase_type=PhaseType.DIALOGUE, reason="LLM 판정", confidence=0.8
+    )
+
+    result = await nodes.analyze_scene_node(
+        _state(
+            "고블린이 녹슨 칼을 휘두르며 달려든다.", _llm_returning(llm_analysis, calls)
+        )
+    )
+
+    assert calls == [1]
+    assert result["analysis"] == llm_analysis
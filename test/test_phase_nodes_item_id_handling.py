@@ -23,7 +23,7 @@ class StubItemService(ItemService):
     def __init__(self):
         super().__init__(cursor=None)
 
-    async def get_items(self, item_ids, skip, limit):
+    async def get_items(self, item_ids, skip, limit, with_count=True):
         raise AssertionError("string item_id fallback path should not query DB items")
 
 
@@ -31,7 +31,7 @@ class StubEnemyService(EnemyService):
     def __init__(self):
         super().__init__(cursor=None)
 
-    async def get_enemies(self, enemy_ids, skip, limit):
+    async def get_enemies(self, enemy_ids, skip, limit, with_count=True):
         return [{"enemy_id": 9001, "base_difficulty": 6}], None
 
 
@@ -0,0 +1,360 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from langchain_core.runnables import RunnableLambda
+
+from configs.llm_adapter import NarrativeChatModel
+from domains.gm.gm_service import GmService
+from domains.info.world_service import WorldService
+from domains.play import play_service as play_service_module
+from domains.play.dtos.play_dtos import (
+    EntityType,
+    EntityUnit,
+    PhaseType,
+    PlaySceneRequest,
+    SceneAnalysis,
+)
+from domains.play.dtos.player_dtos import FullPlayerState, PlayerStateResponse
+from domains.play.play_service import PlayService
+from domains.play.utils import nodes
+from domains.play.utils.scene_analysis_cache import scene_analysis_cache
+from domains.play.utils.similar_scene_index import similar_scene_index
+
+
+class StubGmService(GmService):
+    def __init__(self):
+        super().__init__(cursor=None)
+
+    async def rolling_dice(self, *_args, **_kwargs):
+        return SimpleNamespace(
+            message="테스트",
+            is_critical_success=False,
+            roll_result=8,
+            ability_score=2,
+            total=10,
+            is_success=True,
+        )
+
+
+class StubWorldService(WorldService):
+    def __init__(self):
+        super().__init__(cursor=None)
+
+    async def get_locale(self, locale_id):
+        return {"locale_id": locale_id, "name": "숲", "description": "조용한 숲"}
+
+
+def _rest_request() -> PlaySceneRequest:
+    return PlaySceneRequest(
+        session_id="sess-1",
+        scenario_id="scn-1",
+        locale_id=1,
+        sequence_type="REST",
+        entities=[
+            EntityUnit(
+                state_entity_id="player-1",
+                phase_id=1,
+                entity_name="플레이어",
+                entity_type=EntityType.PLAYER,
+            )
+        ],
+        relations=[],
+        story="모닥불 옆에서 잠시 쉬어간다.",
+    )
+
+
+def _build_service() -> PlayService:
+    service = PlayService(cursor=None)
+    service.gm_service = StubGmService()
+    service.world_service = StubWorldService()
+    return service
+
+
+@pytest.fixture(autouse=True)
+def fresh_scene_analysis_cache():
+    # 다른 테스트가 남긴 LLM 분석 캐시 때문에 LLM 경로를 건너뛰지 않도록 비움
+    scene_analysis_cache.clear()
+    similar_scene_index.clear()
+    yield
+    scene_analysis_cache.clear()
+    similar_scene_index.clear()
+
+
+@pytest.fixture
+def stub_player_proxy(monkeypatch):
+    async def _fake_player_state(player_id: str) -> FullPlayerState:
+        return FullPlayerState(
+            player=PlayerStateResponse(hp=10, gold=0, items=[]),
+            player_npc_relations=[],
+        )
+
+    monkeypatch.setattr(nodes, "get_player_state_from_proxy", _fake_player_state)
+
+
+def test_play_services_share_process_wide_graph():
+    first = PlayService(cursor=None)
+    second = PlayService(cursor=None)
+
+    assert first.graph is second.graph
+    assert first.graph is play_service_module.play_graph
+
+
+@pytest.mark.asyncio
+async def test_play_scene_injects_request_services_into_shared_graph(stub_player_proxy):
+    response = await _build_service().play_scene(_rest_request())
+
+    assert response.phase_type == PhaseType.REST
+    assert response.success is True
+    assert response.suggested.diffs[0].state_entity_id == "player-1"
+    assert response.suggested.diffs[0].diff["hp"] == 2 + 10 // 2
+
+
+@pytest.mark.asyncio
+async def test_hinted_scene_bypasses_graph_with_same_result(
+    stub_player_proxy, monkeypatch
+):
+    class FailingGraph:
+        async def ainvoke(self, _state):
+            raise AssertionError(
+                "sequence_type 힌트가 있으면 그래프를 거치지 않아야 합니다."
+            )
+
+    direct_service = _build_service()
+    direct_service.graph = FailingGraph()
+    direct = await direct_service.play_scene(_rest_request())
+
+    # 힌트 판별을 끄면 같은 요청이 그래프 경로로 처리됨
+    monkeypatch.setattr(
+        play_service_module, "_phase_from_sequence_type", lambda _: None
+    )
+    via_graph = await _build_service().play_scene(_rest_request())
+
+    assert direct.model_dump() == via_graph.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_play_scene_reports_node_timings_only_when_requested(stub_player_proxy):
+    plain = await _build_service().play_scene(_rest_request())
+    assert plain.timings is None
+
+    timed_response = await _build_service().play_scene(
+        _rest_request(), with_timings=True
+    )
+
+    assert "total" in timed_response.timings
+    assert "node.categorize_entities" in timed_response.timings
+    assert "node.rest" in timed_response.timings
+    assert all(value >= 0 for value in timed_response.timings.values())
+
+
+@pytest.mark.asyncio
+async def test_context_nodes_run_concurrently_and_merge_logs(monkeypatch):
+    # 세 노드가 모두 도착해야 풀리는 배리어: 순차 실행이면 타임아웃으로 실패
+    barrier = asyncio.Barrier(3)
+
+    async def _fake_player_state(player_id: str) -> FullPlayerState:
+        await barrier.wait()
+        return FullPlayerState(
+            player=PlayerStateResponse(hp=10, gold=0, items=[]),
+            player_npc_relations=[],
+        )
+
+    async def _fake_analysis(_prompt):
+        await barrier.wait()
+        return SceneAnalysis(
+            phase_type=PhaseType.REST, reason="휴식 장면", confidence=0.9
+        )
+
+    class BarrierWorldService(StubWorldService):
+        async def get_locale(self, locale_id):
+            await barrier.wait()
+            return await super().get_locale(locale_id)
+
+    monkeypatch.setattr(nodes, "get_player_state_from_proxy", _fake_player_state)
+    # 로컬 분류기를 끄고 LLM 분석 노드가 병렬로 실행되는지 확인
+    monkeypatch.setattr(nodes, "PHASE_CLASSIFIER_THRESHOLD", 1.1)
+    service = _build_service()
+    service.world_service = BarrierWorldService()
+    service.llm_manager = SimpleNamespace(
+        with_structured_output=lambda _schema: RunnableLambda(_fake_analysis)
+    )
+    request = _rest_request().model_copy(update={"sequence_type": None})
+
+    response = await asyncio.wait_for(service.play_scene(request), timeout=5)
+
+    assert response.phase_type == PhaseType.REST
+    assert [log for log in response.logs if log.startswith("분석된 플레이 유형")] == [
+        "분석된 플레이 유형: PhaseType.REST"
+    ]
+    assert len(response.logs) == len(set(response.logs))
+
+
+@pytest.mark.asyncio
+async def test_scene_routes_on_phase_type_before_rest_of_analysis(
+    monkeypatch, stub_player_proxy
+):
+    # 페이즈 노드(주사위)가 실행되어야 분석 JSON의 나머지가 전송됨: 전체 JSON을 기다리면 교착
+    rest_of_json = asyncio.Event()
+
+    class ReleasingGmService(StubGmService):
+        async def rolling_dice(self, *args, **kwargs):
+            rest_of_json.set()
+            return await super().rolling_dice(*args, **kwargs)
+
+    def _frame(delta: str) -> bytes:
+        payload = {"choices": [{"index": 0, "delta": {"content": delta}}]}
+        return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode()
+
+    async def _body():
+        yield _frame('{"phase_type": "휴식", "reason": "모닥')
+        await rest_of_json.wait()
+        yield _frame('불 옆 휴식", "confidence": 0.8}')
+        yield b"data: [DONE]\n\n"
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_body())
+
+    monkeypatch.setattr(nodes, "PHASE_CLASSIFIER_THRESHOLD", 1.1)
+    monkeypatch.setattr(nodes, "SCENE_ANALYSIS_EARLY_ROUTE", "backfill")
+    service = _build_service()
+    service.gm_service = ReleasingGmService()
+    service.llm_manager = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        temperature=0.0,
+    )
+    request = _rest_request().model_copy(update={"sequence_type": None})
+
+    response = await asyncio.wait_for(service.play_scene(request), timeout=5)
+
+    assert response.phase_type == PhaseType.REST
+    assert response.reason == "모닥불 옆 휴식"
+    assert "분석 확신도: 0.8" in response.logs
+    assert f"사유: {nodes.EARLY_ROUTE_REASON}" not in response.logs
+    assert "분석 확신도: 0.0" not in response.logs
+    assert response.logs.count("사유: 모닥불 옆 휴식") == 1
+    cached = await scene_analysis_cache.get(
+        scene_analysis_cache.make_key(
+            request.story,
+            nodes.load_prompt("play", nodes.SCENE_ANALYSIS_PROMPT_FILE),
+            nodes.model_tag(service.llm_manager),
+        )
+    )
+    assert cached.reason == "모닥불 옆 휴식"
+
+
+@pytest.mark.asyncio
+async def test_failed_phase_cancels_analysis_backfill(monkeypatch, stub_player_proxy):
+    stream_closed = asyncio.Event()
+
+    class FailingGmService(StubGmService):
+        async def rolling_dice(self, *_args, **_kwargs):
+            raise HTTPException(status_code=500, detail="주사위 실패")
+
+    def _frame(delta: str) -> bytes:
+        payload = {"choices": [{"index": 0, "delta": {"content": delta}}]}
+        return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode()
+
+    async def _body():
+        try:
+            yield _frame('{"phase_type": "휴식", "reason": "모닥')
+            await asyncio.Event().wait()
+        finally:
+            stream_closed.set()
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_body())
+
+    monkeypatch.setattr(nodes, "PHASE_CLASSIFIER_THRESHOLD", 1.1)
+    monkeypatch.setattr(nodes, "SCENE_ANALYSIS_EARLY_ROUTE", "backfill")
+    service = _build_service()
+    service.gm_service = FailingGmService()
+    service.llm_manager = NarrativeChatModel(
+        base_url="http://gateway",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        temperature=0.0,
+    )
+    request = _rest_request().model_copy(update={"sequence_type": None})
+
+    with pytest.raises(HTTPException):
+        await asyncio.wait_for(service.play_scene(request), timeout=5)
+
+    # 남은 분석 JSON을 기다리던 스트림이 닫혀야 함
+    await asyncio.wait_for(stream_closed.wait(), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_player_state_and_isolates_failures(monkeypatch):
+    calls = []
+
+    async def _fake_player_state(player_id: str) -> FullPlayerState:
+        calls.append(player_id)
+        await asyncio.sleep(0)
+        if player_id == "missing":
+            raise HTTPException(
+                status_code=404, detail="플레이어 정보를 찾을 수 없습니다."
+            )
+        return FullPlayerState(
+            player=PlayerStateResponse(hp=10, gold=0, items=[]),
+            player_npc_relations=[],
+        )
+
+    monkeypatch.setattr(nodes, "get_player_state_from_proxy", _fake_player_state)
+
+    missing_player = _rest_request().model_copy(deep=True)
+    missing_player.entities[0].state_entity_id = "missing"
+    scenes = [_rest_request(), missing_player, _rest_request(), _rest_request()]
+
+    result = await _build_service().play_scenes(scenes, max_concurrency=2)
+
+    assert [item.index for item in result.results] == [0, 1, 2, 3]
+    assert (result.succeeded, result.failed) == (3, 1)
+    assert result.results[1].status_code == 404
+    assert result.results[1].data is None
+    assert all(result.results[i].data.phase_type == PhaseType.REST for i in (0, 2, 3))
+    assert sorted(calls) == ["missing", "player-1"]
+
+
+def _parse_sse(frames):
+    events = []
+    for frame in frames:
+        name_line, data_line = frame.strip().split("\n")
+        events.append(
+            (
+                name_line.removeprefix("event: "),
+                json.loads(data_line.removeprefix("data: ")),
+            )
+        )
+    return events
+
+
+@pytest.mark.asyncio
+async def test_stream_scene_emits_events_before_final_response(stub_player_proxy):
+    service = PlayService(cursor=None)
+    service.world_service = StubWorldService()
+
+    frames = [frame async for frame in service.stream_scene(_rest_request())]
+    events = _parse_sse(frames)
+
+    assert [name for name, _ in events] == ["analysis", "dice", "diffs", "final"]
+    assert events[0][1]["phase_type"] == PhaseType.REST.value
+    assert events[-1][1]["phase_type"] == PhaseType.REST.value
+    assert events[2][1]["suggested"] == events[-1][1]["suggested"]
+
+
+@pytest.mark.asyncio
+async def test_stream_scene_ends_with_error_event(monkeypatch):
+    async def _missing_player(player_id: str) -> FullPlayerState:
+        raise HTTPException(status_code=404, detail="플레이어 정보를 찾을 수 없습니다.")
+
+    monkeypatch.setattr(nodes, "get_player_state_from_proxy", _missing_player)
+
+    frames = [frame async for frame in _build_service().stream_scene(_rest_request())]
+    events = _parse_sse(frames)
+
+    assert [name for name, _ in events] == ["analysis", "error"]
+    assert events[-1][1]["status_code"] == 404
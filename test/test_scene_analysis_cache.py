@@ -0,0 +1,152 @@
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from domains.gm.gm_service import GmService
+from domains.info.enemy_service import EnemyService
+from domains.info.item_service import ItemService
+from domains.info.world_service import WorldService
+from domains.play.dtos.play_dtos import (
+    PhaseType,
+    PlaySceneRequest,
+    PlaySessionState,
+    SceneAnalysis,
+)
+from domains.play.utils import nodes
+from domains.play.utils.scene_analysis_cache import (
+    SceneAnalysisCache,
+    scene_analysis_cache,
+)
+from domains.play.utils.similar_scene_index import similar_scene_index
+
+ANALYSIS = SceneAnalysis(phase_type=PhaseType.DIALOGUE, reason="대화", confidence=0.9)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def set(self, key, value, ex=None):
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture(autouse=True)
+def fresh_scene_analysis_cache(monkeypatch):
+    scene_analysis_cache.clear()
+    similar_scene_index.clear()
+    monkeypatch.setattr(scene_analysis_cache, "redis", None)
+    yield
+    scene_analysis_cache.clear()
+    similar_scene_index.clear()
+
+
+def test_key_ignores_whitespace_but_not_prompt_or_model():
+    key = SceneAnalysisCache.make_key(
+        "  촌장에게  말을\n건다. ", "prompt-v1", "gateway"
+    )
+
+    assert key == SceneAnalysisCache.make_key(
+        "촌장에게 말을 건다.", "prompt-v1", "gateway"
+    )
+    assert key != SceneAnalysisCache.make_key(
+        "촌장에게 말을 건다.", "prompt-v2", "gateway"
+    )
+    assert key != SceneAnalysisCache.make_key(
+        "촌장에게 말을 건다.", "prompt-v1", "openai"
+    )
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_entry():
+    cache = SceneAnalysisCache(maxsize=2)
+    await cache.set("a", ANALYSIS)
+    await cache.set("b", ANALYSIS)
+    await cache.get("a")
+    await cache.set("c", ANALYSIS)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == ANALYSIS
+    assert await cache.get("c") == ANALYSIS
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_survives_process_local_clear():
+    cache = SceneAnalysisCache(ttl=60)
+    cache.redis = FakeRedis()
+    await cache.set("k", ANALYSIS)
+    cache.clear()
+
+    assert await cache.get("k") == ANALYSIS
+    assert cache.redis.ttls[cache.REDIS_PREFIX + "k"] == 60
+    assert cache.stats()["l2_hits"] == 1
+
+    # Redis에서 읽은 값은 프로세스 내 LRU에도 채워짐
+    assert await cache.get("k") == ANALYSIS
+    assert cache.stats()["l1_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_treated_as_misses():
+    cache = SceneAnalysisCache()
+    cache.redis = BrokenRedis()
+    await cache.set("k", ANALYSIS)
+    cache.clear()
+
+    assert await cache.get("k") is None
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_analyze_scene_node_reuses_llm_analysis_for_whitespace_variants(
+    monkeypatch,
+):
+    monkeypatch.setattr(nodes, "PHASE_CLASSIFIER_THRESHOLD", 1.1)
+    calls = []
+
+    async def _invoke(_prompt):
+        calls.append(1)
+        return ANALYSIS
+
+    llm = MagicMock(with_structured_output=lambda _schema: RunnableLambda(_invoke))
+
+    def _state(story: str) -> PlaySessionState:
+        cursor = MagicMock()
+        return PlaySessionState(
+            request=PlaySceneRequest(
+                session_id="s1",
+                scenario_id="sc1",
+                locale_id=0,
+                entities=[],
+                relations=[],
+                story=story,
+            ),
+            item_service=ItemService(cursor=cursor),
+            enemy_service=EnemyService(cursor=cursor),
+            gm_service=GmService(cursor=cursor),
+            world_service=WorldService(cursor=cursor),
+            llm=llm,
+        )
+
+    before = scene_analysis_cache.stats()
+    first = await nodes.analyze_scene_node(_state("촌장에게 말을 건다."))
+    second = await nodes.analyze_scene_node(_state("  촌장에게   말을 건다. "))
+
+    assert calls == [1]
+    assert first["analysis"] == second["analysis"] == ANALYSIS
+    after = scene_analysis_cache.stats()
+    assert after["l1_hits"] - before["l1_hits"] == 1
+    assert after["misses"] - before["misses"] == 1
@@ -0,0 +1,176 @@
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from domains.gm.gm_service import GmService
+from domains.info.enemy_service import EnemyService
+from domains.info.item_service import ItemService
+from domains.info.world_service import WorldService
+from domains.play.dtos.play_dtos import (
+    PhaseType,
+    PlaySceneRequest,
+    PlaySessionState,
+    SceneAnalysis,
+)
+from domains.play.utils import nodes
+from domains.play.utils.scene_analysis_cache import scene_analysis_cache
+from domains.play.utils.similar_scene_index import (
+    SimilarSceneIndex,
+    context_key,
+    minhash,
+    similar_scene_index,
+    similarity,
+)
+
+ANALYSIS = SceneAnalysis(phase_type=PhaseType.NEGO, reason="흥정", confidence=0.9)
+STORY = "대장장이 브론에게 다가가 낡은 장검의 수리 비용을 조금만 깎아 달라고 흥정한다. 브론은 팔짱을 끼고 고개를 젓는다."
+RENAMED = "대장장이 그림에게 다가가 낡은 장검의 수리 비용을 조금만 깎아 달라고 흥정한다. 그림은 팔짱을 끼고 고개를 젓는다."
+DIFFERENT = "고블린 무리가 녹슨 단검을 휘두르며 야영지로 달려들자 검을 뽑아 맞선다."
+CONTEXT = context_key("prompt-v1", "gateway")
+# 긴 배경 묘사는 같고 행동 문장만 다른 장면: 문자 3-gram 대부분을 공유하지만 페이즈가 다름
+SETTING = (
+    "해가 지고 어두운 동굴 입구에 도착한 일행은 축축한 바위 틈에서 바람 소리를 듣는다. "
+    "멀리서 늑대 울음이 들리고, 횃불은 거의 꺼져 간다. "
+)
+REST_ACTION = SETTING + "아렌은 모닥불 옆에 앉아 잠시 쉬어간다."
+COMBAT_ACTION = SETTING + "아렌은 모닥불 옆에서 고블린을 공격한다."
+
+
+class FakeRedis:
+    def __init__(self):
+        self.lists = {}
+
+    async def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def ltrim(self, key, start, end):
+        self.lists[key] = self.lists.get(key, [])[start : end + 1]
+
+    async def lrange(self, key, start, end):
+        return self.lists.get(key, [])[start : end + 1]
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes():
+    scene_analysis_cache.clear()
+    similar_scene_index.clear()
+    yield
+    scene_analysis_cache.clear()
+    similar_scene_index.clear()
+
+
+def test_signature_similarity_separates_renamed_and_different_scenes():
+    signature = minhash(STORY)
+
+    assert similarity(signature, minhash(STORY)) == 1.0
+    assert similarity(signature, minhash(RENAMED)) >= 0.65
+    assert similarity(signature, minhash(DIFFERENT)) < 0.3
+
+
+@pytest.mark.asyncio
+async def test_lookup_reuses_analysis_only_within_same_context():
+    index = SimilarSceneIndex(threshold=0.65)
+    await index.add("a", STORY, CONTEXT, ANALYSIS)
+
+    analysis, score = index.lookup(RENAMED, CONTEXT)
+    assert analysis == ANALYSIS
+    assert 0.65 <= score < 1.0
+
+    assert index.lookup(DIFFERENT, CONTEXT) is None
+    assert index.lookup(RENAMED, context_key("prompt-v2", "gateway")) is None
+    assert index.stats()["hits"] == 1
+    assert index.stats()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_same_setting_with_different_action_is_not_reused():
+    rest = SceneAnalysis(phase_type=PhaseType.REST, reason="휴식", confidence=0.9)
+
+    # 기본 설정은 유사 장면 재사용을 끔
+    default_index = SimilarSceneIndex()
+    await default_index.add("rest", REST_ACTION, CONTEXT, rest)
+    assert default_index.lookup(COMBAT_ACTION, CONTEXT) is None
+
+    # 권장 임계값(0.85)에서도 행동만 다른 장면은 재사용하지 않음
+    strict_index = SimilarSceneIndex(threshold=0.85)
+    await strict_index.add("rest", REST_ACTION, CONTEXT, rest)
+    assert strict_index.lookup(COMBAT_ACTION, CONTEXT) is None
+    assert strict_index.lookup(REST_ACTION.replace("아렌", "리아"), CONTEXT) is not None
+
+
+@pytest.mark.asyncio
+async def test_eviction_drops_least_recently_used_entry_and_its_buckets():
+    index = SimilarSceneIndex(maxsize=2, threshold=0.65)
+    await index.add("a", STORY, CONTEXT, ANALYSIS)
+    await index.add("b", DIFFERENT, CONTEXT, ANALYSIS)
+    index.lookup(RENAMED, CONTEXT)
+    await index.add(
+        "c", "여관 방에 들어가 침대에 누워 하룻밤 푹 잔다.", CONTEXT, ANALYSIS
+    )
+
+    assert index.stats()["entries"] == 2
+    assert index.lookup(DIFFERENT, CONTEXT) is None
+    assert index.lookup(RENAMED, CONTEXT) is not None
+    assert all("b" not in ids for ids in index._buckets.values())
+
+
+@pytest.mark.asyncio
+async def test_redis_persistence_restores_index_after_restart():
+    redis = FakeRedis()
+    index = SimilarSceneIndex(maxsize=2, threshold=0.65)
+    index.redis = redis
+    await index.add("a", STORY, CONTEXT, ANALYSIS)
+    await index.add("b", DIFFERENT, CONTEXT, ANALYSIS)
+    await index.add(
+        "c", "여관 방에 들어가 침대에 누워 하룻밤 푹 잔다.", CONTEXT, ANALYSIS
+    )
+    assert len(redis.lists[index.REDIS_KEY]) == 2
+
+    restored = SimilarSceneIndex(maxsize=2, threshold=0.65)
+    restored.redis = redis
+    await restored.load()
+
+    assert restored.stats()["entries"] == 2
+    assert restored.lookup(DIFFERENT, CONTEXT) == (ANALYSIS, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_analyze_scene_node_reuses_analysis_for_renamed_story(monkeypatch):
+    monkeypatch.setattr(nodes, "PHASE_CLASSIFIER_THRESHOLD", 1.1)
+    monkeypatch.setattr(similar_scene_index, "threshold", 0.65)
+    calls = []
+
+    async def _invoke(_prompt):
+        calls.append(1)
+        return ANALYSIS
+
+    llm = MagicMock(with_structured_output=lambda _schema: RunnableLambda(_invoke))
+
+    def _state(story: str) -> PlaySessionState:
+        cursor = MagicMock()
+        return PlaySessionState(
+            request=PlaySceneRequest(
+                session_id="s1",
+                scenario_id="sc1",
+                locale_id=0,
+                entities=[],
+                relations=[],
+                story=story,
+            ),
+            item_service=ItemService(cursor=cursor),
+            enemy_service=EnemyService(cursor=cursor),
+            gm_service=GmService(cursor=cursor),
+            world_service=WorldService(cursor=cursor),
+            llm=llm,
+        )
+
+    first = await nodes.analyze_scene_node(_state(STORY))
+    second = await nodes.analyze_scene_node(_state(RENAMED))
+    third = await nodes.analyze_scene_node(_state(DIFFERENT))
+
+    assert calls == [1, 1]
+    assert first["analysis"] == ANALYSIS
+    assert second["analysis"].phase_type == PhaseType.NEGO
+    assert "유사 장면 분석 재사용" in second["analysis"].reason
+    assert third["analysis"] == ANALYSIS
@@ -0,0 +1,35 @@
+import asyncio
+
+from utils.timing import collect_timings, server_timing_header, timed
+
+
+def test_timed_is_noop_without_collector():
+    with timed("db"):
+        pass
+
+    with collect_timings() as timings:
+        pass
+    assert timings == {}
+
+
+def test_timed_accumulates_same_name_across_tasks():
+    async def _query():
+        with timed("db"):
+            await asyncio.sleep(0)
+
+    async def _main():
+        with collect_timings() as timings:
+            await asyncio.gather(_query(), _query())
+        return timings
+
+    timings = asyncio.run(_main())
+
+    assert list(timings) == ["db"]
+    assert timings["db"] >= 0
+
+
+def test_server_timing_header_format():
+    assert (
+        server_timing_header({"db": 1.5, "node.rest": 0.25})
+        == "db;dur=1.500, node.rest;dur=0.250"
+    )
@@ -0,0 +1,67 @@
+"""
+로컬 장면 분류기 학습 스크립트
+
+실행: python test/train_phase_classifier.py
+- test/bert_train_data/distillation_data.json, test/sample_stories/sample_stories.json으로 학습해
+  src/domains/play/utils/phase_classifier_weights.json을 다시 만듭니다.
+- bert_train_data/train_data.json은 탐험(3) 라벨에 전투·대화·휴식 문장이 섞여 있어 제외합니다.
+  (포함하면 "고블린 무리가 단검을 휘두르며 달려듭니다." 같은 문장을 높은 확신도로 탐험으로 분류함)
+- 학습 데이터를 바꾼 뒤에는 test/bench_phase_classifier.py로 정확도와 임계값을 다시 확인합니다.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+TEST_DIR = Path(__file__).resolve().parent
+sys.path[:0] = [str(TEST_DIR.parent), str(TEST_DIR.parent / "src")]
+
+from domains.play.dtos.play_dtos import PhaseType  # noqa: E402
+from domains.play.utils.phase_classifier import (  # noqa: E402
+    WEIGHTS_PATH,
+    PhaseClassifier,
+)
+
+# bert 브랜치 학습 데이터의 정수 라벨 -> PhaseType
+BERT_LABELS = [
+    PhaseType.COMBAT,
+    PhaseType.DIALOGUE,
+    PhaseType.NEGO,
+    PhaseType.EXPLORATION,
+    PhaseType.RECOVERY,
+    PhaseType.REST,
+    PhaseType.UNKNOWN,
+]
+
+
+def load_training_samples() -> list[tuple[str, PhaseType]]:
+    rows = json.loads(
+        (TEST_DIR / "bert_train_data" / "distillation_data.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    samples = [(row["text"], BERT_LABELS[row["label"]]) for row in rows]
+
+    stories = json.loads(
+        (TEST_DIR / "sample_stories" / "sample_stories.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    samples += [(row["story"], PhaseType(row["phase_type"])) for row in stories]
+    return samples
+
+
+def main():
+    samples = load_training_samples()
+    start = time.perf_counter()
+    classifier = PhaseClassifier.train(samples)
+    classifier.save()
+    print(
+        f"{len(samples)}문장 학습 완료 ({time.perf_counter() - start:.1f}s) | "
+        f"n-gram {len(classifier.weights)}개 -> {WEIGHTS_PATH}"
+    )
+
+
+if __name__ == "__main__":
+    main()